@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""
+Benchmark :func:`pysecret.json_codec.loads` against the old decoding path
+``json.loads(strip_comments(text))``.
+
+Usage::
+
+    python examples/benchmark_json_codec.py
+    python examples/benchmark_json_codec.py --n-keys 4000 --number 50
+
+Install ``orjson`` and / or ``pysimdjson`` to include them in the result.
+"""
+
+import json
+import timeit
+import argparse
+
+from pysecret.js_helper import strip_comments
+from pysecret import json_codec
+
+
+def make_payload(n_keys: int) -> str:
+    """
+    Make a comment free JSON payload, about 125 bytes per key.
+    """
+    data = {
+        f"key_{i}": {
+            "url": f"https://example.com/{i}",
+            "values": list(range(20)),
+        }
+        for i in range(n_keys)
+    }
+    return json.dumps(data)
+
+
+def bench(func, number: int) -> float:
+    """
+    :return: average seconds per call.
+    """
+    return timeit.timeit(func, number=number) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--n-keys", type=int, default=2000)
+    parser.add_argument("--number", type=int, default=20)
+    args = parser.parse_args()
+
+    text = make_payload(args.n_keys)
+    print(f"payload size: {len(text) / 1000:.0f} KB, {args.number} runs each")
+
+    results = [
+        (
+            "json.loads(strip_comments(text))",
+            bench(lambda: json.loads(strip_comments(text)), args.number),
+        )
+    ]
+    for name in json_codec.CodecNameEnum:
+        try:
+            json_codec.get_codec(name.value)
+        except ValueError:  # not installed
+            continue
+        results.append(
+            (
+                f"json_codec.loads, {name.value}",
+                bench(lambda: json_codec.loads(text, codec=name.value), args.number),
+            )
+        )
+
+    baseline = results[0][1]
+    for label, seconds in results:
+        print(f"{label:<36} {seconds * 1000:8.1f} ms  {baseline / seconds:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -39,16 +39,45 @@ except Exception as e:  # pragma: no cover
 
 try:
     from .aws import (
+        DeployActionEnum,
+        DeployResult,
+        ParameterTypeCache,
+        parameter_type_cache,
         Parameter,
+        iter_parameters_by_path,
+        iter_parameter_history,
+        ParameterHistory,
         deploy_parameter,
+        ParameterSpec,
+        deploy_parameters,
         delete_parameter,
+        delete_parameters,
         get_parameter_tags,
         update_parameter_tags,
         put_parameter_tags,
         remove_parameter_tags,
+        ParameterIndex,
+        ParameterWatcher,
+        get_secret_tags,
+        update_secret_tags,
+        put_secret_tags,
+        remove_secret_tags,
         Secret,
+        LazySecret,
+        iter_secrets,
+        SecretVersion,
+        iter_secret_versions,
+        SecretVersionIndex,
         deploy_secret,
+        SecretSpec,
+        deploy_secrets,
         delete_secret,
+        delete_secrets,
+        RateLimiter,
+        default_rate_limiter,
+        SecretCache,
+        Snapshot,
+        KmsEnvelopeCipher,
         kms_symmetric_encrypt,
         kms_symmetric_decrypt,
     )
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio API for AWS Parameter Store, Secret Manager and KMS.
+
+Every function accepts either a regular boto3 client or an async
+`aiobotocore <https://github.com/aio-libs/aiobotocore>`_ client. The API calls
+of a regular boto3 client run in a bounded thread pool executor, so they never
+block the event loop.
+"""
+
+from .client import (
+    is_async_client,
+    get_default_executor,
+    set_default_executor,
+    call_api,
+    gather_with_concurrency,
+)
+from .parameter_store import (
+    load_parameter,
+    load_parameters,
+    deploy_parameter,
+)
+from .secret_manager import (
+    load_secret,
+    load_secrets,
+    deploy_secret,
+)
+from .kms import (
+    kms_symmetric_encrypt,
+    kms_symmetric_decrypt,
+)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+
+"""
+Run boto3 / aiobotocore client API calls in asyncio.
+"""
+
+import typing as T
+import asyncio
+import inspect
+import threading
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+DEFAULT_MAX_WORKERS = 16
+
+_default_executor: T.Optional[Executor] = None
+_default_executor_lock = threading.Lock()
+
+
+def is_async_client(client) -> bool:
+    """
+    Check if the client is an async aiobotocore client.
+    """
+    return inspect.iscoroutinefunction(getattr(client, "_make_api_call", None))
+
+
+def get_default_executor() -> Executor:
+    """
+    Get the internal bounded thread pool executor that runs the regular boto3
+    client API calls. It is created on the first call.
+    """
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS,
+                thread_name_prefix="pysecret-aio",
+            )
+        return _default_executor
+
+
+def set_default_executor(executor: Executor):
+    """
+    Replace the internal executor, for example, to use more threads.
+    """
+    global _default_executor
+    with _default_executor_lock:
+        _default_executor = executor
+
+
+async def call_api(
+    client,
+    method: str,
+    executor: T.Optional[Executor] = None,
+    **kwargs,
+) -> dict:
+    """
+    Call a client API method in asyncio.
+
+    - if the client is an async client, await the API call directly.
+    - otherwise, run the API call in the ``executor``, if it is None, use
+        the internal bounded executor, see :func:`get_default_executor`.
+
+    :param client: the boto3 or aiobotocore client.
+    :param method: the API method name, for example ``"get_parameter"``.
+    :param executor: the executor for the regular boto3 client.
+    :param kwargs: the API arguments.
+    """
+    func = getattr(client, method)
+    if is_async_client(client):
+        return await func(**kwargs)
+    if executor is None:
+        executor = get_default_executor()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(func, **kwargs))
+
+
+async def gather_with_concurrency(
+    limit: int,
+    *aws: T.Awaitable,
+) -> list:
+    """
+    Like :func:`asyncio.gather`, but at most ``limit`` awaitables run at
+    the same time.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: T.Awaitable):
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*[run(aw) for aw in aws])
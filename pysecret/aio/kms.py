@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio version of :mod:`pysecret.aws.kms`.
+"""
+
+import typing as T
+from concurrent.futures import Executor
+
+from ..aws.kms import (
+    is_envelope,
+    _new_aesgcm,
+    _build_envelope_header,
+    _parse_envelope,
+    _envelope_encrypt,
+    _envelope_decrypt,
+)
+from .client import call_api
+
+
+async def kms_symmetric_encrypt(
+    kms_client,
+    blob: bytes,
+    kms_key_id: str,
+    executor: T.Optional[Executor] = None,
+    envelope: bool = False,
+) -> bytes:
+    """
+    asyncio version of :func:`pysecret.aws.kms.kms_symmetric_encrypt`.
+    """
+    if envelope:
+        response = await call_api(
+            kms_client,
+            "generate_data_key",
+            executor=executor,
+            KeyId=kms_key_id,
+            KeySpec="AES_256",
+        )
+        return _envelope_encrypt(
+            _new_aesgcm(response["Plaintext"]),
+            _build_envelope_header(response["CiphertextBlob"]),
+            blob,
+        )
+    response = await call_api(
+        kms_client,
+        "encrypt",
+        executor=executor,
+        Plaintext=blob,
+        KeyId=kms_key_id,
+    )
+    return response["CiphertextBlob"]
+
+
+async def kms_symmetric_decrypt(
+    kms_client,
+    blob: bytes,
+    executor: T.Optional[Executor] = None,
+) -> bytes:
+    """
+    asyncio version of :func:`pysecret.aws.kms.kms_symmetric_decrypt`.
+    """
+    if is_envelope(blob):
+        wrapped_key, header, nonce, ciphertext = _parse_envelope(blob)
+        data_key = await kms_symmetric_decrypt(
+            kms_client,
+            wrapped_key,
+            executor=executor,
+        )
+        return _envelope_decrypt(_new_aesgcm(data_key), header, nonce, ciphertext)
+    response = await call_api(
+        kms_client,
+        "decrypt",
+        executor=executor,
+        CiphertextBlob=blob,
+    )
+    return response["Plaintext"]
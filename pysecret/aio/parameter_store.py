@@ -0,0 +1,304 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio version of :mod:`pysecret.aws.parameter_store`.
+"""
+
+import typing as T
+import asyncio
+from concurrent.futures import Executor
+
+from ..helper import chunks
+from ..aws.tagging import encode_tags, decode_tags, reconcile_tags
+from ..aws.parameter_store import (
+    GET_PARAMETERS_BATCH_SIZE,
+    ParameterTypeCache,
+    parameter_type_cache,
+    Parameter,
+    _build_get_parameter_kwargs,
+    _parse_get_parameter_response,
+    _find_chunked_parameters,
+    _get_chunk_selectors,
+    _join_chunks,
+    _build_put_parameter_kwargs,
+    _set_create_parameter_kwargs,
+)
+from .client import call_api, gather_with_concurrency
+
+
+async def get_parameter_tags(
+    ssm_client,
+    name: str,
+    executor: T.Optional[Executor] = None,
+) -> T.Dict[str, str]:
+    """
+    asyncio version of :func:`pysecret.aws.parameter_store.get_parameter_tags`.
+    """
+    response = await call_api(
+        ssm_client,
+        "list_tags_for_resource",
+        executor=executor,
+        ResourceType="Parameter",
+        ResourceId=name,
+    )
+    return decode_tags(response.get("TagList", []))
+
+
+async def put_parameter_tags(
+    ssm_client,
+    name: str,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    executor: T.Optional[Executor] = None,
+):
+    """
+    asyncio version of :func:`pysecret.aws.parameter_store.put_parameter_tags`.
+    """
+    if tags is None:
+        return
+
+    # reconcile_tags decides the API calls, then they run in order
+    api_calls = list()
+    reconcile_tags(
+        existing_tags=await get_parameter_tags(ssm_client, name, executor=executor),
+        desired_tags=tags,
+        remove_tags=lambda tag_keys: api_calls.append(
+            (
+                "remove_tags_from_resource",
+                dict(ResourceType="Parameter", ResourceId=name, TagKeys=tag_keys),
+            )
+        ),
+        add_tags=lambda tags_: api_calls.append(
+            (
+                "add_tags_to_resource",
+                dict(
+                    ResourceType="Parameter",
+                    ResourceId=name,
+                    Tags=encode_tags(tags_),
+                ),
+            )
+        ),
+    )
+    for method, kwargs in api_calls:
+        await call_api(ssm_client, method, executor=executor, **kwargs)
+
+
+async def _get_parameters(
+    ssm_client,
+    names: T.List[str],
+    with_decryption: bool = True,
+    executor: T.Optional[Executor] = None,
+) -> T.Tuple[T.List[Parameter], T.List[str]]:
+    """
+    Call the ``get_parameters`` API for the names in chunks of 10 (the API
+    limit) concurrently.
+
+    :return: a tuple of two items, the found parameters and the invalid
+        parameter names.
+    """
+    responses = await asyncio.gather(
+        *[
+            call_api(
+                ssm_client,
+                "get_parameters",
+                executor=executor,
+                Names=chunk,
+                WithDecryption=with_decryption,
+            )
+            for chunk in chunks(names, GET_PARAMETERS_BATCH_SIZE)
+        ]
+    )
+    parameters = list()
+    invalid_names = list()
+    for response in responses:
+        for dct in response.get("Parameters", []):
+            parameters.append(Parameter._from_parameter_dict(dct))
+        invalid_names.extend(response.get("InvalidParameters", []))
+    return parameters, invalid_names
+
+
+async def _load_chunks(
+    ssm_client,
+    parameters: T.List[Parameter],
+    executor: T.Optional[Executor] = None,
+):
+    """
+    asyncio version of :func:`pysecret.aws.parameter_store._load_chunks`.
+    """
+    todo = _find_chunked_parameters(parameters)
+    if len(todo) == 0:
+        return
+
+    chunk_parameters, _ = await _get_parameters(
+        ssm_client,
+        _get_chunk_selectors(todo),
+        with_decryption=True,
+        executor=executor,
+    )
+    _join_chunks(todo, chunk_parameters)
+
+
+async def load_parameter(
+    ssm_client,
+    name: str,
+    version: T.Optional[int] = None,
+    label: T.Optional[str] = None,
+    with_decryption: T.Optional[bool] = None,
+    with_tags: bool = False,
+    type_cache: T.Optional[ParameterTypeCache] = None,
+    executor: T.Optional[Executor] = None,
+) -> T.Optional[Parameter]:
+    """
+    asyncio version of :meth:`pysecret.aws.parameter_store.Parameter.load`.
+    """
+    if type_cache is None:
+        type_cache = parameter_type_cache
+    kwargs = _build_get_parameter_kwargs(
+        name=name,
+        version=version,
+        label=label,
+        with_decryption=with_decryption,
+        type_cache=type_cache,
+    )
+
+    # get the parameter data
+    try:
+        response = await call_api(
+            ssm_client,
+            "get_parameter",
+            executor=executor,
+            **kwargs,
+        )
+        parameter, retry_kwargs = _parse_get_parameter_response(
+            name, kwargs, response, type_cache
+        )
+        if retry_kwargs is not None:
+            response = await call_api(
+                ssm_client,
+                "get_parameter",
+                executor=executor,
+                **retry_kwargs,
+            )
+            parameter = Parameter._from_parameter_dict(response["Parameter"])
+        await _load_chunks(ssm_client, [parameter], executor=executor)
+        if with_tags:
+            parameter.Tags = await get_parameter_tags(
+                ssm_client, kwargs["Name"], executor=executor
+            )
+        return parameter
+    # if not exists, return None
+    except Exception as e:
+        if "ParameterNotFound" in str(e):
+            return None
+        else:  # pragma: no cover
+            raise e
+
+
+async def load_parameters(
+    ssm_client,
+    names: T.Iterable[str],
+    version: T.Optional[int] = None,
+    label: T.Optional[str] = None,
+    with_decryption: bool = True,
+    with_tags: bool = False,
+    concurrency: int = 10,
+    executor: T.Optional[Executor] = None,
+) -> T.List[T.Optional[Parameter]]:
+    """
+    Load many parameters concurrently, at most ``concurrency`` API calls
+    run at the same time.
+
+    :param names: the parameter names. You can use the ``name:version``
+        or ``name:label`` selector syntax to load a specific version.
+    :param version: if set, load this version for all parameters
+    :param label: if set, load this label for all parameters
+
+    :return: list of :class:`~pysecret.aws.parameter_store.Parameter` in the
+        same order as the ``names``, None if the parameter doesn't exist.
+    """
+    return await gather_with_concurrency(
+        concurrency,
+        *[
+            load_parameter(
+                ssm_client,
+                name,
+                version=version,
+                label=label,
+                with_decryption=with_decryption,
+                with_tags=with_tags,
+                executor=executor,
+            )
+            for name in names
+        ],
+    )
+
+
+async def deploy_parameter(
+    ssm_client,
+    name: str,
+    data: T.Union[str, list, dict, T.Any],
+    description: T.Optional[str] = None,
+    type_is_string: bool = False,
+    type_is_string_list: bool = False,
+    type_is_secure_string: bool = False,
+    kms_key_id: T.Optional[str] = None,
+    use_default_kms_key: T.Optional[bool] = False,
+    tier_is_standard: bool = False,
+    tier_is_advanced: bool = False,
+    tier_is_intelligent: bool = False,
+    policies: T.Optional[str] = None,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    overwrite: bool = False,
+    skip_if_duplicated: bool = True,
+    executor: T.Optional[Executor] = None,
+) -> T.Optional[Parameter]:
+    """
+    asyncio version of :func:`pysecret.aws.parameter_store.deploy_parameter`.
+    """
+    put_parameter_kwargs, with_encryption = _build_put_parameter_kwargs(
+        name=name,
+        data=data,
+        description=description,
+        type_is_string=type_is_string,
+        type_is_string_list=type_is_string_list,
+        type_is_secure_string=type_is_secure_string,
+        kms_key_id=kms_key_id,
+        use_default_kms_key=use_default_kms_key,
+        tier_is_standard=tier_is_standard,
+        tier_is_advanced=tier_is_advanced,
+        tier_is_intelligent=tier_is_intelligent,
+        policies=policies,
+        overwrite=overwrite,
+    )
+
+    if skip_if_duplicated:
+        parameter = await load_parameter(
+            ssm_client,
+            name=name,
+            with_decryption=with_encryption,
+            executor=executor,
+        )
+        # if not exists, do create
+        if parameter is None:
+            _set_create_parameter_kwargs(put_parameter_kwargs, tags)
+            response = await call_api(
+                ssm_client,
+                "put_parameter",
+                executor=executor,
+                **put_parameter_kwargs,
+            )
+            return Parameter._from_put_parameter_response(
+                put_parameter_kwargs, response
+            )
+        # if the same, do nothing
+        if parameter.Value == put_parameter_kwargs["Value"]:
+            await put_parameter_tags(ssm_client, name, tags, executor=executor)
+            return None
+
+    response = await call_api(
+        ssm_client,
+        "put_parameter",
+        executor=executor,
+        **put_parameter_kwargs,
+    )
+    await put_parameter_tags(ssm_client, name, tags, executor=executor)
+    return Parameter._from_put_parameter_response(put_parameter_kwargs, response)
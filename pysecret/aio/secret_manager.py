@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio version of :mod:`pysecret.aws.secret_manager`.
+"""
+
+import typing as T
+import asyncio
+from concurrent.futures import Executor
+
+from ..helper import chunks
+from ..aws.tagging import encode_tags, decode_tags, reconcile_tags
+from ..aws.secret_manager import (
+    BATCH_GET_SECRET_VALUE_BATCH_SIZE,
+    Secret,
+    _build_get_secret_value_kwargs,
+    _parse_batch_get_secret_value_response,
+    _find_unloaded_chunked_secrets,
+    _get_secret_chunk_names,
+    _find_outdated_secret_chunks,
+    _set_secret_chunks,
+    _build_create_or_update_secret_kwargs,
+    _get_kwargs_content_hash,
+    _set_create_secret_options,
+    _set_write_secret_kwargs,
+)
+from .client import call_api, gather_with_concurrency
+
+
+async def get_secret_tags(
+    sm_client,
+    name_or_arn: str,
+    executor: T.Optional[Executor] = None,
+) -> T.Dict[str, str]:
+    """
+    asyncio version of :func:`pysecret.aws.secret_manager.get_secret_tags`.
+    """
+    response = await call_api(
+        sm_client,
+        "describe_secret",
+        executor=executor,
+        SecretId=name_or_arn,
+    )
+    return decode_tags(response.get("Tags", []))
+
+
+async def put_secret_tags(
+    sm_client,
+    name_or_arn: str,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    executor: T.Optional[Executor] = None,
+):
+    """
+    asyncio version of :func:`pysecret.aws.secret_manager.put_secret_tags`.
+    """
+    await _reconcile_secret_tags(
+        sm_client,
+        name_or_arn,
+        tags,
+        replace_tags=True,
+        executor=executor,
+    )
+
+
+async def _reconcile_secret_tags(
+    sm_client,
+    name_or_arn: str,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    replace_tags: bool = False,
+    executor: T.Optional[Executor] = None,
+):
+    """
+    asyncio version of :func:`pysecret.aws.secret_manager._reconcile_secret_tags`.
+    """
+    if tags is None:
+        return
+
+    # reconcile_tags decides the API calls, then they run in order
+    api_calls = list()
+    reconcile_tags(
+        existing_tags=await get_secret_tags(sm_client, name_or_arn, executor=executor),
+        desired_tags=tags,
+        remove_tags=lambda tag_keys: api_calls.append(
+            ("untag_resource", dict(SecretId=name_or_arn, TagKeys=tag_keys))
+        ),
+        add_tags=lambda tags_: api_calls.append(
+            ("tag_resource", dict(SecretId=name_or_arn, Tags=encode_tags(tags_)))
+        ),
+        replace=replace_tags,
+    )
+    for method, kwargs in api_calls:
+        await call_api(sm_client, method, executor=executor, **kwargs)
+
+
+async def _batch_get_secret_value(
+    sm_client,
+    names_or_arns: T.List[str],
+    executor: T.Optional[Executor] = None,
+) -> T.Tuple[T.List[Secret], T.Dict[str, str]]:
+    """
+    asyncio version of
+    :meth:`pysecret.aws.secret_manager.Secret._batch_get_secret_value`.
+    """
+    secrets: T.List[Secret] = list()
+    errors: T.Dict[str, str] = dict()
+    kwargs = dict(SecretIdList=names_or_arns)
+    while 1:
+        response = await call_api(
+            sm_client,
+            "batch_get_secret_value",
+            executor=executor,
+            **kwargs,
+        )
+        next_token = _parse_batch_get_secret_value_response(response, secrets, errors)
+        if next_token:
+            kwargs["NextToken"] = next_token
+        else:
+            break
+    return secrets, errors
+
+
+async def _load_secret_chunks(
+    sm_client,
+    secrets: T.List[Secret],
+    executor: T.Optional[Executor] = None,
+):
+    """
+    asyncio version of :func:`pysecret.aws.secret_manager._load_secret_chunks`.
+    """
+    todo = _find_unloaded_chunked_secrets(secrets)
+    if len(todo) == 0:
+        return
+
+    results = await asyncio.gather(
+        *[
+            _batch_get_secret_value(sm_client, chunk, executor=executor)
+            for chunk in chunks(
+                _get_secret_chunk_names(todo),
+                BATCH_GET_SECRET_VALUE_BATCH_SIZE,
+            )
+        ]
+    )
+    current_chunks = {
+        chunk_secret.Name: chunk_secret
+        for chunk_secrets, _ in results
+        for chunk_secret in chunk_secrets
+    }
+    outdated = _find_outdated_secret_chunks(todo, current_chunks)
+
+    async def get_chunk(chunk_name: str, version_id: str) -> bytes:
+        try:
+            response = await call_api(
+                sm_client,
+                "get_secret_value",
+                executor=executor,
+                SecretId=chunk_name,
+                VersionId=version_id,
+            )
+        except Exception as e:
+            if "ResourceNotFoundException" in str(e):
+                raise ValueError(
+                    f"chunk {chunk_name!r} version {version_id!r} not found!"
+                )
+            else:  # pragma: no cover
+                raise e
+        return response["SecretBinary"]
+
+    outdated_chunks = dict(
+        zip(
+            outdated,
+            await asyncio.gather(
+                *[
+                    get_chunk(chunk_name, version_id)
+                    for chunk_name, version_id in outdated
+                ]
+            ),
+        )
+    )
+    _set_secret_chunks(todo, current_chunks, outdated_chunks)
+
+
+async def load_secret(
+    sm_client,
+    name_or_arn: str,
+    version_id: T.Optional[str] = None,
+    version_stage: T.Optional[str] = None,
+    load_chunks: bool = True,
+    executor: T.Optional[Executor] = None,
+) -> T.Optional[Secret]:
+    """
+    asyncio version of :meth:`pysecret.aws.secret_manager.Secret.load`.
+    """
+    kwargs = _build_get_secret_value_kwargs(
+        name_or_arn,
+        version_id=version_id,
+        version_stage=version_stage,
+    )
+
+    try:
+        response = await call_api(
+            sm_client,
+            "get_secret_value",
+            executor=executor,
+            **kwargs,
+        )
+    except Exception as e:
+        if "ResourceNotFoundException" in str(e):
+            return None
+        else:  # pragma: no cover
+            raise e
+    secret = Secret._from_secret_value_dict(response)
+    if load_chunks:
+        await _load_secret_chunks(sm_client, [secret], executor=executor)
+    return secret
+
+
+async def load_secrets(
+    sm_client,
+    names_or_arns: T.Iterable[str],
+    concurrency: int = 10,
+    executor: T.Optional[Executor] = None,
+) -> T.List[T.Optional[Secret]]:
+    """
+    Load many secrets concurrently, at most ``concurrency`` API calls
+    run at the same time.
+
+    :return: list of :class:`~pysecret.aws.secret_manager.Secret` in the
+        same order as the ``names_or_arns``, None if the secret doesn't exist.
+    """
+    return await gather_with_concurrency(
+        concurrency,
+        *[
+            load_secret(sm_client, name_or_arn, executor=executor)
+            for name_or_arn in names_or_arns
+        ],
+    )
+
+
+async def deploy_secret(
+    sm_client,
+    name_or_arn: str,
+    data: T.Union[bytes, str, list, dict, T.Any],
+    description: T.Optional[str] = None,
+    kms_key_id: T.Optional[str] = None,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    replace_tags: bool = False,
+    add_replica_regions: T.Optional[T.List[T.Dict[str, str]]] = None,
+    force_overwrite_replica_secret: T.Optional[bool] = None,
+    client_request_token: T.Optional[str] = None,
+    skip_if_duplicated: bool = True,
+    executor: T.Optional[Executor] = None,
+) -> T.Optional[Secret]:
+    """
+    asyncio version of :func:`pysecret.aws.secret_manager.deploy_secret`.
+    """
+    create_or_update_secret_kwargs = _build_create_or_update_secret_kwargs(
+        data=data,
+        description=description,
+        kms_key_id=kms_key_id,
+    )
+
+    # the duplication check only needs the manifest of the chunked secret
+    secret = await load_secret(
+        sm_client,
+        name_or_arn,
+        load_chunks=False,
+        executor=executor,
+    )
+
+    # create branch
+    if secret is None:
+        _set_create_secret_options(
+            create_or_update_secret_kwargs,
+            add_replica_regions=add_replica_regions,
+            force_overwrite_replica_secret=force_overwrite_replica_secret,
+            client_request_token=client_request_token,
+        )
+        _set_write_secret_kwargs(
+            create_or_update_secret_kwargs,
+            name_or_arn=name_or_arn,
+            is_create=True,
+            tags=tags,
+        )
+        response = await call_api(
+            sm_client,
+            "create_secret",
+            executor=executor,
+            **create_or_update_secret_kwargs,
+        )
+        return Secret._from_create_or_update_secret_response(
+            create_or_update_secret_kwargs=create_or_update_secret_kwargs,
+            create_or_update_secret_response=response,
+        )
+
+    # update branch
+    if skip_if_duplicated:
+        content_hash = _get_kwargs_content_hash(create_or_update_secret_kwargs)
+        if content_hash == secret.content_hash:
+            if replace_tags:
+                await put_secret_tags(sm_client, name_or_arn, tags, executor=executor)
+            return None
+
+    _set_write_secret_kwargs(
+        create_or_update_secret_kwargs,
+        name_or_arn=name_or_arn,
+        is_create=False,
+    )
+    response = await call_api(
+        sm_client,
+        "update_secret",
+        executor=executor,
+        **create_or_update_secret_kwargs,
+    )
+    secret = Secret._from_create_or_update_secret_response(
+        create_or_update_secret_kwargs=create_or_update_secret_kwargs,
+        create_or_update_secret_response=response,
+    )
+    await _reconcile_secret_tags(
+        sm_client,
+        name_or_arn,
+        tags,
+        replace_tags=replace_tags,
+        executor=executor,
+    )
+    return secret
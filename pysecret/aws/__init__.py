@@ -1,20 +1,53 @@
 # -*- coding: utf-8 -*-
 
+from .bulk import (
+    DeployActionEnum,
+    DeployResult,
+)
 from .parameter_store import (
+    ParameterTypeCache,
+    parameter_type_cache,
     Parameter,
+    iter_parameters_by_path,
+    iter_parameter_history,
+    ParameterHistory,
     deploy_parameter,
+    ParameterSpec,
+    deploy_parameters,
     delete_parameter,
+    delete_parameters,
     get_parameter_tags,
     update_parameter_tags,
     put_parameter_tags,
     remove_parameter_tags,
 )
+from .parameter_index import ParameterIndex
+from .watcher import ParameterWatcher
 from .secret_manager import (
+    get_secret_tags,
+    update_secret_tags,
+    put_secret_tags,
+    remove_secret_tags,
     Secret,
+    LazySecret,
+    iter_secrets,
+    SecretVersion,
+    iter_secret_versions,
+    SecretVersionIndex,
     deploy_secret,
+    SecretSpec,
+    deploy_secrets,
     delete_secret,
+    delete_secrets,
+)
+from .throttle import (
+    RateLimiter,
+    default_rate_limiter,
 )
+from .cache import SecretCache
+from .snapshot import Snapshot
 from .kms import (
+    KmsEnvelopeCipher,
     kms_symmetric_encrypt,
     kms_symmetric_decrypt,
 )
@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+"""
+Common data model for the bulk deployment APIs.
+"""
+
+import typing as T
+import enum
+import dataclasses
+
+
+class DeployActionEnum(str, enum.Enum):
+    create = "create"
+    update = "update"
+    skip = "skip"
+
+
+@dataclasses.dataclass
+class DeployResult:
+    """
+    The deployment result of one resource in a bulk deployment.
+
+    :param name: the resource name.
+    :param action: the planned action, one of :class:`DeployActionEnum`.
+    :param resource: the deployed resource object, for example
+        :class:`~pysecret.aws.parameter_store.Parameter`. None if the action
+        is skip or the deployment failed.
+    :param error: the exception raised during deployment, None if succeeded.
+    """
+
+    name: str = dataclasses.field()
+    action: str = dataclasses.field()
+    resource: T.Optional[T.Any] = dataclasses.field(default=None)
+    error: T.Optional[Exception] = dataclasses.field(default=None)
+
+    @property
+    def is_succeeded(self) -> bool:
+        return self.error is None
@@ -0,0 +1,661 @@
+# -*- coding: utf-8 -*-
+
+"""
+Read through cache for AWS Parameter Store parameters and AWS Secret Manager
+secrets.
+"""
+
+import typing as T
+import enum
+import time
+import random
+import weakref
+import threading
+import dataclasses
+from datetime import datetime, timedelta, timezone
+from collections import OrderedDict
+
+from .parameter_store import Parameter
+from .secret_manager import Secret
+from .throttle import get_service_name
+
+
+class ServiceNameEnum(str, enum.Enum):
+    ssm = "ssm"
+    secretsmanager = "secretsmanager"
+
+
+def get_size(value: T.Union[Parameter, Secret]) -> int:
+    """
+    Get the approximate size in bytes of the cached parameter / secret data.
+    """
+    if isinstance(value, Parameter):
+        return len(value.Value.encode("utf-8"))
+    if value.Manifest is not None:
+        return value.Manifest.size
+    if value.SecretBinary is not None:
+        return len(value.SecretBinary)
+    return len(value.SecretString.encode("utf-8"))
+
+
+def is_changed(
+    old_value: T.Union[Parameter, Secret],
+    new_value: T.Union[Parameter, Secret],
+) -> bool:
+    """
+    Check whether the parameter / secret data is changed.
+    """
+    if isinstance(old_value, Parameter):
+        return (old_value.Version, old_value.Value) != (
+            new_value.Version,
+            new_value.Value,
+        )
+    return (old_value.VersionId, old_value.fingerprint) != (
+        new_value.VersionId,
+        new_value.fingerprint,
+    )
+
+
+def get_rotation_aware_ttl(
+    describe_secret_response: dict,
+    now: datetime,
+    ttl: float,
+    rotation_ttl: float,
+    pending_ttl: float,
+    rotation_delay: float,
+) -> float:
+    """
+    Get the TTL of a cached secret based on its rotation status in the
+    ``describe_secret`` API response.
+
+    - if a rotation is in progress (there is an ``AWSPENDING`` version), use
+        the short ``pending_ttl``.
+    - if rotation is enabled, refresh ``rotation_delay`` seconds after the
+        next rotation, but cache it for at most ``rotation_ttl`` seconds.
+        The next rotation is the ``NextRotationDate``, or the
+        ``LastRotatedDate`` plus the ``AutomaticallyAfterDays`` rotation rule.
+        If the next rotation is overdue, use the ``pending_ttl``.
+    - otherwise, use the default ``ttl``.
+
+    :param describe_secret_response: the ``describe_secret`` API response.
+    :param now: the current time in timezone aware datetime.
+    """
+    for stages in describe_secret_response.get("VersionIdsToStages", {}).values():
+        if "AWSPENDING" in stages:
+            return pending_ttl
+    if not describe_secret_response.get("RotationEnabled"):
+        return ttl
+    next_rotation_date = describe_secret_response.get("NextRotationDate")
+    if next_rotation_date is None:
+        last_rotated_date = describe_secret_response.get("LastRotatedDate")
+        days = describe_secret_response.get("RotationRules", {}).get(
+            "AutomaticallyAfterDays"
+        )
+        if (last_rotated_date is None) or (days is None):
+            return ttl
+        next_rotation_date = last_rotated_date + timedelta(days=days)
+    seconds = (next_rotation_date - now).total_seconds() + rotation_delay
+    if seconds <= 0:
+        return pending_ttl
+    return min(rotation_ttl, max(seconds, pending_ttl))
+
+
+@dataclasses.dataclass
+class CacheEntry:
+    """
+    An entry in :class:`SecretCache`.
+
+    :param key: the cache key.
+    :param value: the cached :class:`~pysecret.aws.parameter_store.Parameter`
+        or :class:`~pysecret.aws.secret_manager.Secret` object.
+    :param size: the approximate size of the value in bytes.
+    :param expire_at: the expiration time in the cache clock.
+    :param refresh_at: when to refresh the entry in background, only used
+        in stale-while-revalidate mode.
+    :param accessed: is the entry read since it is loaded? Only accessed entries
+        are refreshed in background.
+    """
+
+    key: tuple = dataclasses.field()
+    value: T.Union[Parameter, Secret] = dataclasses.field()
+    size: int = dataclasses.field()
+    expire_at: float = dataclasses.field()
+    refresh_at: float = dataclasses.field()
+    accessed: bool = dataclasses.field(default=False)
+
+    @property
+    def name(self) -> str:
+        return self.key[0]
+
+
+class SecretCache:
+    """
+    A thread safe, bounded, read through cache that wraps a boto3 ``ssm``
+    or ``secretsmanager`` client.
+
+    - each entry expires after ``ttl`` seconds.
+    - when the number of entries exceeds ``max_entries``, or the total size of
+        the cached data exceeds ``max_bytes``, the least recently used entries
+        are evicted.
+    - use :meth:`SecretCache.invalidate` to explicitly remove entries.
+    - the :attr:`SecretCache.hits`, :attr:`SecretCache.misses` and
+        :attr:`SecretCache.evictions` counters can be used for monitoring.
+
+    **Stale-while-revalidate mode**
+
+    After :meth:`SecretCache.start_refresh` is called, one background worker
+    thread refreshes the entries that are about to expire, and the expired
+    entries keep being served (for at most ``max_stale`` seconds) until the
+    refresh is done. So the caller never pays the AWS latency after the
+    first load. The refresh time of each entry is jittered so a fleet of
+    processes doesn't stampede the API. Only the entries that have been read
+    since the last load are refreshed, the idle ones simply expire. Use
+    :meth:`SecretCache.subscribe` to get notified when a value is changed.
+
+    **Revalidate mode**
+
+    With ``revalidate=True`` (``secretsmanager`` client only), an expired
+    secret is revalidated with the cheap ``describe_secret`` API instead of
+    being reloaded. If the cached ``VersionId`` still has the expected version
+    stage (``AWSCURRENT`` by default) in the ``VersionIdsToStages`` of the
+    response, the entry is renewed and counted as a hit, the
+    ``get_secret_value`` API is only called when the version changed. The
+    background worker also uses this check in stale-while-revalidate mode.
+    The :attr:`SecretCache.revalidations` and
+    :attr:`SecretCache.revalidation_hits` counters show how many
+    ``describe_secret`` calls are made and how many of them save a reload.
+
+    **Rotation aware mode**
+
+    With ``rotation_aware=True`` (``secretsmanager`` client only), the TTL of
+    each secret is decided by its rotation status from ``describe_secret``,
+    see :func:`get_rotation_aware_ttl`. The secret with rotation enabled is
+    cached for a long time and refreshed just after the next rotation, and
+    checked frequently while a rotation is in progress. The
+    ``describe_secret`` call is shared with the revalidate mode.
+
+    Example::
+
+        >>> cache = SecretCache(boto3.client("ssm"), ttl=300)
+        >>> parameter = cache.get("/myapp/prod/db-password")
+        >>> cache = SecretCache(boto3.client("secretsmanager"), ttl=300)
+        >>> secret = cache.get("myapp/prod/db-credentials")
+        >>> cache.subscribe(lambda name, old, new: print(f"{name} is changed"))
+        >>> cache.start_refresh()
+
+    :param client: the boto3 ``ssm`` or ``secretsmanager`` client.
+    :param ttl: time to live in seconds for each entry.
+    :param max_entries: max number of entries, None means no limit.
+    :param max_bytes: max total size of cached data in bytes, None means no limit.
+    :param refresh_ahead: in stale-while-revalidate mode, refresh the entry
+        this many seconds before it expires.
+    :param jitter: in stale-while-revalidate mode, a random delay between
+        0 and ``jitter`` seconds is added to ``refresh_ahead`` for each entry.
+    :param max_stale: in stale-while-revalidate mode, how long in seconds an
+        expired entry can still be served, default is the same as ``ttl``.
+    :param refresh_interval: how often in seconds the background worker
+        checks the entries.
+    :param revalidate: revalidate the expired secret with ``describe_secret``
+        and only reload it if the version changed.
+    :param rotation_aware: decide the TTL of each secret by its rotation status.
+    :param rotation_ttl: in rotation aware mode, the max TTL of the secret
+        with rotation enabled.
+    :param pending_ttl: in rotation aware mode, the TTL of the secret that
+        is being rotated.
+    :param rotation_delay: in rotation aware mode, refresh the secret this many
+        seconds after the next rotation date.
+    :param clock: a function that returns the current time in seconds, it is
+        used for testing.
+    """
+
+    def __init__(
+        self,
+        client,
+        ttl: float = 300,
+        max_entries: T.Optional[int] = 1000,
+        max_bytes: T.Optional[int] = None,
+        refresh_ahead: float = 30,
+        jitter: float = 10,
+        max_stale: T.Optional[float] = None,
+        refresh_interval: float = 1,
+        revalidate: bool = False,
+        rotation_aware: bool = False,
+        rotation_ttl: float = 86400,
+        pending_ttl: float = 30,
+        rotation_delay: float = 60,
+        clock: T.Callable[[], float] = time.monotonic,
+    ):
+        self.client = client
+        self.service_name = get_service_name(client)
+        if self.service_name not in [
+            ServiceNameEnum.ssm.value,
+            ServiceNameEnum.secretsmanager.value,
+        ]:
+            raise ValueError(
+                f"SecretCache only supports 'ssm' and 'secretsmanager' client, "
+                f"got {self.service_name!r}!"
+            )
+        if (revalidate or rotation_aware) and (
+            self.service_name != ServiceNameEnum.secretsmanager.value
+        ):
+            raise ValueError(
+                "revalidate and rotation aware mode only support "
+                "'secretsmanager' client!"
+            )
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.refresh_ahead = refresh_ahead
+        self.jitter = jitter
+        self.max_stale = ttl if max_stale is None else max_stale
+        self.refresh_interval = refresh_interval
+        self.revalidate = revalidate
+        self.rotation_aware = rotation_aware
+        self.rotation_ttl = rotation_ttl
+        self.pending_ttl = pending_ttl
+        self.rotation_delay = rotation_delay
+        self.clock = clock
+
+        self._entries: T.Dict[tuple, CacheEntry] = OrderedDict()
+        self._lock = threading.RLock()
+        # a key lock lives as long as a thread holds it, it is independent of
+        # the entry lifetime, so eviction / invalidation never splits the
+        # single flight of a key into two locks
+        self._key_locks: T.MutableMapping[tuple, threading.Lock] = (
+            weakref.WeakValueDictionary()
+        )
+        self._callbacks: T.List[T.Callable] = list()
+        self._refresh_thread: T.Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.total_bytes: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.stale_hits: int = 0
+        self.refreshes: int = 0
+        self.refresh_errors: int = 0
+        self.revalidations: int = 0
+        self.revalidation_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+    @property
+    def revalidation_hit_rate(self) -> float:
+        """
+        The ratio of the ``describe_secret`` revalidations that found the
+        cached version is still the latest.
+        """
+        if self.revalidations == 0:
+            return 0.0
+        return self.revalidation_hits / self.revalidations
+
+    @property
+    def is_refreshing(self) -> bool:
+        """
+        Is the stale-while-revalidate background worker running?
+        """
+        return (self._refresh_thread is not None) and self._refresh_thread.is_alive()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _make_key(self, name: str, **kwargs) -> tuple:
+        return (name,) + tuple(sorted(kwargs.items()))
+
+    def _load(self, key: tuple) -> T.Optional[T.Union[Parameter, Secret]]:
+        name, kwargs = key[0], dict(key[1:])
+        if self.service_name == ServiceNameEnum.ssm.value:
+            return Parameter.load(self.client, name, **kwargs)
+        else:
+            return Secret.load(self.client, name, **kwargs)
+
+    def _describe_secret(self, name: str) -> T.Optional[dict]:
+        """
+        Call the ``describe_secret`` API, return None if the secret doesn't exist.
+
+        Ref:
+
+        - describe_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.describe_secret
+        """
+        try:
+            return self.client.describe_secret(SecretId=name)
+        except Exception as e:
+            if "ResourceNotFoundException" in str(e):
+                return None
+            else:  # pragma: no cover
+                raise e
+
+    def _is_latest(
+        self,
+        entry: CacheEntry,
+        response: T.Optional[dict],
+    ) -> bool:
+        """
+        Check whether the cached secret version is still the one that the
+        cache key points to.
+
+        :param response: the ``describe_secret`` API response.
+        """
+        kwargs = dict(entry.key[1:])
+        with self._lock:
+            self.revalidations += 1
+        if response is None:
+            return False
+        version_stage = kwargs.get("version_stage")
+        if (version_stage is None) and (kwargs.get("version_id") is None):
+            version_stage = "AWSCURRENT"
+        version_ids_to_stages = response.get("VersionIdsToStages", {})
+        if entry.value.VersionId not in version_ids_to_stages:
+            return False
+        if (version_stage is not None) and (
+            version_stage not in version_ids_to_stages[entry.value.VersionId]
+        ):
+            return False
+        with self._lock:
+            self.revalidation_hits += 1
+        return True
+
+    def _get_ttl(self, name: str, response: T.Optional[dict] = None) -> float:
+        """
+        Get the TTL of an entry, in rotation aware mode, it calls the
+        ``describe_secret`` API if the ``response`` is not given.
+        """
+        if self.rotation_aware is False:
+            return self.ttl
+        if response is None:
+            response = self._describe_secret(name)
+            if response is None:  # pragma: no cover
+                return self.ttl
+        return get_rotation_aware_ttl(
+            describe_secret_response=response,
+            now=datetime.now(timezone.utc),
+            ttl=self.ttl,
+            rotation_ttl=self.rotation_ttl,
+            pending_ttl=self.pending_ttl,
+            rotation_delay=self.rotation_delay,
+        )
+
+    def _new_entry(
+        self,
+        key: tuple,
+        value: T.Union[Parameter, Secret],
+        ttl: T.Optional[float] = None,
+    ) -> CacheEntry:
+        if ttl is None:
+            ttl = self.ttl
+        now = self.clock()
+        lead = min(
+            self.refresh_ahead + random.uniform(0, self.jitter),
+            ttl * 0.9,
+        )
+        return CacheEntry(
+            key=key,
+            value=value,
+            size=get_size(value),
+            expire_at=now + ttl,
+            refresh_at=now + ttl - lead,
+        )
+
+    def _get_entry(self, key: tuple) -> T.Optional[CacheEntry]:
+        """
+        Get the entry that can be served, it could be a stale entry in
+        stale-while-revalidate mode.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            now = self.clock()
+            if entry.expire_at <= now:
+                if self.is_refreshing is False:
+                    return None
+                if entry.expire_at + self.max_stale <= now:
+                    return None
+                self.stale_hits += 1
+            self._entries.move_to_end(key)
+            entry.accessed = True
+            return entry
+
+    def _put_entry(self, entry: CacheEntry):
+        with self._lock:
+            old_entry = self._entries.pop(entry.key, None)
+            if old_entry is not None:
+                self.total_bytes -= old_entry.size
+            self._entries[entry.key] = entry
+            self.total_bytes += entry.size
+            self._evict()
+
+    def _remove_entry(self, key: tuple):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.total_bytes -= entry.size
+
+    def _evict(self):
+        while len(self._entries) > 1 and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            key, entry = self._entries.popitem(last=False)
+            self.total_bytes -= entry.size
+            self.evictions += 1
+
+    def _get_key_lock(self, key: tuple) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = threading.Lock()
+                self._key_locks[key] = lock
+            return lock
+
+    def get(
+        self,
+        name: str,
+        **kwargs,
+    ) -> T.Optional[T.Union[Parameter, Secret]]:
+        """
+        Get the parameter or secret from cache, load it from AWS if not cached
+        or expired. Concurrent cache miss on the same key only triggers one
+        AWS API call.
+
+        :param name: the parameter name or the secret name / ARN.
+        :param kwargs: additional keyword arguments for
+            :meth:`~pysecret.aws.parameter_store.Parameter.load` or
+            :meth:`~pysecret.aws.secret_manager.Secret.load`, for example
+            ``version``, ``label``, ``version_id``, ``version_stage``.
+            They are part of the cache key.
+
+        :return: None if the parameter / secret doesn't exist, the not found
+            result is not cached.
+        """
+        key = self._make_key(name, **kwargs)
+        entry = self._get_entry(key)
+        if entry is not None:
+            with self._lock:
+                self.hits += 1
+            return entry.value
+
+        with self._get_key_lock(key):
+            # another thread may have loaded it while we are waiting
+            entry = self._get_entry(key)
+            if entry is not None:
+                with self._lock:
+                    self.hits += 1
+                return entry.value
+            response = None
+            if self.revalidate:
+                with self._lock:
+                    entry = self._entries.get(key)
+                if entry is not None:
+                    response = self._describe_secret(name)
+                    if self._is_latest(entry, response):
+                        with self._lock:
+                            self.hits += 1
+                        entry = self._new_entry(
+                            key, entry.value, ttl=self._get_ttl(name, response)
+                        )
+                        entry.accessed = True
+                        self._put_entry(entry)
+                        return entry.value
+            with self._lock:
+                self.misses += 1
+            value = self._load(key)
+            if value is None:
+                self._remove_entry(key)
+                return None
+            entry = self._new_entry(key, value, ttl=self._get_ttl(name, response))
+            entry.accessed = True
+            self._put_entry(entry)
+            return value
+
+    def invalidate(self, name: T.Optional[str] = None):
+        """
+        Remove entries from the cache.
+
+        :param name: remove all entries of this parameter / secret name,
+            if None, remove all entries.
+        """
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+                self.total_bytes = 0
+            else:
+                for key in [key for key in self._entries if key[0] == name]:
+                    self._remove_entry(key)
+
+    def clear_stats(self):
+        """
+        Reset all the counters.
+        """
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.stale_hits = 0
+            self.refreshes = 0
+            self.refresh_errors = 0
+            self.revalidations = 0
+            self.revalidation_hits = 0
+
+    # --------------------------------------------------------------------------
+    # stale-while-revalidate
+    # --------------------------------------------------------------------------
+    def subscribe(
+        self,
+        callback: T.Callable[
+            [
+                str,
+                T.Union[Parameter, Secret],
+                T.Optional[T.Union[Parameter, Secret]],
+            ],
+            T.Any,
+        ],
+    ) -> T.Callable:
+        """
+        Register a "value changed" callback, it is called by the background
+        worker as ``callback(name, old_value, new_value)`` when a refreshed
+        value is different from the cached one. ``new_value`` is None if
+        the parameter / secret is deleted.
+
+        :return: the callback itself, so it can be used as a decorator.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: T.Callable):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def _notify(self, name: str, old_value, new_value):
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(name, old_value, new_value)
+            except Exception:  # pragma: no cover
+                pass
+
+    def _refresh_entry(self, entry: CacheEntry):
+        with self._get_key_lock(entry.key):
+            try:
+                response = None
+                if self.revalidate:
+                    response = self._describe_secret(entry.name)
+                if self.revalidate and self._is_latest(entry, response):
+                    value = entry.value
+                else:
+                    value = self._load(entry.key)
+                if value is not None:
+                    ttl = self._get_ttl(entry.name, response)
+            except Exception:
+                # keep serving the stale value, retry in next round
+                with self._lock:
+                    self.refresh_errors += 1
+                return
+            with self._lock:
+                self.refreshes += 1
+                # the entry is invalidated, evicted or replaced while the
+                # refresh is in flight, drop the result
+                if self._entries.get(entry.key) is not entry:
+                    return
+                if value is None:
+                    self._remove_entry(entry.key)
+                else:
+                    self._put_entry(self._new_entry(entry.key, value, ttl=ttl))
+            if value is None:
+                self._notify(entry.name, entry.value, None)
+            elif is_changed(entry.value, value):
+                self._notify(entry.name, entry.value, value)
+
+    def refresh_once(self) -> int:
+        """
+        Refresh all accessed entries that are about to expire. This is what
+        the background worker does in every ``refresh_interval``.
+
+        :return: number of entries to refresh.
+        """
+        now = self.clock()
+        with self._lock:
+            entries = [
+                entry
+                for entry in self._entries.values()
+                if entry.accessed and (entry.refresh_at <= now)
+            ]
+        for entry in entries:
+            self._refresh_entry(entry)
+        return len(entries)
+
+    def _run_refresh(self):
+        while self._stop_event.wait(self.refresh_interval) is False:
+            self.refresh_once()
+
+    def start_refresh(self):
+        """
+        Start the stale-while-revalidate background worker thread. The thread
+        is a daemon thread, it won't block the interpreter from exiting.
+        """
+        if self.is_refreshing:
+            return
+        self._stop_event.clear()
+        self._refresh_thread = threading.Thread(
+            target=self._run_refresh,
+            name="pysecret-cache-refresh",
+            daemon=True,
+        )
+        self._refresh_thread.start()
+
+    def stop_refresh(self, timeout: T.Optional[float] = None):
+        """
+        Stop the stale-while-revalidate background worker thread.
+        """
+        self._stop_event.set()
+        if self._refresh_thread is not None:
+            self._refresh_thread.join(timeout)
+            self._refresh_thread = None
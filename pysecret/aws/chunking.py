@@ -0,0 +1,404 @@
+# -*- coding: utf-8 -*-
+
+"""
+Chunked storage for the value that is larger than the AWS size limit.
+
+The value is compressed, base64 encoded and split into several chunks. A
+manifest (a small JSON document) records how to reassemble the chunks:
+
+.. code-block:: javascript
+
+    {
+        "__pysecret_chunked__": {
+            "format_version": 1,
+            "compression": "zlib",
+            "size": 123456, // the size of the original value in bytes
+            "sha256": "...", // the checksum of the original value
+            "chunks": [1, 3, 2] // the version (or id) of each chunk
+        }
+    }
+
+The text value (parameter) is base64 encoded after compression, see
+:func:`split_value`. The binary value (secret) is split as it is, see
+:func:`split_binary`, and it can be reassembled as a stream with
+:class:`ChunkReader` without joining the chunks.
+"""
+
+import typing as T
+import io
+import json
+import enum
+import zlib
+import base64
+import hashlib
+import dataclasses
+
+try:
+    import zstandard
+
+    has_zstandard = True
+except ImportError:  # pragma: no cover
+    has_zstandard = False
+
+
+CHUNKED_KEY = "__pysecret_chunked__"
+MANIFEST_PREFIX = f'{{"{CHUNKED_KEY}": '
+CHUNK_PATH_PART = "__chunk__"
+FORMAT_VERSION = 1
+
+
+class CompressionEnum(str, enum.Enum):
+    none = "none"
+    zlib = "zlib"
+    zstd = "zstd"
+
+
+def compress(data: bytes, compression: str) -> bytes:
+    """
+    Compress the binary data with the given algorithm.
+    """
+    if compression == CompressionEnum.none.value:
+        return data
+    elif compression == CompressionEnum.zlib.value:
+        return zlib.compress(data, 9)
+    elif compression == CompressionEnum.zstd.value:
+        if has_zstandard is False:  # pragma: no cover
+            raise ImportError(
+                "you have to install `zstandard` to use zstd compression."
+            )
+        return zstandard.ZstdCompressor(level=19).compress(data)
+    else:
+        raise ValueError(f"unknown compression {compression!r}!")
+
+
+class _IdentityDecompressor:
+    def decompress(self, data: bytes) -> bytes:
+        return data
+
+    def flush(self) -> bytes:
+        return b""
+
+
+def new_decompressor(compression: str):
+    """
+    Create an incremental decompressor object that has the ``decompress(data)``
+    and ``flush()`` method.
+    """
+    if compression == CompressionEnum.none.value:
+        return _IdentityDecompressor()
+    elif compression == CompressionEnum.zlib.value:
+        return zlib.decompressobj()
+    elif compression == CompressionEnum.zstd.value:
+        if has_zstandard is False:  # pragma: no cover
+            raise ImportError(
+                "you have to install `zstandard` to use zstd compression."
+            )
+        return zstandard.ZstdDecompressor().decompressobj()
+    else:
+        raise ValueError(f"unknown compression {compression!r}!")
+
+
+def decompress(data: bytes, compression: str) -> bytes:
+    """
+    Decompress the binary data with the given algorithm.
+    """
+    if compression == CompressionEnum.none.value:
+        return data
+    elif compression == CompressionEnum.zlib.value:
+        return zlib.decompress(data)
+    elif compression == CompressionEnum.zstd.value:
+        if has_zstandard is False:  # pragma: no cover
+            raise ImportError(
+                "you have to install `zstandard` to use zstd compression."
+            )
+        return zstandard.ZstdDecompressor().decompress(data)
+    else:
+        raise ValueError(f"unknown compression {compression!r}!")
+
+
+def get_chunk_path(name: str) -> str:
+    """
+    Get the hierarchy path of all chunks of a parameter. AWS requires the
+    hierarchy path to start with ``/``.
+
+    Example::
+
+        >>> get_chunk_path("/app/config")
+        '/app/config/__chunk__'
+        >>> get_chunk_path("app-config")
+        '/app-config/__chunk__'
+    """
+    if not name.startswith("/"):
+        name = f"/{name}"
+    return f"{name}/{CHUNK_PATH_PART}"
+
+
+def get_chunk_name(name: str, index: int) -> str:
+    """
+    Get the name of the ``index`` th chunk of a parameter.
+    """
+    return f"{get_chunk_path(name)}/{index}"
+
+
+def get_secret_chunk_prefix(name: str) -> str:
+    """
+    Get the name prefix of all chunks of a secret. Unlike the parameter, the
+    secret name doesn't have to start with ``/``.
+
+    Example::
+
+        >>> get_secret_chunk_prefix("app/cert")
+        'app/cert/__chunk__/'
+    """
+    return f"{name}/{CHUNK_PATH_PART}/"
+
+
+def get_secret_chunk_name(name: str, index: int) -> str:
+    """
+    Get the name of the ``index`` th chunk of a secret.
+    """
+    return f"{get_secret_chunk_prefix(name)}{index}"
+
+
+def is_chunk_name(name: str) -> bool:
+    """
+    Check if the parameter is a chunk of a chunked parameter.
+    """
+    parts = name.rsplit("/", 2)
+    return (len(parts) == 3) and (parts[1] == CHUNK_PATH_PART) and parts[2].isdigit()
+
+
+@dataclasses.dataclass
+class ChunkManifest:
+    """
+    The manifest of a chunked value.
+
+    :param compression: the compression algorithm, see :class:`CompressionEnum`.
+    :param size: the size of the original value in bytes.
+    :param sha256: the sha256 checksum of the original value.
+    :param chunks: the version (or id) of each chunk, in order.
+    """
+
+    compression: str = dataclasses.field()
+    size: int = dataclasses.field()
+    sha256: str = dataclasses.field()
+    chunks: T.List[T.Any] = dataclasses.field(default_factory=list)
+    format_version: int = dataclasses.field(default=FORMAT_VERSION)
+
+    def to_json(self) -> str:
+        return json.dumps({CHUNKED_KEY: dataclasses.asdict(self)})
+
+    @classmethod
+    def from_json(cls, value: str) -> T.Optional["ChunkManifest"]:
+        """
+        Parse the manifest, return None if the value is not a manifest.
+        """
+        # fast path, don't parse the regular value
+        if not value.startswith(MANIFEST_PREFIX):
+            return None
+        try:
+            dct = json.loads(value)[CHUNKED_KEY]
+        except Exception:  # pragma: no cover
+            return None
+        return cls(**dct)
+
+    @property
+    def n_chunks(self) -> int:
+        return len(self.chunks)
+
+
+def split_value(
+    value: str,
+    chunk_size: int,
+    compression: str = CompressionEnum.zlib.value,
+) -> T.Tuple[ChunkManifest, T.List[str]]:
+    """
+    Compress, base64 encode and split the value into chunks.
+
+    :param value: the original value.
+    :param chunk_size: the max size of each chunk.
+    :param compression: the compression algorithm, see :class:`CompressionEnum`.
+
+    :return: a tuple of two items, the manifest (without the chunk versions)
+        and the list of chunk value.
+    """
+    data = value.encode("utf-8")
+    encoded = base64.b64encode(compress(data, compression)).decode("ascii")
+    chunk_values = [
+        encoded[i : i + chunk_size] for i in range(0, len(encoded), chunk_size)
+    ]
+    manifest = ChunkManifest(
+        compression=compression,
+        size=len(data),
+        sha256=hashlib.sha256(data).hexdigest(),
+    )
+    return manifest, chunk_values
+
+
+def _checksum_error() -> ValueError:
+    return ValueError(
+        "the checksum of the reassembled chunked value doesn't match "
+        "the manifest, the chunks may be modified or incomplete!"
+    )
+
+
+def join_value(
+    manifest: ChunkManifest,
+    chunk_values: T.List[str],
+) -> str:
+    """
+    Reassemble the original value from the chunks, and verify the checksum.
+
+    :raise ValueError: if the chunks can't be decompressed or the checksum
+        doesn't match.
+    """
+    error = _checksum_error()
+    try:
+        data = decompress(
+            base64.b64decode("".join(chunk_values)),
+            manifest.compression,
+        )
+    except ImportError:  # pragma: no cover
+        raise
+    except Exception:
+        raise error
+    if (len(data) != manifest.size) or (
+        hashlib.sha256(data).hexdigest() != manifest.sha256
+    ):
+        raise error
+    return data.decode("utf-8")
+
+
+def split_binary(
+    data: bytes,
+    chunk_size: int,
+    compression: str = CompressionEnum.zlib.value,
+) -> T.Tuple[ChunkManifest, T.List[memoryview]]:
+    """
+    Compress and split the binary data into chunks. The chunks are
+    ``memoryview`` slices of the compressed data, no copy is made.
+
+    :param data: the original binary data.
+    :param chunk_size: the max size of each chunk in bytes.
+    :param compression: the compression algorithm, see :class:`CompressionEnum`.
+
+    :return: a tuple of two items, the manifest (without the chunk ids)
+        and the list of chunk value.
+    """
+    view = memoryview(compress(data, compression))
+    chunk_values = [view[i : i + chunk_size] for i in range(0, len(view), chunk_size)]
+    manifest = ChunkManifest(
+        compression=compression,
+        size=len(data),
+        sha256=hashlib.sha256(data).hexdigest(),
+    )
+    return manifest, chunk_values
+
+
+class ChunkReader(io.RawIOBase):
+    """
+    A read only binary stream that decompresses the chunks of a binary value
+    incrementally. At most one decompressed chunk is held in memory, the
+    chunks are never joined. The checksum is verified when the end of the
+    stream is reached.
+
+    Example::
+
+        >>> reader = ChunkReader(manifest, chunk_values)
+        >>> with open("keystore.jks", "wb") as f:
+        ...     shutil.copyfileobj(reader, f)
+
+    :param manifest: the :class:`ChunkManifest`.
+    :param chunk_values: the binary chunks in order.
+
+    :raise ValueError: in ``read`` if the chunks can't be decompressed or
+        the checksum doesn't match.
+    """
+
+    def __init__(
+        self,
+        manifest: ChunkManifest,
+        chunk_values: T.Iterable[bytes],
+    ):
+        super().__init__()
+        self.manifest = manifest
+        self._chunk_values = iter(chunk_values)
+        self._decompressor = new_decompressor(manifest.compression)
+        self._buffer = memoryview(b"")
+        self._sha256 = hashlib.sha256()
+        self._size = 0
+        self._flushed = False
+
+    def readable(self) -> bool:
+        return True
+
+    def _verify(self):
+        """
+        Verify the size and checksum of all the data that has been read.
+        """
+        if (self._size != self.manifest.size) or (
+            self._sha256.hexdigest() != self.manifest.sha256
+        ):
+            raise _checksum_error()
+
+    def _fill(self) -> bool:
+        """
+        Make sure the buffer is not empty, return False if there is no more data.
+        The checksum is verified every time it returns False.
+        """
+        while len(self._buffer) == 0:
+            if self._flushed:
+                self._verify()
+                return False
+            try:
+                chunk_value = next(self._chunk_values)
+                try:
+                    data = self._decompressor.decompress(chunk_value)
+                except Exception:
+                    raise _checksum_error()
+            except StopIteration:
+                self._flushed = True
+                try:
+                    data = self._decompressor.flush()
+                except Exception:  # pragma: no cover
+                    raise _checksum_error()
+            self._buffer = memoryview(data)
+        return True
+
+    def readinto(self, b) -> int:
+        if self._fill() is False:
+            return 0
+        n = min(len(b), len(self._buffer))
+        data = self._buffer[:n]
+        b[:n] = data
+        self._sha256.update(data)
+        self._size += n
+        self._buffer = self._buffer[n:]
+        return n
+
+
+def join_binary(
+    manifest: ChunkManifest,
+    chunk_values: T.Iterable[bytes],
+) -> memoryview:
+    """
+    Reassemble the original binary data from the chunks into one
+    pre-allocated buffer, and verify the checksum. The chunks are never
+    concatenated.
+
+    :raise ValueError: if the chunks can't be decompressed or the checksum
+        doesn't match.
+    """
+    buffer = bytearray(manifest.size)
+    view = memoryview(buffer)
+    reader = ChunkReader(manifest, chunk_values)
+    offset = 0
+    while offset < manifest.size:
+        n = reader.readinto(view[offset:])
+        if n == 0:
+            raise _checksum_error()
+        offset += n
+    # make sure there is no more data and verify the checksum
+    if reader.read(1):
+        raise _checksum_error()
+    return view
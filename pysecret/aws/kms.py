@@ -1,25 +1,260 @@
 # -*- coding: utf-8 -*-
 
 """
-AWS Key Management Service supportintegration
+AWS Key Management Service support.
+
+The KMS ``encrypt`` API only accepts up to 4 KB plaintext, and every call is a
+network round trip. The envelope mode generates a data key with the
+``generate_data_key`` API, encrypts the data locally with AES-GCM, and stores
+the KMS wrapped data key in the output header:
+
+.. code-block:: text
+
+    magic (4 bytes, b"PSKE")
+    format version (1 byte)
+    wrapped key length (2 bytes, big endian)
+    wrapped key
+    nonce (12 bytes)
+    AES-GCM ciphertext and tag
+
+The header (from the magic to the wrapped key) is authenticated as the
+AES-GCM associated data. :class:`KmsEnvelopeCipher` reuses the data key for
+many messages and caches the unwrapped data keys, so encrypting or decrypting
+a record is a local operation.
+
+.. note::
+
+    The envelope mode requires the ``cryptography`` library, install it with
+    ``pip install pysecret[encrypt]``.
 """
 
+import typing as T
+import os
+import struct
+import threading
+from collections import OrderedDict
+
+try:
+    from cryptography.exceptions import InvalidTag
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+    has_cryptography = True
+except ImportError:  # pragma: no cover
+    has_cryptography = False
+
+
+ENVELOPE_MAGIC = b"PSKE"
+ENVELOPE_FORMAT_VERSION = 1
+ENVELOPE_NONCE_SIZE = 12
+_ENVELOPE_HEADER = struct.Struct(">4sBH")
+
+#: a data key is rotated after encrypting this many messages, it keeps the
+#: random nonce collision probability negligible
+DEFAULT_MAX_MESSAGES_PER_DATA_KEY = 2**20
+DEFAULT_MAX_CACHED_DATA_KEYS = 128
+
+
+def _ensure_cryptography():
+    if has_cryptography is False:  # pragma: no cover
+        raise ImportError(
+            "you have to install `cryptography` to use the KMS envelope "
+            "encryption, run `pip install pysecret[encrypt]`."
+        )
+
+
+def _new_aesgcm(data_key: bytes) -> "AESGCM":
+    _ensure_cryptography()
+    return AESGCM(data_key)
+
+
+def is_envelope(blob: bytes) -> bool:
+    """
+    Check if the blob is encrypted by the envelope mode.
+    """
+    return bytes(blob[:4]) == ENVELOPE_MAGIC
+
+
+def _build_envelope_header(wrapped_key: bytes) -> bytes:
+    return (
+        _ENVELOPE_HEADER.pack(
+            ENVELOPE_MAGIC,
+            ENVELOPE_FORMAT_VERSION,
+            len(wrapped_key),
+        )
+        + wrapped_key
+    )
+
+
+def _parse_envelope(
+    blob: bytes,
+) -> T.Tuple[bytes, memoryview, memoryview, memoryview]:
+    """
+    Parse the envelope.
+
+    :return: a tuple of four items, the wrapped key, the header (the
+        associated data), the nonce and the ciphertext.
+    """
+    view = memoryview(blob)
+    try:
+        magic, format_version, key_length = _ENVELOPE_HEADER.unpack_from(view)
+    except struct.error:
+        raise ValueError("the blob is not a KMS envelope!")
+    if magic != ENVELOPE_MAGIC:
+        raise ValueError("the blob is not a KMS envelope!")
+    if format_version != ENVELOPE_FORMAT_VERSION:
+        raise ValueError(f"unknown KMS envelope format version {format_version}!")
+    key_end = _ENVELOPE_HEADER.size + key_length
+    nonce_end = key_end + ENVELOPE_NONCE_SIZE
+    if len(view) < nonce_end:
+        raise ValueError("the KMS envelope is truncated!")
+    return (
+        bytes(view[_ENVELOPE_HEADER.size : key_end]),
+        view[:key_end],
+        view[key_end:nonce_end],
+        view[nonce_end:],
+    )
+
+
+def _envelope_encrypt(aesgcm: "AESGCM", header: bytes, blob: bytes) -> bytes:
+    nonce = os.urandom(ENVELOPE_NONCE_SIZE)
+    return b"".join([header, nonce, aesgcm.encrypt(nonce, blob, header)])
+
+
+def _envelope_decrypt(
+    aesgcm: "AESGCM",
+    header: memoryview,
+    nonce: memoryview,
+    ciphertext: memoryview,
+) -> bytes:
+    try:
+        return aesgcm.decrypt(bytes(nonce), ciphertext, header)
+    except InvalidTag:
+        raise ValueError(
+            "failed to decrypt the KMS envelope, the data may be modified!"
+        )
+
+
+class KmsEnvelopeCipher:
+    """
+    KMS envelope encryption engine for many messages of arbitrary size.
+
+    - encrypt: one ``generate_data_key`` call creates a data key, it is
+        reused to encrypt up to ``max_messages`` messages locally with
+        AES-GCM and a random nonce, then a new data key is generated.
+    - decrypt: the wrapped data key in the header is unwrapped with one
+        ``decrypt`` call, the unwrapped keys are cached (LRU), so the other
+        messages encrypted by the same data key are decrypted locally.
+
+    Example::
+
+        >>> cipher = KmsEnvelopeCipher(kms_client, kms_key_id="alias/my-key")
+        >>> blobs = [cipher.encrypt(record) for record in records] # 1 KMS call
+        >>> records = [cipher.decrypt(blob) for blob in blobs] # 1 KMS call
+
+    It is thread safe.
+
+    :param kms_client: the boto3 kms client.
+    :param kms_key_id: the KMS key to generate the data key, it is not needed
+        if you only decrypt.
+    :param max_messages: max number of messages encrypted by one data key.
+    :param max_cached_keys: max number of unwrapped data keys to cache
+        for decryption.
+    """
+
+    def __init__(
+        self,
+        kms_client,
+        kms_key_id: T.Optional[str] = None,
+        max_messages: int = DEFAULT_MAX_MESSAGES_PER_DATA_KEY,
+        max_cached_keys: int = DEFAULT_MAX_CACHED_DATA_KEYS,
+    ):
+        _ensure_cryptography()
+        self.kms_client = kms_client
+        self.kms_key_id = kms_key_id
+        self.max_messages = max_messages
+        self.max_cached_keys = max_cached_keys
+        self._lock = threading.Lock()
+        self._header: T.Optional[bytes] = None
+        self._aesgcm: T.Optional["AESGCM"] = None
+        self._n_messages: int = 0
+        self._key_cache: T.Dict[bytes, "AESGCM"] = OrderedDict()
+
+        self.n_generate_data_key: int = 0
+        self.n_decrypt_data_key: int = 0
+
+    def _get_encrypt_key(self) -> T.Tuple[bytes, "AESGCM"]:
+        if self.kms_key_id is None:
+            raise ValueError("`kms_key_id` is required to encrypt!")
+        with self._lock:
+            if (self._aesgcm is None) or (self._n_messages >= self.max_messages):
+                response = self.kms_client.generate_data_key(
+                    KeyId=self.kms_key_id,
+                    KeySpec="AES_256",
+                )
+                self.n_generate_data_key += 1
+                self._header = _build_envelope_header(response["CiphertextBlob"])
+                self._aesgcm = _new_aesgcm(response["Plaintext"])
+                self._n_messages = 0
+            self._n_messages += 1
+            return self._header, self._aesgcm
+
+    def _get_decrypt_key(self, wrapped_key: bytes) -> "AESGCM":
+        with self._lock:
+            try:
+                aesgcm = self._key_cache[wrapped_key]
+                self._key_cache.move_to_end(wrapped_key)
+                return aesgcm
+            except KeyError:
+                pass
+        data_key = kms_symmetric_decrypt(self.kms_client, wrapped_key)
+        aesgcm = _new_aesgcm(data_key)
+        with self._lock:
+            self.n_decrypt_data_key += 1
+            self._key_cache[wrapped_key] = aesgcm
+            while len(self._key_cache) > self.max_cached_keys:
+                self._key_cache.popitem(last=False)
+        return aesgcm
+
+    def encrypt(self, blob: bytes) -> bytes:
+        """
+        Encrypt the binary data of any size.
+        """
+        header, aesgcm = self._get_encrypt_key()
+        return _envelope_encrypt(aesgcm, header, blob)
+
+    def decrypt(self, blob: bytes) -> bytes:
+        """
+        Decrypt the output of :meth:`KmsEnvelopeCipher.encrypt`.
+
+        :raise ValueError: if the blob is not a valid envelope or it is modified.
+        """
+        wrapped_key, header, nonce, ciphertext = _parse_envelope(blob)
+        aesgcm = self._get_decrypt_key(wrapped_key)
+        return _envelope_decrypt(aesgcm, header, nonce, ciphertext)
+
 
 def kms_symmetric_encrypt(
     kms_client,
     blob: bytes,
     kms_key_id: str,
+    envelope: bool = False,
 ):
     """
     Use KMS key to encrypt a short text.
 
     - KMS.Client.encrypt: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/kms.html#KMS.Client.encrypt
+    - KMS.Client.generate_data_key: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/kms.html#KMS.Client.generate_data_key
 
     :param blob: binary data to encrypt
     :param kms_key_id:
+    :param envelope: if True, use the envelope mode, the data can be larger
+        than 4 KB. Use :class:`KmsEnvelopeCipher` to encrypt many messages
+        with one KMS call.
 
     :rtype: bytes
     """
+    if envelope:
+        return KmsEnvelopeCipher(kms_client, kms_key_id).encrypt(blob)
     return kms_client.encrypt(
         Plaintext=blob,
         KeyId=kms_key_id,
@@ -31,10 +266,13 @@ def kms_symmetric_decrypt(
     blob: bytes,
 ):
     """
-    Use KMS key to decrypt a short text.
+    Use KMS key to decrypt a short text. The envelope mode output
+    (see :func:`kms_symmetric_encrypt`) is detected automatically.
 
     :param blob: binary data to decrypt
 
     :rtype: bytes
     """
+    if is_envelope(blob):
+        return KmsEnvelopeCipher(kms_client).decrypt(blob)
     return kms_client.decrypt(CiphertextBlob=blob)["Plaintext"]
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+
+"""
+Local in-memory index of the AWS Parameter Store parameter names and tags,
+for instant lookup by name prefix and tags without loading any value.
+"""
+
+import typing as T
+import threading
+import dataclasses
+from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+from .chunking import is_chunk_name
+from .throttle import RateLimiter, throttle_client
+from .parameter_store import (
+    get_parameter_tags,
+    _iter_describe_parameters,
+)
+
+
+@dataclasses.dataclass
+class ParameterMetadata:
+    """
+    The parameter metadata from the ``describe_parameters`` API, plus the
+    resource tags. It doesn't have the parameter value.
+    """
+
+    Name: str = dataclasses.field()
+    Type: T.Optional[str] = dataclasses.field(default=None)
+    KeyId: T.Optional[str] = dataclasses.field(default=None)
+    LastModifiedDate: T.Optional[datetime] = dataclasses.field(default=None)
+    LastModifiedUser: T.Optional[str] = dataclasses.field(default=None)
+    Description: T.Optional[str] = dataclasses.field(default=None)
+    Version: T.Optional[int] = dataclasses.field(default=None)
+    Tier: T.Optional[str] = dataclasses.field(default=None)
+    DataType: T.Optional[str] = dataclasses.field(default=None)
+    Tags: T.Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    @classmethod
+    def _from_describe_parameters_dict(cls, dct: dict) -> "ParameterMetadata":
+        return cls(
+            Name=dct["Name"],
+            Type=dct.get("Type"),
+            KeyId=dct.get("KeyId"),
+            LastModifiedDate=dct.get("LastModifiedDate"),
+            LastModifiedUser=dct.get("LastModifiedUser"),
+            Description=dct.get("Description"),
+            Version=dct.get("Version"),
+            Tier=dct.get("Tier"),
+            DataType=dct.get("DataType"),
+        )
+
+
+class _TrieNode:
+    __slots__ = ("children", "name")
+
+    def __init__(self):
+        self.children: T.Dict[str, "_TrieNode"] = dict()
+        self.name: T.Optional[str] = None
+
+    def iter_names(self) -> T.Iterator[str]:
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.name is not None:
+                yield node.name
+            stack.extend(node.children.values())
+
+
+class ParameterIndex:
+    """
+    A thread safe index of parameter names and tags. It is built from the
+    ``describe_parameters`` API, no parameter value is loaded.
+
+    - parameter names are stored in a prefix trie of the ``/`` separated
+        path segments, so the prefix lookup only visits the matched sub tree.
+    - tags are stored in an inverted index of ``(key, value) -> names``.
+
+    Example::
+
+        >>> index = ParameterIndex.build(ssm_client, path="/prod")
+        >>> index.find(prefix="/prod/", tags={"team": "payments"})
+        ['/prod/payments/db', '/prod/payments/api-key']
+        >>> index.refresh(ssm_client) # only re-fetch the changed parameters
+
+    .. note::
+
+        ``describe_parameters`` doesn't return tags, so the tags are fetched with
+        one ``list_tags_for_resource`` call per parameter (concurrently) when
+        the parameter is new or its ``LastModifiedDate`` changed. Changing tags
+        doesn't change the ``LastModifiedDate``, use
+        ``refresh(..., refresh_tags=True)`` to re-fetch all tags.
+
+    :param path: only index the parameters under this hierarchy path,
+        if None, index all parameters.
+    :param with_tags: also index the tags?
+    """
+
+    def __init__(
+        self,
+        path: T.Optional[str] = None,
+        with_tags: bool = True,
+    ):
+        self.path = path
+        self.with_tags = with_tags
+        self.refreshed_at: T.Optional[datetime] = None
+        self._lock = threading.RLock()
+        self._metadata: T.Dict[str, ParameterMetadata] = dict()
+        self._trie = _TrieNode()
+        self._tag_index: T.Dict[T.Tuple[str, str], T.Set[str]] = dict()
+        self._tag_key_index: T.Dict[str, T.Set[str]] = dict()
+
+    @classmethod
+    def build(
+        cls,
+        ssm_client,
+        path: T.Optional[str] = None,
+        with_tags: bool = True,
+        max_workers: T.Optional[int] = None,
+        rate_limiter: T.Optional[RateLimiter] = None,
+    ) -> "ParameterIndex":
+        """
+        Create an index and fill it with :meth:`ParameterIndex.refresh`.
+        """
+        index = cls(path=path, with_tags=with_tags)
+        index.refresh(
+            ssm_client,
+            max_workers=max_workers,
+            rate_limiter=rate_limiter,
+        )
+        return index
+
+    def __len__(self) -> int:
+        return len(self._metadata)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._metadata
+
+    @property
+    def names(self) -> T.List[str]:
+        """
+        All indexed parameter names in alphabetical order.
+        """
+        with self._lock:
+            return sorted(self._metadata)
+
+    def get(self, name: str) -> T.Optional[ParameterMetadata]:
+        return self._metadata.get(name)
+
+    def _add(self, metadata: ParameterMetadata):
+        name = metadata.Name
+        self._metadata[name] = metadata
+        node = self._trie
+        for segment in name.split("/"):
+            node = node.children.setdefault(segment, _TrieNode())
+        node.name = name
+        for key, value in metadata.Tags.items():
+            self._tag_index.setdefault((key, value), set()).add(name)
+            self._tag_key_index.setdefault(key, set()).add(name)
+
+    def _remove(self, name: str):
+        metadata = self._metadata.pop(name, None)
+        if metadata is None:
+            return
+        # remove from the trie and prune the empty nodes
+        path = [self._trie]
+        for segment in name.split("/"):
+            path.append(path[-1].children[segment])
+        path[-1].name = None
+        segments = name.split("/")
+        for node, parent, segment in zip(
+            reversed(path[1:]), reversed(path[:-1]), reversed(segments)
+        ):
+            if node.children or (node.name is not None):
+                break
+            del parent.children[segment]
+        # remove from the tag index
+        for key, value in metadata.Tags.items():
+            for index, index_key in [
+                (self._tag_index, (key, value)),
+                (self._tag_key_index, key),
+            ]:
+                names = index.get(index_key)
+                if names is not None:
+                    names.discard(name)
+                    if len(names) == 0:
+                        del index[index_key]
+
+    def refresh(
+        self,
+        ssm_client,
+        refresh_tags: bool = False,
+        max_workers: T.Optional[int] = None,
+        rate_limiter: T.Optional[RateLimiter] = None,
+    ) -> T.Tuple[T.List[str], T.List[str]]:
+        """
+        Incrementally refresh the index. It lists all parameter metadata with the
+        paginated ``describe_parameters`` API (50 parameters per call), and
+        only re-fetches the tags of the new parameters and the parameters whose
+        ``LastModifiedDate`` changed.
+
+        :param refresh_tags: if True, re-fetch the tags of all parameters.
+        :param max_workers: max number of threads to fetch tags.
+        :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+            to throttle and retry the API calls, if None, no rate limiting.
+
+        :return: a tuple of two items, the list of new or changed parameter
+            names, and the list of removed parameter names.
+
+        Ref:
+
+        - describe_parameters: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.describe_parameters
+        """
+        ssm_client = throttle_client(ssm_client, rate_limiter)
+        if self.path is None:
+            parameter_filters = None
+        else:
+            parameter_filters = [
+                {"Key": "Path", "Option": "Recursive", "Values": [self.path]}
+            ]
+        refreshed_at = datetime.now(timezone.utc)
+        latest: T.Dict[str, ParameterMetadata] = dict()
+        for dct in _iter_describe_parameters(ssm_client, parameter_filters):
+            if is_chunk_name(dct["Name"]):
+                continue
+            metadata = ParameterMetadata._from_describe_parameters_dict(dct)
+            latest[metadata.Name] = metadata
+
+        changed: T.List[ParameterMetadata] = list()
+        unchanged: T.List[ParameterMetadata] = list()
+        for name, metadata in latest.items():
+            existing = self._metadata.get(name)
+            if (existing is None) or (
+                existing.LastModifiedDate != metadata.LastModifiedDate
+            ):
+                changed.append(metadata)
+            else:
+                unchanged.append(metadata)
+        removed = [name for name in self._metadata if name not in latest]
+        if refresh_tags:
+            to_update = changed + unchanged
+        else:
+            to_update = changed
+
+        if self.with_tags:
+
+            def get_tags(metadata: ParameterMetadata) -> T.Dict[str, str]:
+                try:
+                    return get_parameter_tags(ssm_client, metadata.Name)
+                except Exception as e:  # pragma: no cover
+                    # the parameter is deleted after describe_parameters
+                    if "InvalidResourceId" in str(e):
+                        return {}
+                    raise e
+
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for metadata, tags in zip(to_update, executor.map(get_tags, to_update)):
+                    metadata.Tags = tags
+
+        with self._lock:
+            for name in removed:
+                self._remove(name)
+            for metadata in to_update:
+                self._remove(metadata.Name)
+                self._add(metadata)
+            self.refreshed_at = refreshed_at
+
+        return [metadata.Name for metadata in changed], removed
+
+    def find(
+        self,
+        prefix: T.Optional[str] = None,
+        tags: T.Optional[T.Dict[str, T.Optional[str]]] = None,
+    ) -> T.List[str]:
+        """
+        Find the parameter names by name prefix and tags.
+
+        :param prefix: the parameter name prefix, for example ``"/prod/"``.
+        :param tags: the tags that the parameter must have, if the value
+            is None, only the tag key has to exist.
+
+        :return: the matched parameter names in alphabetical order.
+        """
+        with self._lock:
+            candidates: T.List[T.Set[str]] = list()
+            if tags:
+                for key, value in tags.items():
+                    if value is None:
+                        names = self._tag_key_index.get(key)
+                    else:
+                        names = self._tag_index.get((key, value))
+                    if not names:
+                        return []
+                    candidates.append(names)
+                candidates.sort(key=len)
+                result = set(candidates[0])
+                for names in candidates[1:]:
+                    result.intersection_update(names)
+                if prefix:
+                    result = {name for name in result if name.startswith(prefix)}
+                return sorted(result)
+
+            if not prefix:
+                return sorted(self._metadata)
+
+            *segments, last_segment = prefix.split("/")
+            node = self._trie
+            for segment in segments:
+                node = node.children.get(segment)
+                if node is None:
+                    return []
+            return sorted(
+                name
+                for segment, child in node.children.items()
+                if segment.startswith(last_segment)
+                for name in child.iter_names()
+            )
@@ -8,7 +8,10 @@ import typing as T
 import json
 import enum
 import dataclasses
+import threading
+from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import jsonpickle
@@ -18,9 +21,20 @@ except ImportError:  # pragma: no cover
     has_jsonpickle = False
 
 from ..compat import cached_property
-from ..js_helper import strip_comments
-from ..helper import ensure_only_one_true
-from .tagging import encode_tags, decode_tags
+from ..json_codec import loads as json_loads
+from ..helper import ensure_only_one_true, chunks, concurrent_map
+from .tagging import encode_tags, decode_tags, reconcile_tags
+from .bulk import DeployActionEnum, DeployResult
+from .throttle import RateLimiter, throttle_client
+from .chunking import (
+    CompressionEnum,
+    ChunkManifest,
+    get_chunk_path,
+    get_chunk_name,
+    is_chunk_name,
+    split_value,
+    join_value,
+)
 
 
 JSON_PICKLE_KEY = "__jsonpickle__"
@@ -46,9 +60,48 @@ class ParameterDataTypeEnum(str, enum.Enum):
     ec2_image = "aws:ec2:image"
 
 
+GET_PARAMETERS_BATCH_SIZE = 10
+DELETE_PARAMETERS_BATCH_SIZE = 10
+DESCRIBE_PARAMETERS_FILTER_VALUES_LIMIT = 50
+
+#: the max size of the parameter value in bytes, per tier
+STANDARD_TIER_VALUE_SIZE_LIMIT = 4096
+ADVANCED_TIER_VALUE_SIZE_LIMIT = 8192
+
+
+def get_value_size_limit(tier: T.Optional[str] = None) -> int:
+    """
+    Get the max size of the parameter value in bytes for the given tier.
+    Intelligent-Tiering uses the Standard tier limit, so the parameter
+    is not promoted to the (paid) Advanced tier.
+    """
+    if tier == ParameterTierEnum.advanced.value:
+        return ADVANCED_TIER_VALUE_SIZE_LIMIT
+    else:
+        return STANDARD_TIER_VALUE_SIZE_LIMIT
+
+
+def parse_selector_labels(selector: T.Optional[str]) -> T.List[str]:
+    """
+    Parse the label information from the ``Selector`` field in the
+    ``get_parameter`` API response.
+
+    - ``None`` or ``":3"`` (version selector) returns ``[]``
+    - ``":v1"`` (label selector) returns ``["v1"]``
+    """
+    if selector and (":" in selector):
+        labels = selector.split(":")[1].split(",")
+        for label in labels:
+            if label.isdigit():
+                return []
+        return labels
+    return []
+
+
 def get_parameter_tags(
     ssm_client,
     name: str,
+    rate_limiter: T.Optional[RateLimiter] = None,
 ) -> T.Dict[str, str]:
     """
     Get parameter tags.
@@ -57,9 +110,13 @@ def get_parameter_tags(
 
     - list_tags_for_resource: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.list_tags_for_resource
 
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
     :return: return empty dict if parameter doesn't have tags. otherwise,
         return tags in format of key value dict.
     """
+    ssm_client = throttle_client(ssm_client, rate_limiter)
     response = ssm_client.list_tags_for_resource(
         ResourceType="Parameter",
         ResourceId=name,
@@ -71,6 +128,7 @@ def remove_parameter_tags(
     ssm_client,
     name: str,
     tag_keys: T.List[str],
+    rate_limiter: T.Optional[RateLimiter] = None,
 ):
     """
     Delete parameter tags.
@@ -78,7 +136,11 @@ def remove_parameter_tags(
     Ref:
 
     - remove_tags_from_resource: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.remove_tags_from_resource
+
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
     """
+    ssm_client = throttle_client(ssm_client, rate_limiter)
     ssm_client.remove_tags_from_resource(
         ResourceType="Parameter",
         ResourceId=name,
@@ -90,6 +152,7 @@ def update_parameter_tags(
     ssm_client,
     name: str,
     tags: T.Dict[str, str],
+    rate_limiter: T.Optional[RateLimiter] = None,
 ):
     """
     Create or update (partial update) tags.
@@ -97,7 +160,11 @@ def update_parameter_tags(
     Ref:
 
     - add_tags_to_resource: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.add_tags_to_resource
+
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
     """
+    ssm_client = throttle_client(ssm_client, rate_limiter)
     ssm_client.add_tags_to_resource(
         ResourceType="Parameter",
         ResourceId=name,
@@ -109,6 +176,7 @@ def put_parameter_tags(
     ssm_client,
     name: str,
     tags: T.Optional[T.Dict[str, str]] = None,
+    rate_limiter: T.Optional[RateLimiter] = None,
 ):
     """
     Full replacement update tags.
@@ -116,27 +184,168 @@ def put_parameter_tags(
     - if None, then do nothing
     - if empty dict, then delete tags
     - if non-empty dict, then do full replacement update
+
+    Only the keys to remove and the keys / values to add are sent to AWS,
+    no write API call happens if the tags already match.
+
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
     """
     if tags is None:
         return
+    ssm_client = throttle_client(ssm_client, rate_limiter)
+
+    reconcile_tags(
+        existing_tags=get_parameter_tags(ssm_client, name),
+        desired_tags=tags,
+        remove_tags=lambda tag_keys: remove_parameter_tags(ssm_client, name, tag_keys),
+        add_tags=lambda tags_: update_parameter_tags(ssm_client, name, tags_),
+    )
 
-    existing_tags = get_parameter_tags(ssm_client, name)
 
-    if len(tags) == 0:
-        if len(existing_tags):  # only run remove tags when there are existing tags
-            remove_parameter_tags(ssm_client, name, list(existing_tags))
+def _get_selector_suffix(
+    version: T.Optional[int] = None,
+    label: T.Optional[str] = None,
+) -> str:
+    """
+    Get the ``:version`` or ``:label`` selector suffix of the parameter name.
+    """
+    if (version is not None) and (label is not None):  # pragma: no cover
+        raise ValueError("You cannot set both `version` and `label`!")
+    elif version is not None:
+        return f":{version}"
+    elif label is not None:
+        return f":{label}"
     else:
-        # if to-update tags is super set of the existing tags
-        # then no need to run remove tags
-        # otherwise, need to run remove tags
-        if not (len(set(existing_tags).difference(set(tags))) == 0):
-            remove_parameter_tags(ssm_client, name, list(existing_tags))
-
-        ssm_client.add_tags_to_resource(
-            ResourceType="Parameter",
-            ResourceId=name,
-            Tags=encode_tags(tags),
-        )
+        return ""
+
+
+def _iter_describe_parameters(
+    ssm_client,
+    parameter_filters: T.Optional[T.List[dict]] = None,
+) -> T.Iterator[dict]:
+    """
+    Iterate the parameter metadata dict in the ``describe_parameters`` API
+    response, it follows the ``NextToken`` automatically.
+
+    Ref:
+
+    - describe_parameters: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.describe_parameters
+    """
+    kwargs = dict(MaxResults=50)
+    if parameter_filters is not None:
+        kwargs["ParameterFilters"] = parameter_filters
+    while 1:
+        response = ssm_client.describe_parameters(**kwargs)
+        yield from response.get("Parameters", [])
+        next_token = response.get("NextToken")
+        if next_token is None:
+            break
+        kwargs["NextToken"] = next_token
+
+
+class ParameterTypeCache:
+    """
+    A thread safe parameter name to parameter ``Type`` mapping. It is used by
+    :meth:`Parameter.load` to decide whether to decrypt the parameter on the
+    first ``get_parameter`` call.
+
+    The cache can be filled by:
+
+    - :meth:`Parameter.load`, it records the type of every loaded parameter.
+    - :meth:`ParameterTypeCache.fill_from_describe_parameters`
+    - :meth:`ParameterTypeCache.read_hint_file`
+
+    :param on_double_fetch: optional callback function that takes the parameter
+        name as the only argument, it is called every time when
+        :meth:`Parameter.load` still has to fetch a SecureString twice.
+        You can use it to emit metric.
+    """
+
+    def __init__(
+        self,
+        on_double_fetch: T.Optional[T.Callable[[str], T.Any]] = None,
+    ):
+        self._data: T.Dict[str, str] = dict()
+        self._lock = threading.Lock()
+        self.on_double_fetch = on_double_fetch
+        self.n_double_fetch: int = 0
+
+    def get(self, name: str) -> T.Optional[str]:
+        return self._data.get(name)
+
+    def set(self, name: str, type: str):
+        with self._lock:
+            self._data[name] = type
+
+    def update(self, data: T.Dict[str, str]):
+        with self._lock:
+            self._data.update(data)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.n_double_fetch = 0
+
+    def to_dict(self) -> T.Dict[str, str]:
+        with self._lock:
+            return dict(self._data)
+
+    def record_double_fetch(self, name: str):
+        with self._lock:
+            self.n_double_fetch += 1
+        if self.on_double_fetch is not None:
+            self.on_double_fetch(name)
+
+    def fill_from_describe_parameters(
+        self,
+        ssm_client,
+        parameter_filters: T.Optional[T.List[dict]] = None,
+    ) -> int:
+        """
+        Fill the cache with the parameter metadata from the ``describe_parameters``
+        API, it doesn't load any parameter value.
+
+        :param parameter_filters: the ``ParameterFilters`` argument of the API,
+            for example ``[{"Key": "Path", "Option": "Recursive", "Values": ["/myapp"]}]``
+
+        :return: number of parameters added to the cache.
+        """
+        data = {
+            dct["Name"]: dct["Type"]
+            for dct in _iter_describe_parameters(ssm_client, parameter_filters)
+        }
+        self.update(data)
+        return len(data)
+
+    def read_hint_file(self, path: T.Union[str, Path]) -> int:
+        """
+        Fill the cache from a JSON hint file created by
+        :meth:`ParameterTypeCache.write_hint_file`. Do nothing if the file
+        doesn't exist.
+
+        :return: number of parameters added to the cache.
+        """
+        path = Path(path)
+        if path.exists() is False:
+            return 0
+        data = json.loads(path.read_text())
+        self.update(data)
+        return len(data)
+
+    def write_hint_file(self, path: T.Union[str, Path]):
+        """
+        Persist the cache to a JSON hint file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=4))
+
+
+parameter_type_cache = ParameterTypeCache()
+"""
+The default :class:`ParameterTypeCache` used by :meth:`Parameter.load`.
+"""
 
 
 @dataclasses.dataclass
@@ -163,6 +372,7 @@ class Parameter:
     SourceResult: T.Optional[str] = dataclasses.field(default=None)
     Tags: T.Dict[str, str] = dataclasses.field(default_factory=dict)
     Labels: T.List[str] = dataclasses.field(default_factory=list)
+    Manifest: T.Optional[ChunkManifest] = dataclasses.field(default=None)
 
     @classmethod
     def load(
@@ -173,68 +383,60 @@ class Parameter:
         label: T.Optional[str] = None,
         with_decryption: T.Optional[bool] = None,
         with_tags: bool = False,
+        type_cache: T.Optional["ParameterTypeCache"] = None,
+        rate_limiter: T.Optional[RateLimiter] = None,
     ) -> T.Optional["Parameter"]:
         """
         Load parameter data.
 
+        If ``with_decryption`` is not True and the parameter turns out to be
+        a SecureString, it has to be fetched again with decryption. To avoid
+        this second round trip, the parameter type is remembered in the
+        ``type_cache``, the next time the parameter is decrypted on the first call.
+
+        If the parameter is stored in chunks (see ``chunked`` argument in
+        :func:`deploy_parameter`), the chunks are fetched and reassembled
+        automatically, the :attr:`Parameter.Value` is the original value.
+
         :param name: the raw parameter name, don't set version and label here
         :param version: the integer version
         :param label: the string label
         :param with_decryption: is this parameter a secure string?
         :param with_tags: also get resource tags?
+        :param type_cache: the :class:`ParameterTypeCache` to use, if None,
+            use the default :data:`parameter_type_cache`.
+        :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+            to throttle and retry the API calls, if None, no rate limiting.
 
         Ref:
 
         - get_parameter: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.get_parameter
         """
-        # preprocess input arguments
-        if (version is not None) and (label is not None):  # pragma: no cover
-            raise ValueError("You cannot set both `version` and `label`!")
-        elif version is not None:
-            name = f"{name}:{version}"
-        elif label is not None:
-            name = f"{name}:{label}"
-        else:
-            pass
-
-        kwargs = dict(Name=name)
-
-        if with_decryption is not None:
-            kwargs["WithDecryption"] = with_decryption
+        ssm_client = throttle_client(ssm_client, rate_limiter)
+        if type_cache is None:
+            type_cache = parameter_type_cache
+        kwargs = _build_get_parameter_kwargs(
+            name=name,
+            version=version,
+            label=label,
+            with_decryption=with_decryption,
+            type_cache=type_cache,
+        )
 
         # get the parameter data
         try:
             response = ssm_client.get_parameter(**kwargs)
-            parameter = cls(
-                Name=response["Parameter"]["Name"],
-                Type=response["Parameter"]["Type"],
-                Value=response["Parameter"]["Value"],
-                Version=response["Parameter"]["Version"],
-                LastModifiedDate=response["Parameter"]["LastModifiedDate"],
-                DataType=response["Parameter"]["DataType"],
-                ARN=response["Parameter"]["ARN"],
-                Selector=response["Parameter"].get("Selector"),
-                SourceResult=response["Parameter"].get("SourceResult"),
+            parameter, retry_kwargs = _parse_get_parameter_response(
+                name, kwargs, response, type_cache
             )
-            # check if the Type is secure string
-            if parameter.Type == ParameterTypeEnum.secure_string.value:
-                # if forget to set with_description = True, then do it again
-                if with_decryption is not True:
-                    parameter = cls.load(ssm_client, name, with_decryption=True)
+            # if forget to set with_description = True, then do it again
+            if retry_kwargs is not None:
+                response = ssm_client.get_parameter(**retry_kwargs)
+                parameter = cls._from_parameter_dict(response["Parameter"])
             # if Type is not secure string or already set with_decryption = True
+            _load_chunks(ssm_client, [parameter])
             if with_tags:
-                parameter.Tags = get_parameter_tags(ssm_client, name)
-            # load labels information from the selector
-            if parameter.Selector:
-                if ":" in parameter.Selector:
-                    labels = parameter.Selector.split(":")[1].split(",")
-                    is_selector_is_version = False
-                    for label in labels:
-                        if label.isdigit():
-                            is_selector_is_version = True
-                            break
-                    if is_selector_is_version is False:
-                        parameter.Labels = labels
+                parameter.Tags = get_parameter_tags(ssm_client, kwargs["Name"])
             return parameter
         # if not exists, return None
         except Exception as e:
@@ -243,6 +445,119 @@ class Parameter:
             else:  # pragma: no cover
                 raise e
 
+    @classmethod
+    def load_many(
+        cls,
+        ssm_client,
+        names: T.Iterable[str],
+        version: T.Optional[int] = None,
+        label: T.Optional[str] = None,
+        with_decryption: bool = True,
+        with_tags: bool = False,
+        max_workers: T.Optional[int] = None,
+        rate_limiter: T.Optional[RateLimiter] = None,
+    ) -> T.Tuple[T.List["Parameter"], T.List[str]]:
+        """
+        Load many parameters with the ``get_parameters`` API. Names are grouped
+        into chunks of 10 (the API limit) and the chunks are fetched concurrently.
+
+        Chunked parameters are reassembled automatically, all chunks of all
+        parameters are fetched together with the batch API.
+
+        :param names: the parameter names. You can use the ``name:version``
+            or ``name:label`` selector syntax to load a specific version.
+        :param version: if set, load this version for all parameters
+        :param label: if set, load this label for all parameters
+        :param with_decryption: decrypt SecureString in the same call,
+            it has no effect on String and StringList parameters.
+        :param with_tags: also get resource tags? It is one more API call per
+            parameter, and they are also executed concurrently.
+        :param max_workers: max number of threads to use.
+        :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+            to throttle and retry the API calls, if None, no rate limiting.
+
+        :return: a tuple of two items, the first one is the list of found
+            :class:`Parameter` in the same order as ``names``, the second one is
+            the list of invalid parameter names (the ``InvalidParameters``
+            field in the response).
+
+        Ref:
+
+        - get_parameters: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.get_parameters
+        """
+        ssm_client = throttle_client(ssm_client, rate_limiter)
+        # preprocess input arguments
+        suffix = _get_selector_suffix(version, label)
+        names = list(dict.fromkeys([f"{name}{suffix}" for name in names]))
+        if len(names) == 0:
+            return [], []
+
+        def get_parameters(chunk: T.List[str]) -> dict:
+            return ssm_client.get_parameters(
+                Names=chunk,
+                WithDecryption=with_decryption,
+            )
+
+        parameters: T.List["Parameter"] = list()
+        invalid_names: T.List[str] = list()
+        name_chunks = chunks(names, GET_PARAMETERS_BATCH_SIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for response in executor.map(get_parameters, name_chunks):
+                for dct in response.get("Parameters", []):
+                    parameters.append(cls._from_parameter_dict(dct))
+                invalid_names.extend(response.get("InvalidParameters", []))
+
+            _load_chunks(ssm_client, parameters, max_workers=max_workers)
+
+            if with_tags:
+                tags_list = executor.map(
+                    lambda param: get_parameter_tags(ssm_client, param.Name),
+                    parameters,
+                )
+                for parameter, tags in zip(parameters, tags_list):
+                    parameter.Tags = tags
+
+        # return the parameters in the same order as the input names
+        order = {name: ind for ind, name in enumerate(names)}
+        parameters.sort(key=lambda param: order.get(param.selector_name, len(order)))
+        return parameters, invalid_names
+
+    @classmethod
+    def _from_parameter_dict(cls, dct: dict) -> "Parameter":
+        """
+        Create a :class:`Parameter` from the parameter dict in the
+        ``get_parameter`` / ``get_parameters`` API response.
+        """
+        parameter = cls(
+            Name=dct["Name"],
+            Type=dct["Type"],
+            Value=dct["Value"],
+            Version=dct["Version"],
+            LastModifiedDate=dct["LastModifiedDate"],
+            DataType=dct["DataType"],
+            ARN=dct["ARN"],
+            Selector=dct.get("Selector"),
+            SourceResult=dct.get("SourceResult"),
+        )
+        parameter.Labels = parse_selector_labels(parameter.Selector)
+        return parameter
+
+    @classmethod
+    def _from_parameter_history_dict(cls, dct: dict) -> "Parameter":
+        """
+        Create a :class:`Parameter` from the parameter dict in the
+        ``get_parameter_history`` API response.
+        """
+        return cls(
+            Name=dct["Name"],
+            Type=dct.get("Type"),
+            Value=dct["Value"],
+            Version=dct["Version"],
+            LastModifiedDate=dct.get("LastModifiedDate"),
+            DataType=dct.get("DataType"),
+            Labels=dct.get("Labels", []),
+        )
+
     @classmethod
     def _from_put_parameter_response(
         cls,
@@ -269,6 +584,14 @@ class Parameter:
             DataType="text",
         )
 
+    @property
+    def selector_name(self) -> str:
+        """
+        The parameter name with the ``:version`` or ``:label`` selector used
+        to load it, for example ``/myapp/config:3``.
+        """
+        return f"{self.Name}{self.Selector or ''}"
+
     @property
     def string(self) -> str:
         """
@@ -288,14 +611,14 @@ class Parameter:
         """
         The python dict user data.
         """
-        return json.loads(strip_comments(self.Value))
+        return json_loads(self.Value)
 
     @cached_property
     def json_list(self) -> list:
         """
         The python list user data.
         """
-        return json.loads(strip_comments(self.Value))
+        return json_loads(self.Value)
 
     @cached_property
     def py_object(self):
@@ -358,8 +681,389 @@ class Parameter:
         return response
 
 
-def deploy_parameter(
+def _build_get_parameter_kwargs(
+    name: str,
+    version: T.Optional[int] = None,
+    label: T.Optional[str] = None,
+    with_decryption: T.Optional[bool] = None,
+    type_cache: T.Optional[ParameterTypeCache] = None,
+) -> dict:
+    """
+    Build the ``get_parameter`` arguments for :meth:`Parameter.load`. If the
+    ``type_cache`` knows that the parameter is a SecureString, decrypt it
+    on the first call.
+    """
+    kwargs = dict(Name=f"{name}{_get_selector_suffix(version, label)}")
+    if with_decryption is not None:
+        kwargs["WithDecryption"] = with_decryption
+    if with_decryption is not True:
+        if type_cache.get(name) == ParameterTypeEnum.secure_string.value:
+            kwargs["WithDecryption"] = True
+    return kwargs
+
+
+def _parse_get_parameter_response(
+    name: str,
+    kwargs: dict,
+    response: dict,
+    type_cache: ParameterTypeCache,
+) -> T.Tuple[Parameter, T.Optional[dict]]:
+    """
+    Parse the ``get_parameter`` API response of the ``kwargs`` made by
+    :func:`_build_get_parameter_kwargs`, and remember the parameter type in
+    the ``type_cache``.
+
+    :return: a tuple of two items, the parameter, and the ``get_parameter``
+        arguments to fetch it again with decryption. The second item is None
+        if the parameter is not a SecureString or it is already decrypted.
+    """
+    parameter = Parameter._from_parameter_dict(response["Parameter"])
+    type_cache.set(name, parameter.Type)
+    if (parameter.Type == ParameterTypeEnum.secure_string.value) and (
+        kwargs.get("WithDecryption") is not True
+    ):
+        type_cache.record_double_fetch(name)
+        return parameter, dict(Name=kwargs["Name"], WithDecryption=True)
+    return parameter, None
+
+
+def _load_chunks(
+    ssm_client,
+    parameters: T.List[Parameter],
+    max_workers: T.Optional[int] = None,
+):
+    """
+    Find the chunked parameters (the value is a :class:`ChunkManifest`), fetch
+    the chunk versions recorded in the manifest with the batch
+    ``get_parameters`` API, and replace the value with the reassembled value
+    in place.
+
+    :raise ValueError: if any chunk is missing or the checksum doesn't match.
+    """
+    todo = _find_chunked_parameters(parameters)
+    if len(todo) == 0:
+        return
+
+    chunk_parameters, _ = Parameter.load_many(
+        ssm_client,
+        _get_chunk_selectors(todo),
+        with_decryption=True,
+        max_workers=max_workers,
+    )
+    _join_chunks(todo, chunk_parameters)
+
+
+def _find_chunked_parameters(
+    parameters: T.List[Parameter],
+) -> T.List[T.Tuple[Parameter, ChunkManifest]]:
+    """
+    Find the chunked parameters (the value is a :class:`ChunkManifest`).
+    """
+    todo: T.List[T.Tuple[Parameter, ChunkManifest]] = list()
+    for parameter in parameters:
+        manifest = ChunkManifest.from_json(parameter.Value)
+        if manifest is not None:
+            todo.append((parameter, manifest))
+    return todo
+
+
+def _get_chunk_selectors(
+    todo: T.List[T.Tuple[Parameter, ChunkManifest]],
+) -> T.List[str]:
+    """
+    Get the ``${chunk_name}:${version}`` selectors of all chunks recorded in
+    the manifests.
+    """
+    return [
+        f"{get_chunk_name(parameter.Name, index)}:{version}"
+        for parameter, manifest in todo
+        for index, version in enumerate(manifest.chunks)
+    ]
+
+
+def _join_chunks(
+    todo: T.List[T.Tuple[Parameter, ChunkManifest]],
+    chunk_parameters: T.List[Parameter],
+):
+    """
+    Replace the value of the chunked parameters with the reassembled value
+    in place.
+
+    :raise ValueError: if any chunk is missing or the checksum doesn't match.
+    """
+    chunk_values = {
+        chunk_parameter.selector_name: chunk_parameter.Value
+        for chunk_parameter in chunk_parameters
+    }
+    for parameter, manifest in todo:
+        values = list()
+        for index, version in enumerate(manifest.chunks):
+            selector = f"{get_chunk_name(parameter.Name, index)}:{version}"
+            try:
+                values.append(chunk_values[selector])
+            except KeyError:
+                raise ValueError(
+                    f"chunk {selector!r} of parameter {parameter.Name!r} not found!"
+                )
+        parameter.Value = join_value(manifest, values)
+        parameter.Manifest = manifest
+
+
+def _delete_chunks(
+    ssm_client,
+    name: str,
+) -> int:
+    """
+    Delete all chunks of a parameter. They are listed with
+    ``get_parameters_by_path`` and deleted with the batch ``delete_parameters``
+    API.
+
+    :return: number of deleted chunks.
+    """
+    kwargs = dict(
+        Path=get_chunk_path(name),
+        Recursive=False,
+        WithDecryption=False,
+    )
+    chunk_names = list()
+    while 1:
+        response = ssm_client.get_parameters_by_path(**kwargs)
+        for dct in response.get("Parameters", []):
+            if is_chunk_name(dct["Name"]):
+                chunk_names.append(dct["Name"])
+        next_token = response.get("NextToken")
+        if next_token is None:
+            break
+        kwargs["NextToken"] = next_token
+    for chunk in chunks(chunk_names, DELETE_PARAMETERS_BATCH_SIZE):
+        ssm_client.delete_parameters(Names=chunk)
+    return len(chunk_names)
+
+
+def iter_parameters_by_path(
     ssm_client,
+    path: str,
+    recursive: bool = True,
+    with_decryption: bool = True,
+    filters: T.Optional[T.List[dict]] = None,
+    page_size: int = 10,
+    prefetch: bool = False,
+) -> T.Iterator[Parameter]:
+    """
+    Iterate all parameters under a hierarchy path. It follows the ``NextToken``
+    lazily and yield :class:`Parameter` objects as each page arrives, so a
+    huge parameter tree never sits in memory as one list.
+
+    :param path: the hierarchy path, for example ``/myapp/prod``
+    :param recursive: also return parameters in the sub paths?
+    :param with_decryption: decrypt SecureString in the same call
+    :param filters: the ``ParameterFilters`` argument of the API, see official
+        document.
+    :param page_size: number of parameters per page, the max value is 10.
+    :param prefetch: if True, the next page is downloaded in a background
+        thread while the caller is processing the current page.
+
+    Ref:
+
+    - get_parameters_by_path: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.get_parameters_by_path
+
+    .. note::
+
+        The chunks of chunked parameters are not yielded, the chunked
+        parameters are yielded with the reassembled value.
+    """
+    kwargs = dict(
+        Path=path,
+        Recursive=recursive,
+        WithDecryption=with_decryption,
+        MaxResults=page_size,
+    )
+    if filters is not None:
+        kwargs["ParameterFilters"] = filters
+
+    def get_page(next_token: T.Optional[str]) -> dict:
+        if next_token is None:
+            return ssm_client.get_parameters_by_path(**kwargs)
+        else:
+            return ssm_client.get_parameters_by_path(NextToken=next_token, **kwargs)
+
+    def parse_page(response: dict) -> T.List[Parameter]:
+        parameters = [
+            Parameter._from_parameter_dict(dct)
+            for dct in response.get("Parameters", [])
+            if not is_chunk_name(dct["Name"])
+        ]
+        _load_chunks(ssm_client, parameters)
+        return parameters
+
+    if prefetch is False:
+        next_token = None
+        while 1:
+            response = get_page(next_token)
+            yield from parse_page(response)
+            next_token = response.get("NextToken")
+            if next_token is None:
+                break
+    else:
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(get_page, None)
+            while future is not None:
+                response = future.result()
+                next_token = response.get("NextToken")
+                if next_token is None:
+                    future = None
+                else:
+                    future = executor.submit(get_page, next_token)
+                yield from parse_page(response)
+        finally:
+            executor.shutdown(wait=False)
+
+
+def iter_parameter_history(
+    ssm_client,
+    name: str,
+    with_decryption: bool = True,
+    page_size: int = 50,
+) -> T.Iterator[Parameter]:
+    """
+    Iterate all versions of a parameter from the oldest to the latest.
+    It follows the ``NextToken`` lazily.
+
+    Each version is a :class:`Parameter` object with the ``Labels`` attached
+    to that version. The ``ARN`` attribute is not available in history.
+
+    :param name: the parameter name.
+    :param with_decryption: decrypt SecureString in the same call.
+    :param page_size: number of versions per page, the max value is 50.
+
+    Ref:
+
+    - get_parameter_history: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.get_parameter_history
+    """
+    kwargs = dict(
+        Name=name,
+        WithDecryption=with_decryption,
+        MaxResults=page_size,
+    )
+    while 1:
+        response = ssm_client.get_parameter_history(**kwargs)
+        for dct in response.get("Parameters", []):
+            yield Parameter._from_parameter_history_dict(dct)
+        next_token = response.get("NextToken")
+        if next_token is None:
+            break
+        kwargs["NextToken"] = next_token
+
+
+class ParameterHistory:
+    """
+    An in-memory index of all versions of a parameter. It maps version and
+    label to the :class:`Parameter` object in O(1), so rollback and audit tools
+    can resolve ``name:version`` or ``name:label`` locally without extra
+    ``get_parameter`` calls.
+
+    Example::
+
+        >>> history = ParameterHistory.load(ssm_client, "/myapp/config")
+        >>> history.latest.Version
+        3
+        >>> history.resolve("/myapp/config:prod").Version
+        2
+        >>> history.resolve("1").Value
+        'the first value'
+
+    :param name: the parameter name.
+    :param parameters: all versions of the parameter.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        parameters: T.Iterable[Parameter],
+    ):
+        self.name = name
+        self.parameters: T.List[Parameter] = sorted(
+            parameters, key=lambda param: param.Version
+        )
+        self._by_version: T.Dict[int, Parameter] = {
+            param.Version: param for param in self.parameters
+        }
+        self._by_label: T.Dict[str, Parameter] = {
+            label: param for param in self.parameters for label in param.Labels
+        }
+
+    @classmethod
+    def load(
+        cls,
+        ssm_client,
+        name: str,
+        with_decryption: bool = True,
+    ) -> "ParameterHistory":
+        """
+        Load all versions with :func:`iter_parameter_history`.
+        """
+        return cls(
+            name=name,
+            parameters=iter_parameter_history(
+                ssm_client,
+                name,
+                with_decryption=with_decryption,
+            ),
+        )
+
+    def __len__(self) -> int:
+        return len(self.parameters)
+
+    @property
+    def versions(self) -> T.List[int]:
+        return [param.Version for param in self.parameters]
+
+    @property
+    def labels(self) -> T.Dict[str, int]:
+        """
+        The label to version mapping.
+        """
+        return {label: param.Version for label, param in self._by_label.items()}
+
+    @property
+    def latest(self) -> T.Optional[Parameter]:
+        if len(self.parameters):
+            return self.parameters[-1]
+        return None
+
+    def get_version(self, version: int) -> T.Optional[Parameter]:
+        return self._by_version.get(version)
+
+    def get_label(self, label: str) -> T.Optional[Parameter]:
+        return self._by_label.get(label)
+
+    def resolve(self, selector: T.Union[str, int]) -> T.Optional[Parameter]:
+        """
+        Resolve a selector to a parameter version locally.
+
+        :param selector: could be one of the following:
+            - an integer version, for example ``3``
+            - a version or label string, for example ``"3"`` or ``"prod"``
+            - the full selector, for example ``"/myapp/config:3"`` or
+                ``"/myapp/config:prod"``
+            - the parameter name only, for example ``"/myapp/config"``,
+                it resolves to the latest version
+
+        :return: None if the version or label doesn't exist.
+        """
+        if isinstance(selector, int):
+            return self.get_version(selector)
+        if selector == self.name:
+            return self.latest
+        if selector.startswith(f"{self.name}:"):
+            selector = selector[len(self.name) + 1 :]
+        if selector.isdigit():
+            return self.get_version(int(selector))
+        return self.get_label(selector)
+
+
+def _build_put_parameter_kwargs(
     name: str,
     data: T.Union[str, list, dict, T.Any],
     description: T.Optional[str] = None,
@@ -372,50 +1076,14 @@ def deploy_parameter(
     tier_is_advanced: bool = False,
     tier_is_intelligent: bool = False,
     policies: T.Optional[str] = None,
-    tags: T.Optional[T.Dict[str, str]] = None,
     overwrite: bool = False,
-    skip_if_duplicated: bool = True,
-) -> T.Optional[Parameter]:
+) -> T.Tuple[dict, bool]:
     """
-    Create or Update a parameter.
-
-    Ref:
-
-    - put_parameter: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.put_parameter
+    Validate the :func:`deploy_parameter` arguments and build the
+    ``put_parameter`` API arguments.
 
-    Note:
-
-        - you cannot change tags when overwriting parameter, you have to call
-            ``add_tags_to_resource`` API after overwriting.
-
-    :param ssm_client: boto3 system manager client
-    :param name: the parameter name
-    :param data: the parameter data, could be one of the following:
-        - a string
-        - a list of string
-        - a list of object
-        - a dict object
-        - arbitrary jsonpicklible python object
-    :param description: description of the parameter
-    :param type_is_string: is it String type?
-    :param type_is_string_list: is it StringList type?
-    :param type_is_secure_string: is it SecureString type?
-    :param kms_key_id: user defined KMS key id for encryption
-    :param use_default_kms_key: if true, then you can omit the ``kms_key_id``
-        field, and it will use the default ``alias/aws/ssm`` kms key to encrypt
-        your data, and the type become Se
-    :param tier_is_standard: is this standard tier?
-    :param tier_is_advanced: is this advanced tier?
-    :param tier_is_intelligent: is this intelligent tier?
-    :param policies: access policy
-    :param tags: if None, then don't update tags. if empty dict, then delete tags,
-        if non-empty dict, then do full replacement update.
-    :param overwrite: if False, then raise error when overwriting an existing parameter
-    :param skip_if_duplicated: if True, then won't do deployment if parameter data
-        is the same as the one in the latest version.
-
-    :return: None or an :class:`Parameter` object, None means that the deployment
-        doesn't happen.
+    :return: a tuple of two items, the ``put_parameter`` kwargs and a boolean
+        flag to indicate whether the parameter is encrypted.
     """
     # --------------------------------------------------------------------------
     # input argument pre processing
@@ -528,6 +1196,174 @@ def deploy_parameter(
     if overwrite:
         put_parameter_kwargs["Overwrite"] = overwrite
 
+    return put_parameter_kwargs, with_encryption
+
+
+def _set_create_parameter_kwargs(
+    put_parameter_kwargs: dict,
+    tags: T.Optional[T.Dict[str, str]] = None,
+):
+    """
+    Update the ``put_parameter`` arguments in place to create a new parameter,
+    the tags can only be set in creation.
+    """
+    if tags:
+        put_parameter_kwargs["Tags"] = encode_tags(tags)
+    put_parameter_kwargs.pop("Overwrite", None)
+
+
+def _put_parameter(
+    ssm_client,
+    put_parameter_kwargs: dict,
+    chunked: bool = False,
+    compression: str = CompressionEnum.zlib.value,
+    max_workers: T.Optional[int] = None,
+) -> Parameter:
+    """
+    Call the ``put_parameter`` API. If ``chunked`` is True and the value
+    exceeds the size limit of the tier, the value is compressed and written
+    into ``${name}/__chunk__/${index}`` parameters first, then the manifest
+    is written into the parameter itself. So the reader never sees a manifest
+    that points to missing chunks.
+
+    The chunks that are not used by the new manifest are kept, so the old
+    versions of the parameter can still be reassembled. They are deleted
+    by :func:`delete_parameter` with ``delete_chunks=True``.
+
+    :param max_workers: max number of threads to write the chunks, if 1,
+        the chunks are written in the current thread.
+    """
+    name = put_parameter_kwargs["Name"]
+    value = put_parameter_kwargs["Value"]
+    chunk_size = get_value_size_limit(put_parameter_kwargs.get("Tier"))
+    manifest = None
+    if chunked and (len(value.encode("utf-8")) > chunk_size):
+        manifest, chunk_values = split_value(value, chunk_size, compression)
+        chunk_kwargs = dict(Overwrite=True)
+        if put_parameter_kwargs.get("Type") == ParameterTypeEnum.secure_string.value:
+            chunk_kwargs["Type"] = ParameterTypeEnum.secure_string.value
+            chunk_kwargs["KeyId"] = put_parameter_kwargs["KeyId"]
+        else:
+            chunk_kwargs["Type"] = ParameterTypeEnum.string.value
+        if "Tier" in put_parameter_kwargs:
+            chunk_kwargs["Tier"] = put_parameter_kwargs["Tier"]
+
+        def put_chunk(args: T.Tuple[int, str]) -> int:
+            index, chunk_value = args
+            response = ssm_client.put_parameter(
+                Name=get_chunk_name(name, index),
+                Value=chunk_value,
+                **chunk_kwargs,
+            )
+            return response["Version"]
+
+        manifest.chunks = concurrent_map(
+            put_chunk,
+            enumerate(chunk_values),
+            max_workers=max_workers,
+        )
+        put_parameter_kwargs = dict(put_parameter_kwargs, Value=manifest.to_json())
+
+    response = ssm_client.put_parameter(**put_parameter_kwargs)
+    parameter = Parameter._from_put_parameter_response(put_parameter_kwargs, response)
+    if manifest is not None:
+        parameter.Value = value
+        parameter.Manifest = manifest
+    return parameter
+
+
+def deploy_parameter(
+    ssm_client,
+    name: str,
+    data: T.Union[str, list, dict, T.Any],
+    description: T.Optional[str] = None,
+    type_is_string: bool = False,
+    type_is_string_list: bool = False,
+    type_is_secure_string: bool = False,
+    kms_key_id: T.Optional[str] = None,
+    use_default_kms_key: T.Optional[bool] = False,
+    tier_is_standard: bool = False,
+    tier_is_advanced: bool = False,
+    tier_is_intelligent: bool = False,
+    policies: T.Optional[str] = None,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    overwrite: bool = False,
+    skip_if_duplicated: bool = True,
+    chunked: bool = False,
+    compression: str = CompressionEnum.zlib.value,
+    max_workers: T.Optional[int] = None,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> T.Optional[Parameter]:
+    """
+    Create or Update a parameter.
+
+    Ref:
+
+    - put_parameter: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.put_parameter
+
+    Note:
+
+        - you cannot change tags when overwriting parameter, you have to call
+            ``add_tags_to_resource`` API after overwriting.
+
+    :param ssm_client: boto3 system manager client
+    :param name: the parameter name
+    :param data: the parameter data, could be one of the following:
+        - a string
+        - a list of string
+        - a list of object
+        - a dict object
+        - arbitrary jsonpicklible python object
+    :param description: description of the parameter
+    :param type_is_string: is it String type?
+    :param type_is_string_list: is it StringList type?
+    :param type_is_secure_string: is it SecureString type?
+    :param kms_key_id: user defined KMS key id for encryption
+    :param use_default_kms_key: if true, then you can omit the ``kms_key_id``
+        field, and it will use the default ``alias/aws/ssm`` kms key to encrypt
+        your data, and the type become Se
+    :param tier_is_standard: is this standard tier?
+    :param tier_is_advanced: is this advanced tier?
+    :param tier_is_intelligent: is this intelligent tier?
+    :param policies: access policy
+    :param tags: if None, then don't update tags. if empty dict, then delete tags,
+        if non-empty dict, then do full replacement update.
+    :param overwrite: if False, then raise error when overwriting an existing parameter
+    :param skip_if_duplicated: if True, then won't do deployment if parameter data
+        is the same as the one in the latest version.
+    :param chunked: if True and the value exceeds the size limit of the tier
+        (4KB for Standard, 8KB for Advanced), the value is compressed, base64
+        encoded and split into ``${name}/__chunk__/${index}`` parameters, and
+        a manifest with the chunk versions and the checksum is stored in the
+        parameter itself. :meth:`Parameter.load` reassembles it transparently.
+        Description, policies and tags are only applied to the parameter itself.
+    :param compression: the compression algorithm for chunked storage,
+        ``"zlib"`` or ``"zstd"`` (requires ``zstandard``), see
+        :class:`~pysecret.aws.chunking.CompressionEnum`.
+    :param max_workers: max number of threads to write the chunks.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
+    :return: None or an :class:`Parameter` object, None means that the deployment
+        doesn't happen.
+    """
+    ssm_client = throttle_client(ssm_client, rate_limiter)
+    put_parameter_kwargs, with_encryption = _build_put_parameter_kwargs(
+        name=name,
+        data=data,
+        description=description,
+        type_is_string=type_is_string,
+        type_is_string_list=type_is_string_list,
+        type_is_secure_string=type_is_secure_string,
+        kms_key_id=kms_key_id,
+        use_default_kms_key=use_default_kms_key,
+        tier_is_standard=tier_is_standard,
+        tier_is_advanced=tier_is_advanced,
+        tier_is_intelligent=tier_is_intelligent,
+        policies=policies,
+        overwrite=overwrite,
+    )
+
     # --------------------------------------------------------------------------
     # create or update
     # --------------------------------------------------------------------------
@@ -541,13 +1377,13 @@ def deploy_parameter(
         )
         # if not exists, do create
         if parameter is None:
-            if tags:
-                put_parameter_kwargs["Tags"] = encode_tags(tags)
-            if overwrite:
-                put_parameter_kwargs.pop("Overwrite")
-            response = ssm_client.put_parameter(**put_parameter_kwargs)
-            return Parameter._from_put_parameter_response(
-                put_parameter_kwargs, response
+            _set_create_parameter_kwargs(put_parameter_kwargs, tags)
+            return _put_parameter(
+                ssm_client,
+                put_parameter_kwargs,
+                chunked=chunked,
+                compression=compression,
+                max_workers=max_workers,
             )
         # if already exists, compare the parameter data
         else:
@@ -557,21 +1393,170 @@ def deploy_parameter(
                 return None
             # if not same, do update
             else:
-                response = ssm_client.put_parameter(**put_parameter_kwargs)
-                put_parameter_tags(ssm_client, name, tags)
-                return Parameter._from_put_parameter_response(
-                    put_parameter_kwargs, response
+                new_parameter = _put_parameter(
+                    ssm_client,
+                    put_parameter_kwargs,
+                    chunked=chunked,
+                    compression=compression,
+                    max_workers=max_workers,
                 )
+                put_parameter_tags(ssm_client, name, tags)
+                return new_parameter
     # don't duplication check, just update
     else:
-        response = ssm_client.put_parameter(**put_parameter_kwargs)
+        new_parameter = _put_parameter(
+            ssm_client,
+            put_parameter_kwargs,
+            chunked=chunked,
+            compression=compression,
+            max_workers=max_workers,
+        )
         put_parameter_tags(ssm_client, name, tags)
-        return Parameter._from_put_parameter_response(put_parameter_kwargs, response)
+        return new_parameter
+
+
+@dataclasses.dataclass
+class ParameterSpec:
+    """
+    The specification of a parameter to deploy, it is used in
+    :func:`deploy_parameters`. The attributes are the same as the arguments
+    of :func:`deploy_parameter`.
+    """
+
+    name: str = dataclasses.field()
+    data: T.Union[str, list, dict, T.Any] = dataclasses.field()
+    description: T.Optional[str] = dataclasses.field(default=None)
+    type_is_string: bool = dataclasses.field(default=False)
+    type_is_string_list: bool = dataclasses.field(default=False)
+    type_is_secure_string: bool = dataclasses.field(default=False)
+    kms_key_id: T.Optional[str] = dataclasses.field(default=None)
+    use_default_kms_key: T.Optional[bool] = dataclasses.field(default=False)
+    tier_is_standard: bool = dataclasses.field(default=False)
+    tier_is_advanced: bool = dataclasses.field(default=False)
+    tier_is_intelligent: bool = dataclasses.field(default=False)
+    policies: T.Optional[str] = dataclasses.field(default=None)
+    tags: T.Optional[T.Dict[str, str]] = dataclasses.field(default=None)
+    overwrite: bool = dataclasses.field(default=False)
+    skip_if_duplicated: bool = dataclasses.field(default=True)
+    chunked: bool = dataclasses.field(default=False)
+    compression: str = dataclasses.field(default=CompressionEnum.zlib.value)
+
+
+def deploy_parameters(
+    ssm_client,
+    specs: T.Iterable[ParameterSpec],
+    max_workers: T.Optional[int] = None,
+    dry_run: bool = False,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> T.List[DeployResult]:
+    """
+    Create or Update many parameters concurrently.
+
+    1. validate all specs and build the ``put_parameter`` arguments, it raises
+        error before any write happens if any spec is invalid.
+    2. batch fetch the current state with the ``get_parameters`` API
+        (see :meth:`Parameter.load_many`).
+    3. compute a create / update / skip plan locally, the rule is the same
+        as :func:`deploy_parameter`.
+    4. run only the needed writes on a bounded thread pool.
+
+    :param specs: list of :class:`ParameterSpec`.
+    :param max_workers: max number of threads to use.
+    :param dry_run: if True, only compute the plan, don't write anything.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
+    :return: list of :class:`~pysecret.aws.bulk.DeployResult` in the same
+        order as the ``specs``. The error of a failed deployment is stored in
+        the :attr:`~pysecret.aws.bulk.DeployResult.error` attribute instead
+        of being raised, so one failure doesn't stop the others.
+    """
+    ssm_client = throttle_client(ssm_client, rate_limiter)
+    specs = list(specs)
+    names = [spec.name for spec in specs]
+    if len(names) != len(set(names)):
+        raise ValueError("the parameter names in specs have to be unique!")
+
+    # --- build put_parameter arguments
+    put_parameter_kwargs_list = list()
+    for spec in specs:
+        put_parameter_kwargs, _ = _build_put_parameter_kwargs(
+            name=spec.name,
+            data=spec.data,
+            description=spec.description,
+            type_is_string=spec.type_is_string,
+            type_is_string_list=spec.type_is_string_list,
+            type_is_secure_string=spec.type_is_secure_string,
+            kms_key_id=spec.kms_key_id,
+            use_default_kms_key=spec.use_default_kms_key,
+            tier_is_standard=spec.tier_is_standard,
+            tier_is_advanced=spec.tier_is_advanced,
+            tier_is_intelligent=spec.tier_is_intelligent,
+            policies=spec.policies,
+            overwrite=spec.overwrite,
+        )
+        put_parameter_kwargs_list.append(put_parameter_kwargs)
+
+    # --- fetch current state
+    parameters, _ = Parameter.load_many(
+        ssm_client,
+        names,
+        with_decryption=True,
+        max_workers=max_workers,
+    )
+    existing_parameters = {parameter.Name: parameter for parameter in parameters}
+
+    # --- compute plan
+    plan: T.List[T.Tuple[ParameterSpec, dict, str]] = list()
+    for spec, put_parameter_kwargs in zip(specs, put_parameter_kwargs_list):
+        parameter = existing_parameters.get(spec.name)
+        if parameter is None:
+            action = DeployActionEnum.create.value
+            if spec.tags:
+                put_parameter_kwargs["Tags"] = encode_tags(spec.tags)
+            put_parameter_kwargs.pop("Overwrite", None)
+        elif spec.skip_if_duplicated and (
+            parameter.Value == put_parameter_kwargs["Value"]
+        ):
+            action = DeployActionEnum.skip.value
+        else:
+            action = DeployActionEnum.update.value
+        plan.append((spec, put_parameter_kwargs, action))
+
+    if dry_run:
+        return [DeployResult(name=spec.name, action=action) for spec, _, action in plan]
+
+    # --- execute
+    def execute(
+        args: T.Tuple[ParameterSpec, dict, str],
+    ) -> DeployResult:
+        spec, put_parameter_kwargs, action = args
+        result = DeployResult(name=spec.name, action=action)
+        try:
+            if action != DeployActionEnum.skip.value:
+                result.resource = _put_parameter(
+                    ssm_client,
+                    put_parameter_kwargs,
+                    chunked=spec.chunked,
+                    compression=spec.compression,
+                    # already in a worker of the bounded thread pool
+                    max_workers=1,
+                )
+            if action != DeployActionEnum.create.value:
+                put_parameter_tags(ssm_client, spec.name, spec.tags)
+        except Exception as e:
+            result.error = e
+        return result
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(execute, plan))
 
 
 def delete_parameter(
     ssm_client,
     name: str,
+    delete_chunks: bool = False,
+    rate_limiter: T.Optional[RateLimiter] = None,
 ) -> bool:
     """
     Delete a Parameter.
@@ -580,13 +1565,128 @@ def delete_parameter(
 
     - delete_parameter: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.delete_parameter
 
+    :param delete_chunks: if True, also delete the chunks of the chunked
+        parameter (see ``chunked`` argument in :func:`deploy_parameter`),
+        it costs one more ``get_parameters_by_path`` API call. It is off by
+        default, so deleting a regular parameter is still one API call.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
     :return: a boolean value to indicate whether a deletion happened.
     """
+    ssm_client = throttle_client(ssm_client, rate_limiter)
     try:
         ssm_client.delete_parameter(Name=name)
-        return True
+        deleted = True
     except Exception as e:
         if "ParameterNotFound" in str(e):
-            return False
+            deleted = False
         else:  # pragma: no cover
             raise e
+    if delete_chunks:
+        _delete_chunks(ssm_client, name)
+    return deleted
+
+
+def delete_parameters(
+    ssm_client,
+    names: T.Optional[T.Iterable[str]] = None,
+    path: T.Optional[str] = None,
+    recursive: bool = True,
+    delete_chunks: bool = False,
+    max_workers: T.Optional[int] = None,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> T.Tuple[T.Set[str], T.Set[str]]:
+    """
+    Delete many parameters with the batch ``delete_parameters`` API. Names are
+    grouped into chunks of 10 (the API limit) and the chunks are deleted
+    concurrently.
+
+    Ref:
+
+    - delete_parameters: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.delete_parameters
+    - describe_parameters: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/ssm.html#SSM.Client.describe_parameters
+
+    :param names: the parameter names to delete.
+    :param path: if set, also delete all parameters under this hierarchy path,
+        they are listed with the ``describe_parameters`` API. The chunks of
+        the chunked parameters in the listing are skipped, they are only
+        deleted by ``delete_chunks``.
+    :param recursive: also delete the parameters in the sub paths of ``path``?
+    :param delete_chunks: if True, also delete the chunks of the chunked
+        parameters (see ``chunked`` argument in :func:`deploy_parameter`),
+        they are found with one ``describe_parameters`` call per 50 names.
+        It is off by default to avoid these calls.
+    :param max_workers: max number of threads to use.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
+    :return: a tuple of two sets, the deleted parameter names, and the
+        parameter names that don't exist (the ``InvalidParameters`` field
+        in the response). The chunks found by ``delete_chunks`` are not
+        included.
+    """
+    ssm_client = throttle_client(ssm_client, rate_limiter)
+    names = list(dict.fromkeys(names or []))
+    if path is not None:
+        parameter_filters = [
+            {
+                "Key": "Path",
+                "Option": "Recursive" if recursive else "OneLevel",
+                "Values": [path],
+            }
+        ]
+        names = list(
+            dict.fromkeys(
+                names
+                + [
+                    dct["Name"]
+                    for dct in _iter_describe_parameters(ssm_client, parameter_filters)
+                    # the chunks are handled by ``delete_chunks``
+                    if not is_chunk_name(dct["Name"])
+                ]
+            )
+        )
+    if len(names) == 0:
+        return set(), set()
+
+    def find_chunks(chunk: T.List[str]) -> T.List[str]:
+        parameter_filters = [
+            {
+                "Key": "Name",
+                "Option": "BeginsWith",
+                "Values": [f"{get_chunk_path(name)}/" for name in chunk],
+            }
+        ]
+        return [
+            dct["Name"]
+            for dct in _iter_describe_parameters(ssm_client, parameter_filters)
+            if is_chunk_name(dct["Name"])
+        ]
+
+    def delete(chunk: T.List[str]) -> dict:
+        return ssm_client.delete_parameters(Names=chunk)
+
+    deleted: T.Set[str] = set()
+    invalid: T.Set[str] = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for response in executor.map(
+            delete, chunks(names, DELETE_PARAMETERS_BATCH_SIZE)
+        ):
+            deleted.update(response.get("DeletedParameters", []))
+            invalid.update(response.get("InvalidParameters", []))
+
+        if delete_chunks:
+            name_set = set(names)
+            parent_names = [name for name in names if not is_chunk_name(name)]
+            chunk_names = list()
+            for found in executor.map(
+                find_chunks,
+                chunks(parent_names, DESCRIBE_PARAMETERS_FILTER_VALUES_LIMIT),
+            ):
+                chunk_names.extend(name for name in found if name not in name_set)
+            list(
+                executor.map(delete, chunks(chunk_names, DELETE_PARAMETERS_BATCH_SIZE))
+            )
+
+    return deleted, invalid
@@ -5,13 +5,185 @@ AWS Secret Manager support.
 """
 
 import typing as T
+import io
 import json
+import hashlib
+import threading
 
 import dataclasses
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from ..compat import cached_property
-from ..js_helper import strip_comments
+from ..helper import chunks, concurrent_map
+from ..json_codec import loads as json_loads
+from .bulk import DeployActionEnum, DeployResult
+from .tagging import encode_tags, decode_tags, reconcile_tags
+from .throttle import RateLimiter, throttle_client
+from .chunking import (
+    CompressionEnum,
+    ChunkManifest,
+    ChunkReader,
+    get_secret_chunk_prefix,
+    get_secret_chunk_name,
+    is_chunk_name,
+    split_binary,
+    join_binary,
+)
+
+BATCH_GET_SECRET_VALUE_BATCH_SIZE = 20
+LIST_SECRETS_PAGE_SIZE = 100
+LIST_SECRETS_FILTER_VALUES_LIMIT = 10
+SECRET_VALUE_SIZE_LIMIT = 65536
+
+#: the reserved tag key to store the sha256 content hash of the secret value,
+#: see ``use_content_hash`` in :func:`deploy_secret`
+CONTENT_HASH_TAG_KEY = "pysecret:sha256"
+
+
+def get_content_hash(content: bytes) -> str:
+    """
+    Get the sha256 hex digest of the secret value.
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def get_secret_tags(
+    sm_client,
+    name_or_arn: str,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> T.Dict[str, str]:
+    """
+    Get secret tags.
+
+    Ref:
+
+    - describe_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.describe_secret
+
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
+    :return: return empty dict if secret doesn't have tags. otherwise,
+        return tags in format of key value dict.
+    """
+    sm_client = throttle_client(sm_client, rate_limiter)
+    response = sm_client.describe_secret(SecretId=name_or_arn)
+    return decode_tags(response.get("Tags", []))
+
+
+def remove_secret_tags(
+    sm_client,
+    name_or_arn: str,
+    tag_keys: T.List[str],
+    rate_limiter: T.Optional[RateLimiter] = None,
+):
+    """
+    Delete secret tags.
+
+    Ref:
+
+    - untag_resource: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.untag_resource
+
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+    """
+    sm_client = throttle_client(sm_client, rate_limiter)
+    sm_client.untag_resource(
+        SecretId=name_or_arn,
+        TagKeys=tag_keys,
+    )
+
+
+def update_secret_tags(
+    sm_client,
+    name_or_arn: str,
+    tags: T.Dict[str, str],
+    rate_limiter: T.Optional[RateLimiter] = None,
+):
+    """
+    Create or update (partial update) tags.
+
+    Ref:
+
+    - tag_resource: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.tag_resource
+
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+    """
+    sm_client = throttle_client(sm_client, rate_limiter)
+    sm_client.tag_resource(
+        SecretId=name_or_arn,
+        Tags=encode_tags(tags),
+    )
+
+
+def put_secret_tags(
+    sm_client,
+    name_or_arn: str,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    rate_limiter: T.Optional[RateLimiter] = None,
+):
+    """
+    Full replacement update tags.
+
+    - if None, then do nothing
+    - if empty dict, then delete tags
+    - if non-empty dict, then do full replacement update
+
+    Only the keys to remove and the keys / values to add are sent to AWS,
+    no write API call happens if the tags already match.
+
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+    """
+    if tags is None:
+        return
+    sm_client = throttle_client(sm_client, rate_limiter)
+
+    reconcile_tags(
+        existing_tags=get_secret_tags(sm_client, name_or_arn),
+        desired_tags=tags,
+        remove_tags=lambda tag_keys: remove_secret_tags(
+            sm_client, name_or_arn, tag_keys
+        ),
+        add_tags=lambda tags_: update_secret_tags(sm_client, name_or_arn, tags_),
+    )
+
+
+def _build_get_secret_value_kwargs(
+    name_or_arn: str,
+    version_id: T.Optional[str] = None,
+    version_stage: T.Optional[str] = None,
+) -> dict:
+    """
+    Build the ``get_secret_value`` arguments for :meth:`Secret.load`.
+    """
+    kwargs = dict(SecretId=name_or_arn)
+    if version_id:
+        kwargs["VersionId"] = version_id
+    if version_stage:
+        kwargs["VersionStage"] = version_stage
+    return kwargs
+
+
+def _parse_batch_get_secret_value_response(
+    response: dict,
+    secrets: T.List["Secret"],
+    errors: T.Dict[str, str],
+) -> T.Optional[str]:
+    """
+    Append the secrets and the errors in a ``batch_get_secret_value`` API
+    response to ``secrets`` and ``errors`` in place.
+
+    :return: the ``NextToken`` of the response.
+    """
+    for dct in response.get("SecretValues", []):
+        secrets.append(Secret._from_secret_value_dict(dct))
+    for dct in response.get("Errors", []):
+        errors[dct["SecretId"]] = "{}: {}".format(
+            dct.get("ErrorCode"), dct.get("Message")
+        )
+    return response.get("NextToken")
 
 
 @dataclasses.dataclass
@@ -25,6 +197,10 @@ class Secret:
     - if you know what data type to expect in the secret, please use
         :meth:`Secret.binary`, :meth:`Secret.string`, :meth:`Secret.json_dict`,
         :meth:`Secret.json_list` to access the data.
+    - for a chunked secret (see ``chunked`` in :func:`deploy_secret`), the
+        ``SecretString`` is the manifest, the ``Chunks`` are the compressed
+        chunks, use :meth:`Secret.open` or :attr:`Secret.view` to read the
+        value without joining the chunks.
     """
     ARN: str = dataclasses.field()
     Name: str = dataclasses.field()
@@ -33,16 +209,37 @@ class Secret:
     SecretBinary: T.Optional[bytes] = dataclasses.field(default=None)
     SecretString: T.Optional[str] = dataclasses.field(default=None)
     VersionStages: T.List[str] = dataclasses.field(default_factory=list)
+    Manifest: T.Optional[ChunkManifest] = dataclasses.field(default=None)
+    Chunks: T.Optional[T.List[bytes]] = dataclasses.field(default=None, repr=False)
+
+    @property
+    def is_chunked(self) -> bool:
+        """
+        Is the value stored in chunks?
+        """
+        return self.Manifest is not None
 
     @cached_property
-    def fingerprint(self) -> bytes:
+    def content_hash(self) -> str:
         """
-        The fingerprint of the content. Can be used for comparison.
+        The sha256 hex digest of the secret value, it is the value of the
+        :data:`CONTENT_HASH_TAG_KEY` tag (see ``use_content_hash`` in
+        :func:`deploy_secret`).
         """
-        if self.SecretBinary is not None:
-            return self.SecretBinary
+        if self.Manifest is not None:
+            return self.Manifest.sha256
+        elif self.SecretBinary is not None:
+            return get_content_hash(self.SecretBinary)
         else:
-            return self.SecretString.encode("utf-8")
+            return get_content_hash(self.SecretString.encode("utf-8"))
+
+    @property
+    def fingerprint(self) -> bytes:
+        """
+        The fingerprint of the content, it is the 32 bytes sha256 digest of
+        the secret value. Can be used for comparison.
+        """
+        return bytes.fromhex(self.content_hash)
 
     @classmethod
     def load(
@@ -51,6 +248,8 @@ class Secret:
         name_or_arn: str,
         version_id: T.Optional[str] = None,
         version_stage: T.Optional[str] = None,
+        load_chunks: bool = True,
+        rate_limiter: T.Optional[RateLimiter] = None,
     ) -> T.Optional["Secret"]:
         """
         Load secret data.
@@ -60,30 +259,182 @@ class Secret:
         - describe_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.describe_secret
         - get_secret_value: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.get_secret_value
         - list_secret_version_ids: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.list_secret_version_ids
+
+        :param version_id: load this exact version, see
+            :class:`SecretVersionIndex` to resolve it locally.
+        :param version_stage: load the version that has this staging label,
+            for example ``"AWSPREVIOUS"``. If neither ``version_id`` nor
+            ``version_stage`` is set, load the ``AWSCURRENT`` version.
+        :param load_chunks: if False, the chunked secret only has the
+            ``Manifest``, the ``Chunks`` are not loaded.
+        :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+            to throttle and retry the API calls, if None, no rate limiting.
         """
-        # --- resolve arguments
-        kwargs = dict(SecretId=name_or_arn)
-        if version_id:  # pragma: no cover
-            kwargs["VersionId"] = version_id
-        if version_id:  # pragma: no cover
-            kwargs["VersionStage"] = version_stage
+        sm_client = throttle_client(sm_client, rate_limiter)
+        kwargs = _build_get_secret_value_kwargs(
+            name_or_arn,
+            version_id=version_id,
+            version_stage=version_stage,
+        )
 
         try:
             response = sm_client.get_secret_value(**kwargs)
-            return cls(
-                ARN=response["ARN"],
-                Name=response["Name"],
-                VersionId=response["VersionId"],
-                SecretBinary=response.get("SecretBinary"),
-                SecretString=response.get("SecretString"),
-                CreatedDate=response["CreatedDate"],
-                VersionStages=response.get("VersionStages", []),
-            )
         except Exception as e:
             if "ResourceNotFoundException" in str(e):
                 return None
             else:  # pragma: no cover
                 raise e
+        secret = cls._from_secret_value_dict(response)
+        if load_chunks:
+            _load_secret_chunks(sm_client, [secret])
+        return secret
+
+    @classmethod
+    def _batch_get_secret_value(
+        cls,
+        sm_client,
+        kwargs: dict,
+    ) -> T.Tuple[T.List["Secret"], T.Dict[str, str]]:
+        """
+        Call the ``batch_get_secret_value`` API and follow the pagination.
+        """
+        secrets: T.List["Secret"] = list()
+        errors: T.Dict[str, str] = dict()
+        kwargs = dict(kwargs)
+        while 1:
+            response = sm_client.batch_get_secret_value(**kwargs)
+            next_token = _parse_batch_get_secret_value_response(
+                response, secrets, errors
+            )
+            if next_token:
+                kwargs["NextToken"] = next_token
+            else:
+                break
+        return secrets, errors
+
+    @classmethod
+    def load_many(
+        cls,
+        sm_client,
+        names_or_arns: T.Iterable[str],
+        max_workers: T.Optional[int] = None,
+        load_chunks: bool = True,
+        rate_limiter: T.Optional[RateLimiter] = None,
+    ) -> T.Tuple[T.List["Secret"], T.Dict[str, str]]:
+        """
+        Load the current version (``AWSCURRENT``) of many secrets with the
+        ``batch_get_secret_value`` API. Names or ARNs are grouped into chunks
+        of 20 (the API limit) and the chunks are fetched concurrently.
+
+        :param names_or_arns: the secret names or ARNs.
+        :param max_workers: max number of threads to use.
+        :param load_chunks: if True, also load the chunks of the chunked
+            secrets, see :meth:`Secret.load`.
+        :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+            to throttle and retry the API calls, if None, no rate limiting.
+
+        :return: a tuple of two items, the first one is the list of found
+            :class:`Secret` in the same order as ``names_or_arns``, the second
+            one is the error map, the key is the secret name or ARN, the value
+            is the ``${ErrorCode}: ${Message}`` error message, for example the
+            not found or access denied secrets.
+
+        Ref:
+
+        - batch_get_secret_value: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.batch_get_secret_value
+        """
+        sm_client = throttle_client(sm_client, rate_limiter)
+        names_or_arns = list(dict.fromkeys(names_or_arns))
+        if len(names_or_arns) == 0:
+            return [], {}
+
+        secrets: T.List["Secret"] = list()
+        errors: T.Dict[str, str] = dict()
+        id_chunks = chunks(names_or_arns, BATCH_GET_SECRET_VALUE_BATCH_SIZE)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for secrets_, errors_ in executor.map(
+                lambda chunk: cls._batch_get_secret_value(
+                    sm_client, dict(SecretIdList=chunk)
+                ),
+                id_chunks,
+            ):
+                secrets.extend(secrets_)
+                errors.update(errors_)
+
+        if load_chunks:
+            _load_secret_chunks(sm_client, secrets, max_workers=max_workers)
+
+        # return the secrets in the same order as the input names or arns
+        order = {name_or_arn: ind for ind, name_or_arn in enumerate(names_or_arns)}
+        secrets.sort(
+            key=lambda secret: min(
+                order.get(secret.Name, len(order)),
+                order.get(secret.ARN, len(order)),
+            )
+        )
+        return secrets, errors
+
+    @classmethod
+    def load_by_filter(
+        cls,
+        sm_client,
+        filters: T.List[T.Dict[str, T.Any]],
+        max_results: int = BATCH_GET_SECRET_VALUE_BATCH_SIZE,
+        rate_limiter: T.Optional[RateLimiter] = None,
+    ) -> T.Tuple[T.List["Secret"], T.Dict[str, str]]:
+        """
+        Load the current version (``AWSCURRENT``) of all secrets that match
+        the filters with the paginated ``batch_get_secret_value`` API.
+        The chunks of chunked secrets are not returned.
+
+        Example::
+
+            >>> secrets, errors = Secret.load_by_filter(
+            ...     sm_client,
+            ...     filters=[{"Key": "name", "Values": ["myapp/prod/"]}],
+            ... )
+
+        :param filters: the ``Filters`` argument of the API, see official document.
+        :param max_results: number of secrets per API call, max is 20.
+        :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+            to throttle and retry the API calls, if None, no rate limiting.
+
+        :return: a tuple of two items, the list of :class:`Secret` and
+            the error map, see :meth:`Secret.load_many`.
+
+        Ref:
+
+        - batch_get_secret_value: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.batch_get_secret_value
+        """
+        sm_client = throttle_client(sm_client, rate_limiter)
+        secrets, errors = cls._batch_get_secret_value(
+            sm_client,
+            dict(Filters=filters, MaxResults=max_results),
+        )
+        secrets = [secret for secret in secrets if not is_chunk_name(secret.Name)]
+        _load_secret_chunks(sm_client, secrets)
+        return secrets, errors
+
+    @classmethod
+    def _from_secret_value_dict(cls, dct: dict) -> "Secret":
+        """
+        Create a :class:`Secret` from the ``get_secret_value`` API response.
+        """
+        secret_string = dct.get("SecretString")
+        return cls(
+            ARN=dct["ARN"],
+            Name=dct["Name"],
+            VersionId=dct["VersionId"],
+            SecretBinary=dct.get("SecretBinary"),
+            SecretString=secret_string,
+            CreatedDate=dct["CreatedDate"],
+            VersionStages=dct.get("VersionStages", []),
+            Manifest=(
+                None
+                if secret_string is None
+                else ChunkManifest.from_json(secret_string)
+            ),
+        )
 
     @classmethod
     def _from_create_or_update_secret_response(
@@ -107,11 +458,58 @@ class Secret:
             CreatedDate=created_date,
         )
 
+    def _set_chunks(
+        self,
+        manifest: T.Optional[ChunkManifest],
+        chunk_values: T.Optional[T.List[bytes]],
+    ):
+        """
+        Set the chunks after a chunked deployment.
+        """
+        if manifest is not None:
+            self.Manifest = manifest
+            self.Chunks = chunk_values
+
+    def _get_chunks(self) -> T.List[bytes]:
+        if self.Chunks is None:
+            raise ValueError(
+                f"the chunks of secret {self.Name!r} are not loaded, "
+                f"load it with `load_chunks=True`!"
+            )
+        return self.Chunks
+
+    @cached_property
+    def view(self) -> memoryview:
+        """
+        The user data as a ``memoryview`` of the binary data, or the utf-8
+        encoded string. For a chunked secret, the chunks are decompressed into
+        one pre-allocated buffer, and the checksum is verified.
+        """
+        if self.Manifest is not None:
+            return join_binary(self.Manifest, self._get_chunks())
+        elif self.SecretBinary is not None:
+            return memoryview(self.SecretBinary)
+        else:
+            return memoryview(self.SecretString.encode("utf-8"))
+
+    def open(self) -> io.RawIOBase:
+        """
+        Open the user data as a readonly binary stream. For a chunked secret,
+        the chunks are decompressed incrementally while reading, and the
+        checksum is verified when the end of the stream is reached.
+        """
+        if self.Manifest is not None:
+            return ChunkReader(self.Manifest, self._get_chunks())
+        else:
+            return io.BytesIO(self.view)
+
     @property
     def binary(self) -> bytes:
         """
         The binary user data.
         """
+        if self.Manifest is not None:
+            return bytes(self.view)
         return self.SecretBinary
 
     @property
@@ -119,6 +517,8 @@ class Secret:
         """
         The string user data.
         """
+        if self.Manifest is not None:
+            return str(self.view, "utf-8")
         return self.SecretString
 
     @cached_property
@@ -126,14 +526,14 @@ class Secret:
         """
         The python dict user data.
         """
-        return json.loads(strip_comments(self.SecretString))
+        return json_loads(self.string)
 
     @cached_property
     def json_list(self) -> list:  # pragma: no cover
         """
         The python list user data.
         """
-        return json.loads(strip_comments(self.SecretString))
+        return json_loads(self.string)
 
     @property
     def aws_account_id(self) -> str:
@@ -150,163 +550,1306 @@ class Secret:
         return self.ARN.split(":")[3]
 
 
-def deploy_secret(
-    sm_client,
-    name_or_arn: str,
-    data: T.Union[bytes, str, list, dict, T.Any],
-    description: T.Optional[str] = None,
-    kms_key_id: T.Optional[str] = None,
-    tags: T.Optional[T.Dict[str, str]] = None,
-    add_replica_regions: T.Optional[T.List[T.Dict[str, str]]] = None,
-    force_overwrite_replica_secret: T.Optional[bool] = None,
-    client_request_token: T.Optional[str] = None,
-    skip_if_duplicated: bool = True,
-) -> T.Optional[Secret]:
+class LazySecret:
     """
-    Create or Update an AWS Secret.
+    A lightweight handle of a secret created from the ``list_secrets`` API
+    response, it only carries the metadata. It is not a :class:`Secret`,
+    the value is loaded with ``get_secret_value`` by :meth:`LazySecret.load`
+    (or :attr:`LazySecret.secret`) and the :class:`Secret` is cached, so no
+    KMS decryption happens if you never read it. No other attribute triggers
+    an API call.
 
-    - create_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.create_secret
-    - update_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.update_secret
-    - tag_resource: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.tag_resource
-    - untag_resource: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.untag_resource
+    Use ``iter_secrets(..., include_values=True)`` to load the values in
+    batches instead (see :func:`iter_secrets`).
 
-    Note:
-
-        secret manager can only add tag in creation, update_secret doesn't
-        support tagging, this function will automatically call ``tag_resource``
-        API when needed.
+    Example::
 
-    :param sm_client: the boto3 secretmanager client.
-    :param name_or_arn: name or the ARN of this secret.
-    :param data: secret data you want to store, currently it supports bytes,
-        string, json serializable dict or list.
-    :param description: description of this secret.
-    :param kms_key_id: the KMS key id you want to use for encryption, by default
-        it uses the AWS managed KMS key.
-    :param tags: the key value pair of the AWS resource tags.
-    :param add_replica_regions: see official document.
-    :param force_overwrite_replica_secret: see official document.
-    :param client_request_token: see official document.
-    :param skip_if_duplicated: default True, if True, will compare the secret data
-        to the existing one before deployment. If they are the same, then
-        no deployment happens.
+        >>> lazy_secret = next(iter_secrets(sm_client))
+        >>> lazy_secret.name, lazy_secret.tags # no get_secret_value call
+        >>> lazy_secret.secret.string # load on first access
 
-    :return: None or an :class:`Secret` object, None means that the deployment
-        doesn't happen.
+    :param sm_client: the boto3 secretmanager client to load the value.
+    :param dct: the secret dict in the ``list_secrets`` API response.
     """
-    # --------------------------------------------------------------------------
-    # input argument pre processing
-    # --------------------------------------------------------------------------
-    create_or_update_secret_kwargs = dict()
 
-    # data
-    if isinstance(data, bytes):
-        create_or_update_secret_kwargs["SecretBinary"] = data
-    elif isinstance(data, str):
-        create_or_update_secret_kwargs["SecretString"] = data
-    elif isinstance(data, (list, dict)):
-        create_or_update_secret_kwargs["SecretString"] = json.dumps(data)
-    else:  # pragma: no cover
-        raise NotImplementedError
+    def __init__(self, sm_client, dct: dict):
+        self._sm_client = sm_client
+        self._secret: T.Optional[Secret] = None
+        self._lock = threading.Lock()
+        self.arn: str = dct["ARN"]
+        self.name: str = dct["Name"]
+        self.description: T.Optional[str] = dct.get("Description")
+        self.kms_key_id: T.Optional[str] = dct.get("KmsKeyId")
+        self.rotation_enabled: bool = dct.get("RotationEnabled", False)
+        self.last_changed_date: T.Optional[datetime] = dct.get("LastChangedDate")
+        self.last_accessed_date: T.Optional[datetime] = dct.get("LastAccessedDate")
+        self.tags: T.Dict[str, str] = decode_tags(dct.get("Tags", []))
+        self.version_ids_to_stages: T.Dict[str, T.List[str]] = dct.get(
+            "SecretVersionsToStages", {}
+        )
 
-    # description
-    if description:
-        create_or_update_secret_kwargs["Description"] = description
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}("
+            f"name={self.name!r}, arn={self.arn!r}, is_loaded={self.is_loaded})"
+        )
 
-    # kms key id
-    if kms_key_id:  # pragma: no cover
-        create_or_update_secret_kwargs["KmsKeyId"] = kms_key_id
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Is the secret value loaded?
+        """
+        return self._secret is not None
 
-    # tags
-    if tags is None:
-        tags = dict()
-    tags_ = [{"Key": k, "Value": v} for k, v in tags.items()]
+    def _set_secret(self, secret: Secret):
+        self._secret = secret
 
-    # --------------------------------------------------------------------------
-    # create or update
-    # --------------------------------------------------------------------------
-    secret = Secret.load(
-        sm_client,
-        name_or_arn=name_or_arn,
-    )
-    is_create = secret is None
+    def _get_current_version(self) -> T.Tuple[T.Optional[str], T.List[str]]:
+        for version_id, stages in self.version_ids_to_stages.items():
+            if "AWSCURRENT" in stages:
+                return version_id, stages
+        return None, []
 
-    # create branch
-    if is_create:
-        create_or_update_secret_kwargs["Name"] = name_or_arn
-        if len(tags_):
-            create_or_update_secret_kwargs["Tags"] = tags_
-        if add_replica_regions is not None:  # pragma: no cover
-            create_or_update_secret_kwargs["AddReplicaRegions"] = add_replica_regions
-        if force_overwrite_replica_secret is not None:  # pragma: no cover
-            create_or_update_secret_kwargs[
-                "ForceOverwriteReplicaSecret"
-            ] = add_replica_regions
-        if client_request_token is not None:  # pragma: no cover
-            create_or_update_secret_kwargs["ClientRequestToken"] = client_request_token
-        response = sm_client.create_secret(**create_or_update_secret_kwargs)
-        secret = Secret._from_create_or_update_secret_response(
-            create_or_update_secret_kwargs=create_or_update_secret_kwargs,
-            create_or_update_secret_response=response,
-        )
-        return secret
+    @property
+    def version_id(self) -> T.Optional[str]:
+        """
+        The version id of the ``AWSCURRENT`` version.
+        """
+        return self._get_current_version()[0]
 
-    # update branch
-    # check duplication
-    if skip_if_duplicated:
-        # find existing secret's fingerprint
-        if "SecretBinary" in create_or_update_secret_kwargs:
-            fingerprint = create_or_update_secret_kwargs["SecretBinary"]
-        else:
-            fingerprint = create_or_update_secret_kwargs["SecretString"].encode("utf-8")
-        # if the same, do nothing
-        if fingerprint == secret.fingerprint:
-            return None
+    @property
+    def version_stages(self) -> T.List[str]:
+        """
+        The staging labels of the ``AWSCURRENT`` version.
+        """
+        return self._get_current_version()[1]
 
-    create_or_update_secret_kwargs["SecretId"] = name_or_arn
-    response = sm_client.update_secret(**create_or_update_secret_kwargs)
-    secret = Secret._from_create_or_update_secret_response(
-        create_or_update_secret_kwargs=create_or_update_secret_kwargs,
-        create_or_update_secret_response=response,
-    )
+    def load(self) -> Secret:
+        """
+        Load the ``AWSCURRENT`` version of the secret with ``get_secret_value``
+        on the first call, then return the cached :class:`Secret`.
 
-    # do tagging
-    if tags_ is not None:
-        sm_client.tag_resource(SecretId=name_or_arn, Tags=tags_)
+        :raise ValueError: if the secret is deleted after it is listed.
+        """
+        if self._secret is None:
+            with self._lock:
+                if self._secret is None:
+                    secret = Secret.load(self._sm_client, self.arn)
+                    if secret is None:
+                        raise ValueError(f"secret {self.name!r} is not found!")
+                    self._secret = secret
+        return self._secret
 
-    return secret
+    @property
+    def secret(self) -> Secret:
+        """
+        The :class:`Secret`, it is loaded on first access,
+        see :meth:`LazySecret.load`.
+        """
+        return self.load()
 
 
-def delete_secret(
+def iter_secrets(
     sm_client,
-    name_or_arn: str,
-    recovery_window_in_days: T.Optional[int] = None,
-    force_delete_without_recovery: T.Optional[bool] = None,
-) -> bool:
+    filters: T.Optional[T.List[T.Dict[str, T.Any]]] = None,
+    include_values: bool = False,
+    include_planned_deletion: bool = False,
+    page_size: int = LIST_SECRETS_PAGE_SIZE,
+    max_workers: T.Optional[int] = None,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> T.Iterator[LazySecret]:
     """
-    Delete a Secret.
+    Iterate all secrets with the paginated ``list_secrets`` API. It follows
+    the ``NextToken`` lazily and yields :class:`LazySecret` handles as each
+    page arrives. The chunks of chunked secrets are not yielded.
+
+    Example::
+
+        >>> for secret in iter_secrets(
+        ...     sm_client,
+        ...     filters=[{"Key": "tag-key", "Values": ["team"]}],
+        ... ):
+        ...     print(secret.name, secret.tags) # no get_secret_value call
+
+    :param filters: the ``Filters`` argument of the API, see official document.
+    :param include_values: if True, load the values of each page with the
+        ``batch_get_secret_value`` API (20 secrets per call, concurrently)
+        before yielding them. Otherwise, each value is loaded on first access.
+    :param include_planned_deletion: also yield the secrets that are
+        scheduled for deletion?
+    :param page_size: number of secrets per page, the max value is 100.
+    :param max_workers: max number of threads to load the values.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
 
     Ref:
 
-    - delete_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.delete_secret
+    - list_secrets: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.list_secrets
+    - batch_get_secret_value: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.batch_get_secret_value
+    """
+    sm_client = throttle_client(sm_client, rate_limiter)
+    kwargs = dict(
+        MaxResults=page_size,
+        IncludePlannedDeletion=include_planned_deletion,
+    )
+    if filters is not None:
+        kwargs["Filters"] = filters
+    while 1:
+        response = sm_client.list_secrets(**kwargs)
+        lazy_secrets = [
+            LazySecret(sm_client, dct)
+            for dct in response.get("SecretList", [])
+            if not is_chunk_name(dct["Name"])
+        ]
+        if include_values and len(lazy_secrets):
+            secrets, _ = Secret.load_many(
+                sm_client,
+                [lazy_secret.arn for lazy_secret in lazy_secrets],
+                max_workers=max_workers,
+            )
+            mapper = {secret.ARN: secret for secret in secrets}
+            for lazy_secret in lazy_secrets:
+                if lazy_secret.arn in mapper:
+                    lazy_secret._set_secret(mapper[lazy_secret.arn])
+        yield from lazy_secrets
+        next_token = response.get("NextToken")
+        if next_token:
+            kwargs["NextToken"] = next_token
+        else:
+            break
 
-    :param sm_client: the boto3 secretmanager client.
-    :param name_or_arn: name or the ARN of this secret.
-    :param recovery_window_in_days: see official document.
-    :param force_delete_without_recovery: see official document.
 
-    :return: a boolean value to indicate whether a deletion happened.
+@dataclasses.dataclass
+class SecretVersion:
     """
-    kwargs = dict(SecretId=name_or_arn)
-    if recovery_window_in_days is not None:  # pragma: no cover
+    The metadata of one version of a secret from the ``list_secret_version_ids``
+    API, it doesn't have the secret value. Use :meth:`SecretVersion.load`
+    to load the value of this exact version.
+
+    A version without ``VersionStages`` is deprecated, AWS may remove it.
+    """
+
+    Name: str = dataclasses.field()
+    ARN: str = dataclasses.field()
+    VersionId: str = dataclasses.field()
+    VersionStages: T.List[str] = dataclasses.field(default_factory=list)
+    CreatedDate: T.Optional[datetime] = dataclasses.field(default=None)
+    LastAccessedDate: T.Optional[datetime] = dataclasses.field(default=None)
+    KmsKeyIds: T.List[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def is_deprecated(self) -> bool:
+        return len(self.VersionStages) == 0
+
+    def load(
+        self,
+        sm_client,
+        load_chunks: bool = True,
+    ) -> T.Optional[Secret]:
+        """
+        Load the value of this version with one ``get_secret_value`` call.
+        """
+        return Secret.load(
+            sm_client,
+            self.ARN,
+            version_id=self.VersionId,
+            load_chunks=load_chunks,
+        )
+
+
+def iter_secret_versions(
+    sm_client,
+    name_or_arn: str,
+    include_deprecated: bool = False,
+    page_size: int = LIST_SECRETS_PAGE_SIZE,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> T.Iterator[SecretVersion]:
+    """
+    Iterate all versions of a secret, it follows the ``NextToken`` lazily.
+    Only the metadata is returned, no KMS decryption happens.
+
+    :param name_or_arn: name or the ARN of this secret.
+    :param include_deprecated: also yield the versions without any staging
+        label, AWS may remove them at any time.
+    :param page_size: number of versions per page, the max value is 100.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
+    Ref:
+
+    - list_secret_version_ids: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.list_secret_version_ids
+    """
+    sm_client = throttle_client(sm_client, rate_limiter)
+    kwargs = dict(
+        SecretId=name_or_arn,
+        MaxResults=page_size,
+        IncludeDeprecated=include_deprecated,
+    )
+    while 1:
+        response = sm_client.list_secret_version_ids(**kwargs)
+        for dct in response.get("Versions", []):
+            yield SecretVersion(
+                Name=response["Name"],
+                ARN=response["ARN"],
+                VersionId=dct["VersionId"],
+                VersionStages=dct.get("VersionStages", []),
+                CreatedDate=dct.get("CreatedDate"),
+                LastAccessedDate=dct.get("LastAccessedDate"),
+                KmsKeyIds=dct.get("KmsKeyIds", []),
+            )
+        next_token = response.get("NextToken")
+        if next_token:
+            kwargs["NextToken"] = next_token
+        else:
+            break
+
+
+class SecretVersionIndex:
+    """
+    An in-memory index of all versions of a secret. It maps version id and
+    staging label to the :class:`SecretVersion` in O(1), so rollback and
+    audit tools can resolve a version locally, then load the exact version
+    with one ``get_secret_value`` call instead of trying the stages one by one.
+
+    Example::
+
+        >>> index = SecretVersionIndex.load(sm_client, "myapp/db")
+        >>> index.current.VersionId
+        'a1b2...'
+        >>> index.resolve("AWSPREVIOUS").VersionId
+        'c3d4...'
+        >>> index.load_secret(sm_client, "AWSPREVIOUS").json_dict
+        {'password': 'the previous password'}
+
+    :param name: the secret name.
+    :param versions: all versions of the secret.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        versions: T.Iterable[SecretVersion],
+    ):
+        self.name = name
+        self.versions: T.List[SecretVersion] = sorted(
+            versions,
+            key=lambda version: (
+                version.CreatedDate is not None,
+                version.CreatedDate or datetime.min,
+            ),
+        )
+        self._by_version_id: T.Dict[str, SecretVersion] = {
+            version.VersionId: version for version in self.versions
+        }
+        self._by_stage: T.Dict[str, SecretVersion] = {
+            stage: version
+            for version in self.versions
+            for stage in version.VersionStages
+        }
+
+    @classmethod
+    def load(
+        cls,
+        sm_client,
+        name_or_arn: str,
+        include_deprecated: bool = True,
+        rate_limiter: T.Optional[RateLimiter] = None,
+    ) -> "SecretVersionIndex":
+        """
+        Load all versions with :func:`iter_secret_versions`.
+        """
+        versions = list(
+            iter_secret_versions(
+                sm_client,
+                name_or_arn,
+                include_deprecated=include_deprecated,
+                rate_limiter=rate_limiter,
+            )
+        )
+        name = versions[0].Name if len(versions) else name_or_arn
+        return cls(name=name, versions=versions)
+
+    def __len__(self) -> int:
+        return len(self.versions)
+
+    @property
+    def version_ids(self) -> T.List[str]:
+        """
+        All version ids from the oldest to the latest.
+        """
+        return [version.VersionId for version in self.versions]
+
+    @property
+    def stages(self) -> T.Dict[str, str]:
+        """
+        The staging label to version id mapping.
+        """
+        return {stage: version.VersionId for stage, version in self._by_stage.items()}
+
+    @property
+    def current(self) -> T.Optional[SecretVersion]:
+        return self._by_stage.get("AWSCURRENT")
+
+    @property
+    def previous(self) -> T.Optional[SecretVersion]:
+        return self._by_stage.get("AWSPREVIOUS")
+
+    @property
+    def pending(self) -> T.Optional[SecretVersion]:
+        return self._by_stage.get("AWSPENDING")
+
+    def get_version(self, version_id: str) -> T.Optional[SecretVersion]:
+        return self._by_version_id.get(version_id)
+
+    def get_stage(self, stage: str) -> T.Optional[SecretVersion]:
+        return self._by_stage.get(stage)
+
+    def resolve(self, selector: str) -> T.Optional[SecretVersion]:
+        """
+        Resolve a version id or a staging label to a version locally.
+
+        :return: None if the version id or the staging label doesn't exist.
+        """
+        version = self.get_version(selector)
+        if version is None:
+            version = self.get_stage(selector)
+        return version
+
+    def load_secret(
+        self,
+        sm_client,
+        selector: str,
+        load_chunks: bool = True,
+    ) -> T.Optional[Secret]:
+        """
+        Resolve the version locally and load it with one ``get_secret_value``
+        call by the exact version id.
+
+        :param selector: the version id or the staging label.
+
+        :return: None if the version doesn't exist.
+        """
+        version = self.resolve(selector)
+        if version is None:
+            return None
+        return version.load(sm_client, load_chunks=load_chunks)
+
+
+def _load_secret_chunks(
+    sm_client,
+    secrets: T.List[Secret],
+    max_workers: T.Optional[int] = None,
+):
+    """
+    Find the chunked secrets (the ``SecretString`` is a :class:`ChunkManifest`),
+    and load their chunks into :attr:`Secret.Chunks` in place. The current
+    version of all chunks are fetched with the batch ``batch_get_secret_value``
+    API, the chunks whose current version is not the one recorded in the
+    manifest are fetched with ``get_secret_value`` concurrently. The chunks
+    are decompressed and verified when the value is read.
+
+    :raise ValueError: if any chunk is missing.
+    """
+    todo = _find_unloaded_chunked_secrets(secrets)
+    if len(todo) == 0:
+        return
+
+    chunk_secrets, _ = Secret.load_many(
+        sm_client,
+        _get_secret_chunk_names(todo),
+        max_workers=max_workers,
+    )
+    current_chunks = {chunk_secret.Name: chunk_secret for chunk_secret in chunk_secrets}
+    outdated = _find_outdated_secret_chunks(todo, current_chunks)
+
+    def get_chunk(args: T.Tuple[str, str]) -> bytes:
+        chunk_name, version_id = args
+        try:
+            response = sm_client.get_secret_value(
+                SecretId=chunk_name,
+                VersionId=version_id,
+            )
+        except Exception as e:
+            if "ResourceNotFoundException" in str(e):
+                raise ValueError(
+                    f"chunk {chunk_name!r} version {version_id!r} not found!"
+                )
+            else:  # pragma: no cover
+                raise e
+        return response["SecretBinary"]
+
+    outdated_chunks = dict()
+    if len(outdated):
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            outdated_chunks = dict(zip(outdated, executor.map(get_chunk, outdated)))
+    _set_secret_chunks(todo, current_chunks, outdated_chunks)
+
+
+def _find_unloaded_chunked_secrets(secrets: T.List[Secret]) -> T.List[Secret]:
+    """
+    Find the chunked secrets whose chunks are not loaded yet.
+    """
+    return [
+        secret
+        for secret in secrets
+        if (secret.Manifest is not None) and (secret.Chunks is None)
+    ]
+
+
+def _get_secret_chunk_names(todo: T.List[Secret]) -> T.List[str]:
+    """
+    Get the chunk secret names of all chunked secrets.
+    """
+    return [
+        get_secret_chunk_name(secret.Name, index)
+        for secret in todo
+        for index in range(secret.Manifest.n_chunks)
+    ]
+
+
+def _find_outdated_secret_chunks(
+    todo: T.List[Secret],
+    current_chunks: T.Dict[str, Secret],
+) -> T.List[T.Tuple[str, str]]:
+    """
+    Find the chunks that are updated after the manifest is written, their
+    current version is not the one recorded in the manifest.
+
+    :return: list of ``(chunk_name, version_id)`` to fetch.
+    """
+    outdated: T.List[T.Tuple[str, str]] = list()
+    for secret in todo:
+        for index, version_id in enumerate(secret.Manifest.chunks):
+            chunk_name = get_secret_chunk_name(secret.Name, index)
+            chunk_secret = current_chunks.get(chunk_name)
+            if (chunk_secret is None) or (chunk_secret.VersionId != version_id):
+                outdated.append((chunk_name, version_id))
+    return outdated
+
+
+def _set_secret_chunks(
+    todo: T.List[Secret],
+    current_chunks: T.Dict[str, Secret],
+    outdated_chunks: T.Dict[T.Tuple[str, str], bytes],
+):
+    """
+    Set the :attr:`Secret.Chunks` of the chunked secrets in place, from the
+    current version of the chunks, or the fetched outdated chunks.
+    """
+    for secret in todo:
+        values = list()
+        for index, version_id in enumerate(secret.Manifest.chunks):
+            chunk_name = get_secret_chunk_name(secret.Name, index)
+            try:
+                values.append(outdated_chunks[(chunk_name, version_id)])
+            except KeyError:
+                values.append(current_chunks[chunk_name].SecretBinary)
+        secret.Chunks = values
+
+
+def _put_secret_chunks(
+    sm_client,
+    name: str,
+    chunk_values: T.List[bytes],
+    kms_key_id: T.Optional[str] = None,
+    max_workers: T.Optional[int] = None,
+) -> T.List[str]:
+    """
+    Write the chunks into ``${name}/__chunk__/${index}`` secrets concurrently,
+    with ``put_secret_value``, or ``create_secret`` if it doesn't exist.
+
+    :param max_workers: max number of threads to write the chunks, if 1,
+        the chunks are written in the current thread.
+
+    :return: the version id of each chunk.
+    """
+
+    def put_chunk(args: T.Tuple[int, bytes]) -> str:
+        index, chunk_value = args
+        chunk_name = get_secret_chunk_name(name, index)
+        try:
+            response = sm_client.put_secret_value(
+                SecretId=chunk_name,
+                SecretBinary=bytes(chunk_value),
+            )
+        except Exception as e:
+            if "ResourceNotFoundException" in str(e):
+                kwargs = dict(Name=chunk_name, SecretBinary=bytes(chunk_value))
+                if kms_key_id:  # pragma: no cover
+                    kwargs["KmsKeyId"] = kms_key_id
+                response = sm_client.create_secret(**kwargs)
+            else:  # pragma: no cover
+                raise e
+        return response["VersionId"]
+
+    return concurrent_map(
+        put_chunk,
+        enumerate(chunk_values),
+        max_workers=max_workers,
+    )
+
+
+def _delete_secret_chunks(
+    sm_client,
+    names: T.List[str],
+    delete_secret_kwargs: dict,
+    max_workers: T.Optional[int] = None,
+) -> int:
+    """
+    Delete all chunks of the secrets. They are listed with ``list_secrets``
+    (the chunk name prefixes of 10 secrets per call) and deleted concurrently
+    with the same ``delete_secret`` arguments.
+
+    :return: number of deleted chunks.
+    """
+    names = [name for name in names if not is_chunk_name(name)]
+
+    def find_chunks(chunk: T.List[str]) -> T.List[str]:
+        prefixes = tuple(get_secret_chunk_prefix(name) for name in chunk)
+        kwargs = dict(
+            Filters=[{"Key": "name", "Values": list(prefixes)}],
+            MaxResults=LIST_SECRETS_PAGE_SIZE,
+        )
+        chunk_names = list()
+        while 1:
+            response = sm_client.list_secrets(**kwargs)
+            for dct in response.get("SecretList", []):
+                if dct["Name"].startswith(prefixes) and is_chunk_name(dct["Name"]):
+                    chunk_names.append(dct["Name"])
+            next_token = response.get("NextToken")
+            if next_token:
+                kwargs["NextToken"] = next_token
+            else:
+                break
+        return chunk_names
+
+    def delete_chunk(chunk_name: str):
+        sm_client.delete_secret(**dict(delete_secret_kwargs, SecretId=chunk_name))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        chunk_names = [
+            chunk_name
+            for found in executor.map(
+                find_chunks, chunks(names, LIST_SECRETS_FILTER_VALUES_LIMIT)
+            )
+            for chunk_name in found
+        ]
+        list(executor.map(delete_chunk, chunk_names))
+    return len(chunk_names)
+
+
+def _build_create_or_update_secret_kwargs(
+    data: T.Union[bytes, str, list, dict, T.Any],
+    description: T.Optional[str] = None,
+    kms_key_id: T.Optional[str] = None,
+) -> dict:
+    """
+    Build the common arguments of the ``create_secret`` and ``update_secret``
+    API for :func:`deploy_secret`.
+    """
+    # --------------------------------------------------------------------------
+    # input argument pre processing
+    # --------------------------------------------------------------------------
+    create_or_update_secret_kwargs = dict()
+
+    # data
+    if isinstance(data, bytes):
+        create_or_update_secret_kwargs["SecretBinary"] = data
+    elif isinstance(data, str):
+        create_or_update_secret_kwargs["SecretString"] = data
+    elif isinstance(data, (list, dict)):
+        create_or_update_secret_kwargs["SecretString"] = json.dumps(data)
+    else:  # pragma: no cover
+        raise NotImplementedError
+
+    # description
+    if description:
+        create_or_update_secret_kwargs["Description"] = description
+
+    # kms key id
+    if kms_key_id:  # pragma: no cover
+        create_or_update_secret_kwargs["KmsKeyId"] = kms_key_id
+
+    return create_or_update_secret_kwargs
+
+
+def _get_kwargs_content_hash(create_or_update_secret_kwargs: dict) -> str:
+    """
+    Get the :attr:`Secret.content_hash` of the secret value to deploy.
+    """
+    if "SecretBinary" in create_or_update_secret_kwargs:
+        return get_content_hash(create_or_update_secret_kwargs["SecretBinary"])
+    else:
+        return get_content_hash(
+            create_or_update_secret_kwargs["SecretString"].encode("utf-8")
+        )
+
+
+def _split_secret_kwargs(
+    name_or_arn: str,
+    create_or_update_secret_kwargs: dict,
+    compression: str,
+) -> T.Tuple[T.Optional[ChunkManifest], T.Optional[T.List[memoryview]]]:
+    """
+    Split the secret value into chunks if it exceeds the size limit,
+    see ``chunked`` in :func:`deploy_secret`.
+
+    :return: the manifest (without the chunk versions) and the chunk values,
+        both are None if the value doesn't have to be chunked.
+    """
+    if "SecretBinary" in create_or_update_secret_kwargs:
+        binary = create_or_update_secret_kwargs["SecretBinary"]
+    else:
+        binary = create_or_update_secret_kwargs["SecretString"].encode("utf-8")
+    if len(binary) <= SECRET_VALUE_SIZE_LIMIT:
+        return None, None
+    if name_or_arn.startswith("arn:"):
+        raise ValueError("chunked secret has to be deployed by the name!")
+    return split_binary(binary, SECRET_VALUE_SIZE_LIMIT, compression)
+
+
+def _set_create_secret_options(
+    create_or_update_secret_kwargs: dict,
+    add_replica_regions: T.Optional[T.List[T.Dict[str, str]]] = None,
+    force_overwrite_replica_secret: T.Optional[bool] = None,
+    client_request_token: T.Optional[str] = None,
+):
+    """
+    Add the ``create_secret`` only options of :func:`deploy_secret` to the
+    arguments in place.
+    """
+    if add_replica_regions is not None:  # pragma: no cover
+        create_or_update_secret_kwargs["AddReplicaRegions"] = add_replica_regions
+    if force_overwrite_replica_secret is not None:  # pragma: no cover
+        create_or_update_secret_kwargs[
+            "ForceOverwriteReplicaSecret"
+        ] = force_overwrite_replica_secret
+    if client_request_token is not None:  # pragma: no cover
+        create_or_update_secret_kwargs["ClientRequestToken"] = client_request_token
+
+
+def _set_write_secret_kwargs(
+    create_or_update_secret_kwargs: dict,
+    name_or_arn: str,
+    is_create: bool,
+    tags: T.Optional[T.Dict[str, str]] = None,
+):
+    """
+    Set the secret id of the ``create_secret`` or ``update_secret`` arguments
+    in place. ``tags`` is only used in creation.
+    """
+    if is_create:
+        create_or_update_secret_kwargs["Name"] = name_or_arn
+        if tags:
+            create_or_update_secret_kwargs["Tags"] = encode_tags(tags)
+    else:
+        create_or_update_secret_kwargs["SecretId"] = name_or_arn
+
+
+def _write_secret(
+    sm_client,
+    name_or_arn: str,
+    create_or_update_secret_kwargs: dict,
+    is_create: bool,
+    manifest: T.Optional[ChunkManifest] = None,
+    chunk_values: T.Optional[T.List[memoryview]] = None,
+    kms_key_id: T.Optional[str] = None,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    max_workers: T.Optional[int] = None,
+) -> Secret:
+    """
+    Write the chunks (if any), then replace the value with the manifest, and
+    call the ``create_secret`` or ``update_secret`` API. ``tags`` is only used
+    in creation.
+    """
+    if manifest is not None:
+        manifest.chunks = _put_secret_chunks(
+            sm_client,
+            name_or_arn,
+            chunk_values,
+            kms_key_id=kms_key_id,
+            max_workers=max_workers,
+        )
+        create_or_update_secret_kwargs.pop("SecretBinary", None)
+        create_or_update_secret_kwargs["SecretString"] = manifest.to_json()
+
+    _set_write_secret_kwargs(
+        create_or_update_secret_kwargs,
+        name_or_arn=name_or_arn,
+        is_create=is_create,
+        tags=tags,
+    )
+    if is_create:
+        response = sm_client.create_secret(**create_or_update_secret_kwargs)
+    else:
+        response = sm_client.update_secret(**create_or_update_secret_kwargs)
+    secret = Secret._from_create_or_update_secret_response(
+        create_or_update_secret_kwargs=create_or_update_secret_kwargs,
+        create_or_update_secret_response=response,
+    )
+    secret._set_chunks(manifest, chunk_values)
+    return secret
+
+
+def _reconcile_secret_tags(
+    sm_client,
+    name_or_arn: str,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    existing_tags: T.Optional[T.Dict[str, str]] = None,
+    replace_tags: bool = False,
+):
+    """
+    Merge the ``tags`` into the existing tags, or do full replacement update
+    if ``replace_tags`` is True (see :func:`put_secret_tags`). Use the already
+    known ``existing_tags`` if given, otherwise call the ``describe_secret`` API.
+    """
+    if tags is None:
+        return
+    if existing_tags is None:
+        existing_tags = get_secret_tags(sm_client, name_or_arn)
+    reconcile_tags(
+        existing_tags=existing_tags,
+        desired_tags=tags,
+        remove_tags=lambda tag_keys: remove_secret_tags(
+            sm_client, name_or_arn, tag_keys
+        ),
+        add_tags=lambda tags_: update_secret_tags(sm_client, name_or_arn, tags_),
+        replace=replace_tags,
+    )
+
+
+def deploy_secret(
+    sm_client,
+    name_or_arn: str,
+    data: T.Union[bytes, str, list, dict, T.Any],
+    description: T.Optional[str] = None,
+    kms_key_id: T.Optional[str] = None,
+    tags: T.Optional[T.Dict[str, str]] = None,
+    replace_tags: bool = False,
+    add_replica_regions: T.Optional[T.List[T.Dict[str, str]]] = None,
+    force_overwrite_replica_secret: T.Optional[bool] = None,
+    client_request_token: T.Optional[str] = None,
+    skip_if_duplicated: bool = True,
+    use_content_hash: bool = False,
+    chunked: bool = False,
+    compression: str = CompressionEnum.zlib.value,
+    max_workers: T.Optional[int] = None,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> T.Optional[Secret]:
+    """
+    Create or Update an AWS Secret.
+
+    - create_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.create_secret
+    - update_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.update_secret
+    - tag_resource: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.tag_resource
+    - untag_resource: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.untag_resource
+
+    Note:
+
+        secret manager can only add tag in creation, update_secret doesn't
+        support tagging, this function will automatically call ``tag_resource``
+        (and ``untag_resource`` if ``replace_tags=True``) API when needed. The
+        API calls are skipped if the tags already match.
+
+    Note:
+
+        by default, the duplication check loads the existing secret value with
+        ``get_secret_value``, which decrypts it with KMS. With
+        ``use_content_hash=True``, the sha256 hash of the value is stored in
+        the reserved :data:`CONTENT_HASH_TAG_KEY` tag at write time, and the
+        duplication check only compares the hash from the cheap
+        ``describe_secret`` API. The tag is readable by anyone who can
+        describe the secret, don't use it for low entropy secret values
+        such as short passwords. If the tag is missing (for example, it is
+        removed by :func:`put_secret_tags`), the secret is considered changed.
+
+    Note:
+
+        with ``chunked=True``, if the value exceeds the 64 KB size limit, it is
+        compressed and written into ``${name}/__chunk__/${index}`` secrets
+        first, then the manifest is written into the secret itself. So the
+        reader never sees a manifest that points to missing chunks. The
+        chunks are deleted by :func:`delete_secret` with ``delete_chunks=True``.
+        The chunks of the older versions are kept as the ``AWSPREVIOUS`` or
+        the deprecated version of the chunk secrets, the deprecated versions
+        may be removed by AWS.
+
+    :param sm_client: the boto3 secretmanager client.
+    :param name_or_arn: name or the ARN of this secret.
+    :param data: secret data you want to store, currently it supports bytes,
+        string, json serializable dict or list.
+    :param description: description of this secret.
+    :param kms_key_id: the KMS key id you want to use for encryption, by default
+        it uses the AWS managed KMS key.
+    :param tags: the key value pair of the AWS resource tags. if None, then
+        don't update tags. Otherwise, they are merged into the existing tags,
+        the other existing tags are kept.
+    :param replace_tags: if True, do full replacement update of the tags
+        (see :func:`put_secret_tags`), the existing tags not in ``tags`` are
+        removed, empty dict deletes all tags. The tags are also reconciled
+        when the deployment is skipped as duplicated, by default the tags
+        are not touched in this case.
+    :param add_replica_regions: see official document.
+    :param force_overwrite_replica_secret: see official document.
+    :param client_request_token: see official document.
+    :param skip_if_duplicated: default True, if True, will compare the secret data
+        to the existing one before deployment. If they are the same, then
+        no deployment happens.
+    :param use_content_hash: if True, store the content hash in a tag and use
+        it for the duplication check, see the note above.
+    :param chunked: if True, split the large value into chunks, see the
+        note above. ``name_or_arn`` has to be the secret name.
+    :param compression: the compression algorithm of the chunked value, see
+        :class:`~pysecret.aws.chunking.CompressionEnum`.
+    :param max_workers: max number of threads to write the chunks.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
+    :return: None or an :class:`Secret` object, None means that the deployment
+        doesn't happen.
+    """
+    sm_client = throttle_client(sm_client, rate_limiter)
+    create_or_update_secret_kwargs = _build_create_or_update_secret_kwargs(
+        data=data,
+        description=description,
+        kms_key_id=kms_key_id,
+    )
+
+    content_hash = _get_kwargs_content_hash(create_or_update_secret_kwargs)
+    if chunked:
+        manifest, chunk_values = _split_secret_kwargs(
+            name_or_arn, create_or_update_secret_kwargs, compression
+        )
+    else:
+        manifest, chunk_values = None, None
+
+    # --------------------------------------------------------------------------
+    # create or update
+    # --------------------------------------------------------------------------
+    if use_content_hash:
+        try:
+            response = sm_client.describe_secret(SecretId=name_or_arn)
+            is_create = False
+            existing_tags = decode_tags(response.get("Tags", []))
+            existing_content_hash = existing_tags.get(CONTENT_HASH_TAG_KEY)
+        except Exception as e:
+            if "ResourceNotFoundException" in str(e):
+                is_create = True
+                existing_tags = None
+                existing_content_hash = None
+            else:  # pragma: no cover
+                raise e
+        content_hash_tags = {CONTENT_HASH_TAG_KEY: content_hash}
+        if tags is not None:
+            tags = dict(tags)
+            tags.update(content_hash_tags)
+    else:
+        secret = Secret.load(
+            sm_client,
+            name_or_arn=name_or_arn,
+            load_chunks=False,
+        )
+        is_create = secret is None
+        existing_tags = None
+        existing_content_hash = None if is_create else secret.content_hash
+        content_hash_tags = None
+
+    # check duplication
+    if (is_create is False) and skip_if_duplicated:
+        # if the same, only update tags if full replacement is asked for
+        if content_hash == existing_content_hash:
+            if replace_tags:
+                _reconcile_secret_tags(
+                    sm_client,
+                    name_or_arn,
+                    tags,
+                    existing_tags=existing_tags,
+                    replace_tags=True,
+                )
+            return None
+
+    # create branch
+    if is_create:
+        if (tags is None) and (content_hash_tags is not None):
+            tags = content_hash_tags
+        _set_create_secret_options(
+            create_or_update_secret_kwargs,
+            add_replica_regions=add_replica_regions,
+            force_overwrite_replica_secret=force_overwrite_replica_secret,
+            client_request_token=client_request_token,
+        )
+        return _write_secret(
+            sm_client,
+            name_or_arn=name_or_arn,
+            create_or_update_secret_kwargs=create_or_update_secret_kwargs,
+            is_create=True,
+            manifest=manifest,
+            chunk_values=chunk_values,
+            kms_key_id=kms_key_id,
+            tags=tags,
+            max_workers=max_workers,
+        )
+
+    # update branch
+    secret = _write_secret(
+        sm_client,
+        name_or_arn=name_or_arn,
+        create_or_update_secret_kwargs=create_or_update_secret_kwargs,
+        is_create=False,
+        manifest=manifest,
+        chunk_values=chunk_values,
+        kms_key_id=kms_key_id,
+        max_workers=max_workers,
+    )
+
+    # do tagging
+    if (tags is None) and (content_hash_tags is not None):
+        update_secret_tags(sm_client, name_or_arn, content_hash_tags)
+    else:
+        _reconcile_secret_tags(
+            sm_client,
+            name_or_arn,
+            tags,
+            existing_tags=existing_tags,
+            replace_tags=replace_tags,
+        )
+
+    return secret
+
+
+@dataclasses.dataclass
+class SecretSpec:
+    """
+    The specification of a secret to deploy, it is used in
+    :func:`deploy_secrets`. The attributes are the same as the arguments
+    of :func:`deploy_secret`, ``name`` has to be the secret name.
+    """
+
+    name: str = dataclasses.field()
+    data: T.Union[bytes, str, list, dict, T.Any] = dataclasses.field()
+    description: T.Optional[str] = dataclasses.field(default=None)
+    kms_key_id: T.Optional[str] = dataclasses.field(default=None)
+    tags: T.Optional[T.Dict[str, str]] = dataclasses.field(default=None)
+    replace_tags: bool = dataclasses.field(default=False)
+    skip_if_duplicated: bool = dataclasses.field(default=True)
+    use_content_hash: bool = dataclasses.field(default=False)
+    chunked: bool = dataclasses.field(default=False)
+    compression: str = dataclasses.field(default=CompressionEnum.zlib.value)
+
+
+def _list_secrets_by_names(
+    sm_client,
+    names: T.List[str],
+    max_workers: T.Optional[int] = None,
+) -> T.Dict[str, LazySecret]:
+    """
+    Find the existing secrets with the ``list_secrets`` API, the names are
+    grouped into chunks of 10 (the filter values limit) and the chunks are
+    listed concurrently. The ``name`` filter is a prefix match, only the
+    exact matches are returned.
+
+    :return: a dict of secret name to :class:`LazySecret`, it has the tags.
+    """
+    name_set = set(names)
+
+    def list_secrets(chunk: T.List[str]) -> T.List[LazySecret]:
+        return list(iter_secrets(sm_client, filters=[{"Key": "name", "Values": chunk}]))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return {
+            lazy_secret.name: lazy_secret
+            for lazy_secrets in executor.map(
+                list_secrets, chunks(names, LIST_SECRETS_FILTER_VALUES_LIMIT)
+            )
+            for lazy_secret in lazy_secrets
+            if lazy_secret.name in name_set
+        }
+
+
+def deploy_secrets(
+    sm_client,
+    specs: T.Iterable[SecretSpec],
+    max_workers: T.Optional[int] = None,
+    dry_run: bool = False,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> T.List[DeployResult]:
+    """
+    Create or Update many secrets concurrently.
+
+    1. validate all specs and build the ``create_secret`` / ``update_secret``
+        arguments, it raises error before any write happens if any spec
+        is invalid.
+    2. batch fetch the current state, the metadata and tags of the existing
+        secrets come from the ``list_secrets`` API, the values (only for the
+        specs that need the duplication check without ``use_content_hash``)
+        come from the ``batch_get_secret_value`` API
+        (see :meth:`Secret.load_many`).
+    3. compute a create / update / skip plan locally, the rule is the same
+        as :func:`deploy_secret`.
+    4. run only the needed writes on a bounded thread pool. The tags are
+        reconciled with the prefetched tags, so no ``describe_secret`` call
+        is needed.
+
+    :param specs: list of :class:`SecretSpec`.
+    :param max_workers: max number of threads to use.
+    :param dry_run: if True, only compute the plan, don't write anything.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
+    :return: list of :class:`~pysecret.aws.bulk.DeployResult` in the same
+        order as the ``specs``. The error of a failed deployment is stored in
+        the :attr:`~pysecret.aws.bulk.DeployResult.error` attribute instead
+        of being raised, so one failure doesn't stop the others.
+
+    Ref:
+
+    - list_secrets: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.list_secrets
+    - batch_get_secret_value: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.batch_get_secret_value
+    """
+    sm_client = throttle_client(sm_client, rate_limiter)
+    specs = list(specs)
+    names = [spec.name for spec in specs]
+    if len(names) != len(set(names)):
+        raise ValueError("the secret names in specs have to be unique!")
+    if any(name.startswith("arn:") for name in names):
+        raise ValueError("the secret in specs has to be the name, not the ARN!")
+
+    # --- build create_secret / update_secret arguments
+    kwargs_list = list()
+    for spec in specs:
+        create_or_update_secret_kwargs = _build_create_or_update_secret_kwargs(
+            data=spec.data,
+            description=spec.description,
+            kms_key_id=spec.kms_key_id,
+        )
+        if spec.chunked:
+            manifest, chunk_values = _split_secret_kwargs(
+                spec.name, create_or_update_secret_kwargs, spec.compression
+            )
+        else:
+            manifest, chunk_values = None, None
+        kwargs_list.append((create_or_update_secret_kwargs, manifest, chunk_values))
+
+    # --- fetch current state
+    existing_secrets = _list_secrets_by_names(
+        sm_client,
+        names,
+        max_workers=max_workers,
+    )
+    to_load = [
+        existing_secrets[spec.name].arn
+        for spec in specs
+        if (spec.name in existing_secrets)
+        and spec.skip_if_duplicated
+        and (spec.use_content_hash is False)
+    ]
+    secrets, _ = Secret.load_many(
+        sm_client,
+        to_load,
+        max_workers=max_workers,
+        load_chunks=False,
+    )
+    existing_content_hashes = {secret.Name: secret.content_hash for secret in secrets}
+
+    # --- compute plan
+    plan: T.List[T.Tuple[SecretSpec, tuple, str, T.Optional[T.Dict[str, str]]]]
+    plan = list()
+    for spec, kwargs in zip(specs, kwargs_list):
+        create_or_update_secret_kwargs = kwargs[0]
+        content_hash = _get_kwargs_content_hash(create_or_update_secret_kwargs)
+        tags = spec.tags
+        if spec.use_content_hash:
+            content_hash_tags = {CONTENT_HASH_TAG_KEY: content_hash}
+            if tags is None:
+                tags = content_hash_tags
+            else:
+                tags = dict(tags)
+                tags.update(content_hash_tags)
+        existing_secret = existing_secrets.get(spec.name)
+        if existing_secret is None:
+            action = DeployActionEnum.create.value
+        else:
+            if spec.use_content_hash:
+                existing_content_hash = existing_secret.tags.get(CONTENT_HASH_TAG_KEY)
+            else:
+                existing_content_hash = existing_content_hashes.get(spec.name)
+            if spec.skip_if_duplicated and (content_hash == existing_content_hash):
+                action = DeployActionEnum.skip.value
+                if not spec.replace_tags:
+                    tags = None
+            else:
+                action = DeployActionEnum.update.value
+        plan.append((spec, kwargs, action, tags))
+
+    if dry_run:
+        return [
+            DeployResult(name=spec.name, action=action) for spec, _, action, _ in plan
+        ]
+
+    # --- execute
+    def execute(
+        args: T.Tuple[SecretSpec, tuple, str, T.Optional[T.Dict[str, str]]],
+    ) -> DeployResult:
+        spec, kwargs, action, tags = args
+        create_or_update_secret_kwargs, manifest, chunk_values = kwargs
+        result = DeployResult(name=spec.name, action=action)
+        try:
+            if action == DeployActionEnum.create.value:
+                result.resource = _write_secret(
+                    sm_client,
+                    name_or_arn=spec.name,
+                    create_or_update_secret_kwargs=create_or_update_secret_kwargs,
+                    is_create=True,
+                    manifest=manifest,
+                    chunk_values=chunk_values,
+                    kms_key_id=spec.kms_key_id,
+                    tags=tags,
+                    # already in a worker of the bounded thread pool
+                    max_workers=1,
+                )
+            else:
+                if action == DeployActionEnum.update.value:
+                    result.resource = _write_secret(
+                        sm_client,
+                        name_or_arn=spec.name,
+                        create_or_update_secret_kwargs=create_or_update_secret_kwargs,
+                        is_create=False,
+                        manifest=manifest,
+                        chunk_values=chunk_values,
+                        kms_key_id=spec.kms_key_id,
+                        max_workers=1,
+                    )
+                _reconcile_secret_tags(
+                    sm_client,
+                    spec.name,
+                    tags,
+                    existing_tags=existing_secrets[spec.name].tags,
+                    # the content hash tag alone is always merged
+                    replace_tags=spec.replace_tags and (spec.tags is not None),
+                )
+        except Exception as e:
+            result.error = e
+        return result
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(execute, plan))
+
+
+def delete_secret(
+    sm_client,
+    name_or_arn: str,
+    recovery_window_in_days: T.Optional[int] = None,
+    force_delete_without_recovery: T.Optional[bool] = None,
+    delete_chunks: bool = False,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> bool:
+    """
+    Delete a Secret.
+
+    Ref:
+
+    - delete_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.delete_secret
+
+    :param sm_client: the boto3 secretmanager client.
+    :param name_or_arn: name or the ARN of this secret.
+    :param recovery_window_in_days: see official document.
+    :param force_delete_without_recovery: see official document.
+    :param delete_chunks: also delete the chunks of the chunked secret
+        (see ``chunked`` in :func:`deploy_secret`) with the same arguments?
+        It is one more ``list_secrets`` API call, so it is off by default.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
+    :return: a boolean value to indicate whether a deletion happened.
+    """
+    sm_client = throttle_client(sm_client, rate_limiter)
+    kwargs = dict(SecretId=name_or_arn)
+    if recovery_window_in_days is not None:  # pragma: no cover
         kwargs["RecoveryWindowInDays"] = recovery_window_in_days
     if force_delete_without_recovery is not None:
         kwargs["ForceDeleteWithoutRecovery"] = force_delete_without_recovery
     try:
-        sm_client.delete_secret(**kwargs)
-        return True
+        response = sm_client.delete_secret(**kwargs)
     except Exception as e:
         if "ResourceNotFoundException" in str(e):
             return False
         else:  # pragma: no cover
             raise e
+    if delete_chunks:
+        _delete_secret_chunks(sm_client, [response["Name"]], kwargs)
+    return True
+
+
+def delete_secrets(
+    sm_client,
+    names_or_arns: T.Iterable[str],
+    recovery_window_in_days: T.Optional[int] = None,
+    force_delete_without_recovery: T.Optional[bool] = None,
+    delete_chunks: bool = False,
+    max_workers: T.Optional[int] = None,
+    rate_limiter: T.Optional[RateLimiter] = None,
+) -> T.Tuple[T.Set[str], T.Set[str]]:
+    """
+    Delete many secrets concurrently on a bounded thread pool. There is no
+    batch delete API for secret manager, one ``delete_secret`` call is made
+    per secret.
+
+    Ref:
+
+    - delete_secret: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.delete_secret
+    - list_secrets: https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/secretsmanager.html#SecretsManager.Client.list_secrets
+
+    :param names_or_arns: the secret names or ARNs to delete.
+    :param recovery_window_in_days: see official document.
+    :param force_delete_without_recovery: see official document.
+    :param delete_chunks: if True, also delete the chunks of the chunked
+        secrets (see ``chunked`` in :func:`deploy_secret`) with the same
+        arguments, they are found with one ``list_secrets`` call per 10 secrets.
+        It is off by default to avoid these calls.
+    :param max_workers: max number of threads to use.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+
+    :return: a tuple of two sets, the deleted secret names or ARNs, and the
+        secret names or ARNs that don't exist. The chunks found by
+        ``delete_chunks`` are not included.
+    """
+    sm_client = throttle_client(sm_client, rate_limiter)
+    names_or_arns = list(dict.fromkeys(names_or_arns))
+    kwargs = dict()
+    if recovery_window_in_days is not None:  # pragma: no cover
+        kwargs["RecoveryWindowInDays"] = recovery_window_in_days
+    if force_delete_without_recovery is not None:
+        kwargs["ForceDeleteWithoutRecovery"] = force_delete_without_recovery
+
+    def delete(name_or_arn: str) -> T.Optional[str]:
+        try:
+            response = sm_client.delete_secret(SecretId=name_or_arn, **kwargs)
+        except Exception as e:
+            if "ResourceNotFoundException" in str(e):
+                return None
+            else:  # pragma: no cover
+                raise e
+        return response["Name"]
+
+    deleted: T.Set[str] = set()
+    not_found: T.Set[str] = set()
+    deleted_names: T.List[str] = list()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for name_or_arn, name in zip(
+            names_or_arns, executor.map(delete, names_or_arns)
+        ):
+            if name is None:
+                not_found.add(name_or_arn)
+            else:
+                deleted.add(name_or_arn)
+                deleted_names.append(name)
+
+    if delete_chunks and len(deleted_names):
+        _delete_secret_chunks(
+            sm_client,
+            deleted_names,
+            kwargs,
+            max_workers=max_workers,
+        )
+    return deleted, not_found
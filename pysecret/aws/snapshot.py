@@ -0,0 +1,389 @@
+# -*- coding: utf-8 -*-
+
+"""
+Encrypted on-disk warm-start snapshot of AWS Parameter Store parameters and
+AWS Secret Manager secrets.
+
+Every cold start of a Lambda function or a container fetches the same secrets
+again. :class:`Snapshot` writes the fetched values to a local file (for example
+in ``/tmp``), encrypted with :class:`~pysecret.aws.kms.KmsEnvelopeCipher`.
+On the next start, the values are loaded from the file instantly, and
+revalidated against AWS in background.
+
+.. note::
+
+    This feature requires the ``cryptography`` library, install it with
+    ``pip install pysecret[encrypt]``.
+"""
+
+import typing as T
+import os
+import enum
+import json
+import time
+import base64
+import threading
+import dataclasses
+from pathlib import Path
+from datetime import datetime
+
+from .kms import KmsEnvelopeCipher
+from .chunking import ChunkManifest
+from .parameter_store import Parameter
+from .secret_manager import Secret
+
+
+def _encode_value(value: T.Any) -> T.Any:
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, (bytes, memoryview)):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, ChunkManifest):
+        return {"__chunk_manifest__": dataclasses.asdict(value)}
+    if isinstance(value, list):
+        return [_encode_value(item) for item in value]
+    return value
+
+
+def _decode_value(value: T.Any) -> T.Any:
+    if isinstance(value, dict):
+        if "__datetime__" in value:
+            return datetime.fromisoformat(value["__datetime__"])
+        if "__bytes__" in value:
+            return base64.b64decode(value["__bytes__"])
+        if "__chunk_manifest__" in value:
+            return ChunkManifest(**value["__chunk_manifest__"])
+    if isinstance(value, list):
+        return [_decode_value(item) for item in value]
+    return value
+
+
+def _dump_dataclass(obj) -> dict:
+    return {
+        field.name: _encode_value(getattr(obj, field.name))
+        for field in dataclasses.fields(obj)
+    }
+
+
+def _load_dataclass(klass, data: dict):
+    return klass(**{key: _decode_value(value) for key, value in data.items()})
+
+
+class SnapshotKindEnum(str, enum.Enum):
+    parameter = "parameter"
+    secret = "secret"
+
+
+@dataclasses.dataclass
+class SnapshotEntry:
+    """
+    A parameter or secret in the :class:`Snapshot`.
+
+    :param kind: ``"parameter"`` or ``"secret"``.
+    :param value: the :class:`~pysecret.aws.parameter_store.Parameter` or
+        :class:`~pysecret.aws.secret_manager.Secret` object.
+    :param fetched_at: the unix timestamp when the value is fetched from AWS.
+    """
+
+    kind: str = dataclasses.field()
+    value: T.Union[Parameter, Secret] = dataclasses.field()
+    fetched_at: float = dataclasses.field()
+
+    def to_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "value": _dump_dataclass(self.value),
+            "fetched_at": self.fetched_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "SnapshotEntry":
+        if data["kind"] == SnapshotKindEnum.parameter.value:
+            value = _load_dataclass(Parameter, data["value"])
+        else:
+            value = _load_dataclass(Secret, data["value"])
+        return cls(kind=data["kind"], value=value, fetched_at=data["fetched_at"])
+
+
+class Snapshot:
+    """
+    Encrypted on-disk warm-start snapshot.
+
+    - :meth:`Snapshot.get_parameter` and :meth:`Snapshot.get_secret` return
+        the value from the snapshot if it is not expired, otherwise load it
+        from AWS and put it into the snapshot.
+    - :meth:`Snapshot.read` loads the snapshot file, it returns False and
+        starts with an empty snapshot if the file is missing, corrupted,
+        or written by a different envelope format version. KMS errors are
+        raised.
+    - :meth:`Snapshot.revalidate` checks the cached versions against AWS and
+        reloads the changed ones, :meth:`Snapshot.start_revalidate` does it in
+        a background thread.
+    - :meth:`Snapshot.write` saves the snapshot to the file.
+
+    The file content is a KMS envelope made by
+    :class:`~pysecret.aws.kms.KmsEnvelopeCipher`, the data is encrypted locally
+    with AES-GCM and the KMS wrapped data key is stored in the header. The
+    data key is reused by the following writes, reading the snapshot costs
+    one KMS decrypt call.
+
+    Example::
+
+        >>> snapshot = Snapshot(
+        ...     path="/tmp/pysecret-snapshot.bin",
+        ...     kms_client=boto3.client("kms"),
+        ...     kms_key_id="alias/my-key",
+        ...     ttl=3600,
+        ... )
+        >>> snapshot.read()
+        >>> parameter = snapshot.get_parameter(ssm_client, "/myapp/prod/config")
+        >>> secret = snapshot.get_secret(sm_client, "myapp/prod/db")
+        >>> snapshot.write()
+        >>> snapshot.start_revalidate(ssm_client=ssm_client, sm_client=sm_client)
+
+    :param path: the snapshot file path.
+    :param kms_client: the boto3 kms client.
+    :param kms_key_id: the KMS key to encrypt the data key.
+    :param ttl: how long in seconds a value in the snapshot can be used.
+    """
+
+    def __init__(
+        self,
+        path: T.Union[str, Path],
+        kms_client,
+        kms_key_id: str,
+        ttl: float = 3600,
+    ):
+        self.path = Path(path)
+        self.kms_client = kms_client
+        self.kms_key_id = kms_key_id
+        self.ttl = ttl
+        self._cipher = KmsEnvelopeCipher(kms_client, kms_key_id)
+        self.entries: T.Dict[T.Tuple[str, str], SnapshotEntry] = dict()
+        self._lock = threading.RLock()
+
+    def _is_fresh(self, entry: SnapshotEntry) -> bool:
+        return (time.time() - entry.fetched_at) < self.ttl
+
+    # --------------------------------------------------------------------------
+    # read / write
+    # --------------------------------------------------------------------------
+    def read(self) -> bool:
+        """
+        Read the snapshot file. Expired entries are dropped.
+
+        It returns False if the file is missing, it is not a valid envelope,
+        it is modified, or the decrypted content is not a snapshot. Other
+        errors, such as a KMS access denial, a wrong key or throttling, are
+        raised, so that the following :meth:`Snapshot.write` won't overwrite
+        a good snapshot file.
+
+        :return: a boolean flag to indicate whether the snapshot file is loaded.
+        """
+        try:
+            data = self.path.read_bytes()
+        except FileNotFoundError:
+            return False
+
+        try:
+            blob = self._cipher.decrypt(data)
+        # not a KMS envelope, or the header / ciphertext is modified
+        except ValueError:
+            return False
+        except Exception as e:
+            # the wrapped data key in the header is corrupted
+            if "InvalidCiphertextException" in str(e):
+                return False
+            else:
+                raise e
+
+        try:
+            content = json.loads(blob.decode("utf-8"))
+            entries = dict()
+            for dct in content["entries"]:
+                entry = SnapshotEntry.from_dict(dct)
+                if self._is_fresh(entry):
+                    entries[(entry.kind, entry.value.Name)] = entry
+        # the decrypted content is not a snapshot
+        except (ValueError, KeyError, TypeError):
+            return False
+        with self._lock:
+            self.entries = entries
+        return True
+
+    def write(self):
+        """
+        Encrypt and write the snapshot to the file, the file is only readable
+        by the current user.
+        """
+        with self._lock:
+            content = {
+                "entries": [entry.to_dict() for entry in self.entries.values()],
+            }
+        blob = self._cipher.encrypt(json.dumps(content).encode("utf-8"))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        path_tmp = self.path.with_name(self.path.name + ".tmp")
+        fd = os.open(str(path_tmp), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(blob)
+        os.replace(str(path_tmp), str(self.path))
+
+    def clear(self):
+        """
+        Remove all entries and delete the snapshot file.
+        """
+        with self._lock:
+            self.entries.clear()
+        if self.path.exists():
+            self.path.unlink()
+
+    # --------------------------------------------------------------------------
+    # get
+    # --------------------------------------------------------------------------
+    def _put(self, kind: str, value: T.Union[Parameter, Secret]):
+        with self._lock:
+            self.entries[(kind, value.Name)] = SnapshotEntry(
+                kind=kind,
+                value=value,
+                fetched_at=time.time(),
+            )
+
+    def _get(self, kind: str, name: str) -> T.Optional[SnapshotEntry]:
+        with self._lock:
+            entry = self.entries.get((kind, name))
+        if (entry is not None) and self._is_fresh(entry):
+            return entry
+        return None
+
+    def get_parameter(
+        self,
+        ssm_client,
+        name: str,
+    ) -> T.Optional[Parameter]:
+        """
+        Get the latest version of a parameter from the snapshot, load it from
+        AWS if it is not in the snapshot or expired.
+        """
+        entry = self._get(SnapshotKindEnum.parameter.value, name)
+        if entry is not None:
+            return entry.value
+        parameter = Parameter.load(ssm_client, name, with_decryption=True)
+        if parameter is not None:
+            self._put(SnapshotKindEnum.parameter.value, parameter)
+        return parameter
+
+    def get_secret(
+        self,
+        sm_client,
+        name: str,
+    ) -> T.Optional[Secret]:
+        """
+        Get the current version of a secret from the snapshot, load it from
+        AWS if it is not in the snapshot or expired.
+
+        :param name: the secret name, don't use ARN here.
+        """
+        entry = self._get(SnapshotKindEnum.secret.value, name)
+        if entry is not None:
+            return entry.value
+        secret = Secret.load(sm_client, name)
+        if secret is not None:
+            self._put(SnapshotKindEnum.secret.value, secret)
+        return secret
+
+    # --------------------------------------------------------------------------
+    # revalidate
+    # --------------------------------------------------------------------------
+    def revalidate(
+        self,
+        ssm_client=None,
+        sm_client=None,
+        write: bool = True,
+    ) -> T.List[str]:
+        """
+        Check the versions in the snapshot against AWS, reload the changed
+        ones and remove the deleted ones.
+
+        - parameters are reloaded in batch with
+            :meth:`~pysecret.aws.parameter_store.Parameter.load_many`.
+        - secrets are checked with ``describe_secret``, the value is only
+            fetched if the ``AWSCURRENT`` version id is changed.
+
+        :param ssm_client: if None, don't revalidate parameters.
+        :param sm_client: if None, don't revalidate secrets.
+        :param write: write the snapshot file after revalidation?
+
+        :return: the names of changed or deleted parameters / secrets.
+        """
+        with self._lock:
+            entries = list(self.entries.values())
+        changed = list()
+
+        if ssm_client is not None:
+            old_parameters = {
+                entry.value.Name: entry.value
+                for entry in entries
+                if entry.kind == SnapshotKindEnum.parameter.value
+            }
+            if len(old_parameters):
+                parameters, invalid_names = Parameter.load_many(
+                    ssm_client,
+                    list(old_parameters),
+                    with_decryption=True,
+                )
+                for parameter in parameters:
+                    self._put(SnapshotKindEnum.parameter.value, parameter)
+                    if parameter.Version != old_parameters[parameter.Name].Version:
+                        changed.append(parameter.Name)
+                with self._lock:
+                    for name in invalid_names:
+                        self.entries.pop((SnapshotKindEnum.parameter.value, name), None)
+                        changed.append(name)
+
+        if sm_client is not None:
+            for entry in entries:
+                if entry.kind != SnapshotKindEnum.secret.value:
+                    continue
+                secret = entry.value
+                try:
+                    response = sm_client.describe_secret(SecretId=secret.Name)
+                except Exception as e:
+                    if "ResourceNotFoundException" in str(e):
+                        with self._lock:
+                            self.entries.pop((entry.kind, secret.Name), None)
+                        changed.append(secret.Name)
+                        continue
+                    else:  # pragma: no cover
+                        raise e
+                version_ids_to_stages = response.get("VersionIdsToStages", {})
+                if "AWSCURRENT" in version_ids_to_stages.get(secret.VersionId, []):
+                    self._put(SnapshotKindEnum.secret.value, secret)
+                else:
+                    new_secret = Secret.load(sm_client, secret.Name)
+                    if new_secret is not None:
+                        self._put(SnapshotKindEnum.secret.value, new_secret)
+                    changed.append(secret.Name)
+
+        if write:
+            self.write()
+        return changed
+
+    def start_revalidate(
+        self,
+        ssm_client=None,
+        sm_client=None,
+        write: bool = True,
+    ) -> threading.Thread:
+        """
+        Run :meth:`Snapshot.revalidate` in a background daemon thread.
+
+        :return: the thread object, you can call ``thread.join()`` to wait.
+        """
+        thread = threading.Thread(
+            target=self.revalidate,
+            kwargs=dict(ssm_client=ssm_client, sm_client=sm_client, write=write),
+            name="pysecret-snapshot-revalidate",
+            daemon=True,
+        )
+        thread.start()
+        return thread
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import typing as T
+import dataclasses
 
 
 def encode_tags(tags: T.Dict[str, str]) -> T.List[T.Dict[str, str]]:
@@ -9,3 +10,80 @@ def encode_tags(tags: T.Dict[str, str]) -> T.List[T.Dict[str, str]]:
 
 def decode_tags(tag_list: T.List[T.Dict[str, str]]) -> T.Dict[str, str]:
     return {dct["Key"]: dct["Value"] for dct in tag_list}
+
+
+@dataclasses.dataclass
+class TagDiff:
+    """
+    The minimal changes to turn the existing tags into the desired tags.
+
+    :param to_remove: the tag keys to remove.
+    :param to_add: the tags to add or to update value.
+    """
+
+    to_remove: T.List[str] = dataclasses.field(default_factory=list)
+    to_add: T.Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    @property
+    def is_empty(self) -> bool:
+        return (len(self.to_remove) == 0) and (len(self.to_add) == 0)
+
+
+def diff_tags(
+    existing_tags: T.Dict[str, str],
+    desired_tags: T.Dict[str, str],
+    replace: bool = True,
+) -> TagDiff:
+    """
+    Compute the exact tag keys to remove and the tags to add or update.
+
+    Example::
+
+        >>> diff_tags({"a": "1", "b": "2"}, {"b": "3", "c": "4"})
+        TagDiff(to_remove=['a'], to_add={'b': '3', 'c': '4'})
+        >>> diff_tags({"a": "1", "b": "2"}, {"b": "3", "c": "4"}, replace=False)
+        TagDiff(to_remove=[], to_add={'b': '3', 'c': '4'})
+
+    :param replace: if True, the existing tags not in the desired tags are
+        removed (full replacement), otherwise they are kept (merge).
+    """
+    return TagDiff(
+        to_remove=[
+            key for key in existing_tags if replace and (key not in desired_tags)
+        ],
+        to_add={
+            key: value
+            for key, value in desired_tags.items()
+            if existing_tags.get(key) != value
+        },
+    )
+
+
+def reconcile_tags(
+    existing_tags: T.Dict[str, str],
+    desired_tags: T.Dict[str, str],
+    remove_tags: T.Callable[[T.List[str]], T.Any],
+    add_tags: T.Callable[[T.Dict[str, str]], T.Any],
+    replace: bool = True,
+) -> TagDiff:
+    """
+    Full replacement (or merge) update the tags of a resource with the minimal
+    API calls. The API calls are skipped entirely if the tags already match.
+
+    :param existing_tags: the current tags of the resource.
+    :param desired_tags: the tags the resource should have after the update.
+    :param remove_tags: a function that takes a list of tag keys and removes
+        them from the resource.
+    :param add_tags: a function that takes a tag dict and adds or updates
+        them on the resource.
+    :param replace: if False, the existing tags not in the desired tags
+        are kept, see :func:`diff_tags`.
+
+    :return: the :class:`TagDiff` that has been applied.
+    """
+    tag_diff = diff_tags(existing_tags, desired_tags, replace=replace)
+    if len(tag_diff.to_remove):
+        remove_tags(tag_diff.to_remove)
+    if len(tag_diff.to_add):
+        add_tags(tag_diff.to_add)
+    return tag_diff
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+
+"""
+Client side rate limiting and retry on throttling for the AWS API calls.
+
+AWS Parameter Store and Secret Manager have low default API quota for the
+write and tagging APIs, burst deployment easily hits ``ThrottlingException``.
+:class:`RateLimiter` keeps one token bucket per service and API class
+(read, write, tag), shared across threads. When AWS throttles a call, the
+bucket rate is cut in half and the call is retried with exponential backoff
+and jitter; each successful call increases the rate a little bit until
+the configured rate is reached again (AIMD).
+
+Usage::
+
+    >>> from pysecret import Parameter, default_rate_limiter
+    >>> Parameter.load(ssm_client, "my-param", rate_limiter=default_rate_limiter)
+
+    # or wrap the client once and use it everywhere
+    >>> ssm_client = default_rate_limiter.wrap(ssm_client)
+"""
+
+import typing as T
+import enum
+import time
+import random
+import functools
+import threading
+
+
+class ApiClassEnum(str, enum.Enum):
+    read = "read"
+    write = "write"
+    tag = "tag"
+
+
+TAG_METHODS = {
+    "list_tags_for_resource",
+    "add_tags_to_resource",
+    "remove_tags_from_resource",
+    "tag_resource",
+    "untag_resource",
+}
+
+READ_METHOD_PREFIXES = (
+    "get_",
+    "batch_get_",
+    "describe_",
+    "list_",
+)
+
+THROTTLING_ERROR_CODES = (
+    "ThrottlingException",
+    "Throttling",
+    "TooManyRequestsException",
+    "TooManyUpdates",
+    "RequestLimitExceeded",
+    "Rate exceeded",
+)
+
+#: the default rate (requests per second) of each service and API class,
+#: they are conservative values based on the default AWS API quota.
+DEFAULT_RATES: T.Dict[T.Tuple[str, str], float] = {
+    ("ssm", ApiClassEnum.read.value): 40,
+    ("ssm", ApiClassEnum.write.value): 3,
+    ("ssm", ApiClassEnum.tag.value): 3,
+    ("secretsmanager", ApiClassEnum.read.value): 50,
+    ("secretsmanager", ApiClassEnum.write.value): 20,
+    ("secretsmanager", ApiClassEnum.tag.value): 20,
+}
+DEFAULT_RATE = 10
+
+#: the client methods that are not API call
+NON_API_METHODS = {
+    "can_paginate",
+    "close",
+    "generate_presigned_url",
+    "get_paginator",
+    "get_waiter",
+}
+
+
+def get_service_name(client) -> str:
+    """
+    Get the AWS service name of a boto3 client, for example ``"ssm"``.
+    """
+    return client.meta.service_model.service_name
+
+
+def get_api_class(method: str) -> str:
+    """
+    Get the API class of a client method, see :class:`ApiClassEnum`.
+    The unknown methods are considered as write.
+    """
+    if method in TAG_METHODS:
+        return ApiClassEnum.tag.value
+    if method.startswith(READ_METHOD_PREFIXES):
+        return ApiClassEnum.read.value
+    return ApiClassEnum.write.value
+
+
+def is_throttling_error(e: Exception) -> bool:
+    """
+    Check whether the exception means the API call is throttled.
+    """
+    msg = str(e)
+    return any(code in msg for code in THROTTLING_ERROR_CODES)
+
+
+class TokenBucket:
+    """
+    Thread safe token bucket with AIMD (additive increase, multiplicative
+    decrease) rate adjustment.
+
+    :param rate: the max number of tokens refilled per second.
+    :param burst: the capacity of the bucket, default is ``rate``.
+    :param min_rate: the rate never goes below this value,
+        default is 1/20 of the ``rate``.
+    :param increase: the rate increment after each successful call,
+        default is 1/20 of the ``rate``.
+    :param decrease_factor: the rate is multiplied by this factor
+        after each throttled call.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: T.Optional[float] = None,
+        min_rate: T.Optional[float] = None,
+        increase: T.Optional[float] = None,
+        decrease_factor: float = 0.5,
+        clock: T.Callable[[], float] = time.monotonic,
+        sleep: T.Callable[[float], None] = time.sleep,
+    ):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, rate) if burst is None else burst
+        self.min_rate = rate / 20 if min_rate is None else min_rate
+        self.increase = rate / 20 if increase is None else increase
+        self.decrease_factor = decrease_factor
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated_at = clock()
+
+        self.n_acquires: int = 0
+        self.n_waits: int = 0
+        self.wait_seconds: float = 0.0
+        self.n_throttles: int = 0
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(
+            self.burst,
+            self._tokens + (now - self._updated_at) * self.rate,
+        )
+        self._updated_at = now
+
+    def acquire(self) -> float:
+        """
+        Take one token, block until it is available. The token is reserved
+        before sleeping, so concurrent callers are served in order.
+
+        :return: the seconds waited.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            self.n_acquires += 1
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self.rate
+            self.n_waits += 1
+            self.wait_seconds += wait
+        self._sleep(wait)
+        return wait
+
+    def on_success(self):
+        with self._lock:
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self):
+        with self._lock:
+            self._refill()
+            self.n_throttles += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0)
+
+    def to_dict(self) -> dict:
+        return dict(
+            rate=self.rate,
+            max_rate=self.max_rate,
+            n_acquires=self.n_acquires,
+            n_waits=self.n_waits,
+            wait_seconds=self.wait_seconds,
+            n_throttles=self.n_throttles,
+        )
+
+
+class RateLimiter:
+    """
+    Rate limiter and retry engine, it keeps one :class:`TokenBucket` per
+    service and API class, shared across threads.
+
+    :param rates: the rate (requests per second) of ``(service, api_class)``,
+        it overrides the :data:`DEFAULT_RATES`.
+    :param max_retries: max number of retries of a throttled call.
+    :param base_delay: the base delay in seconds of the exponential backoff.
+    :param max_delay: the max delay in seconds of the exponential backoff.
+    """
+
+    def __init__(
+        self,
+        rates: T.Optional[T.Dict[T.Tuple[str, str], float]] = None,
+        max_retries: int = 5,
+        base_delay: float = 0.1,
+        max_delay: float = 10.0,
+        clock: T.Callable[[], float] = time.monotonic,
+        sleep: T.Callable[[float], None] = time.sleep,
+    ):
+        self.rates = dict(DEFAULT_RATES)
+        if rates is not None:
+            self.rates.update(rates)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: T.Dict[T.Tuple[str, str], TokenBucket] = dict()
+
+        self.n_retries: int = 0
+
+    def get_bucket(self, service: str, api_class: str) -> TokenBucket:
+        key = (service, api_class)
+        with self._lock:
+            try:
+                return self._buckets[key]
+            except KeyError:
+                bucket = TokenBucket(
+                    rate=self.rates.get(key, DEFAULT_RATE),
+                    clock=self._clock,
+                    sleep=self._sleep,
+                )
+                self._buckets[key] = bucket
+                return bucket
+
+    def call(self, client, method: str, **kwargs):
+        """
+        Call the client method under the rate limit, retry if it is throttled.
+        """
+        bucket = self.get_bucket(get_service_name(client), get_api_class(method))
+        func = getattr(client, method)
+        attempt = 0
+        while 1:
+            bucket.acquire()
+            try:
+                response = func(**kwargs)
+            except Exception as e:
+                if is_throttling_error(e) and (attempt < self.max_retries):
+                    bucket.on_throttle()
+                    with self._lock:
+                        self.n_retries += 1
+                    delay = min(self.max_delay, self.base_delay * (2**attempt))
+                    self._sleep(random.uniform(0, delay))
+                    attempt += 1
+                    continue
+                raise e
+            bucket.on_success()
+            return response
+
+    def wrap(self, client) -> "ThrottledClient":
+        """
+        Wrap a boto3 client, all API calls of the wrapped client go through
+        this rate limiter.
+        """
+        return throttle_client(client, self)
+
+    @property
+    def n_waits(self) -> int:
+        return sum(bucket.n_waits for bucket in list(self._buckets.values()))
+
+    @property
+    def wait_seconds(self) -> float:
+        return sum(bucket.wait_seconds for bucket in list(self._buckets.values()))
+
+    @property
+    def n_throttles(self) -> int:
+        return sum(bucket.n_throttles for bucket in list(self._buckets.values()))
+
+    def stats(self) -> T.Dict[str, dict]:
+        """
+        Get the counters of each bucket, the key is ``${service}.${api_class}``.
+        """
+        return {
+            f"{service}.{api_class}": bucket.to_dict()
+            for (service, api_class), bucket in list(self._buckets.items())
+        }
+
+
+class ThrottledClient:
+    """
+    A boto3 client proxy, the API calls go through the :class:`RateLimiter`,
+    other attributes are forwarded to the original client.
+    """
+
+    def __init__(self, client, rate_limiter: RateLimiter):
+        self._client = client
+        self._rate_limiter = rate_limiter
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._client, name)
+        if name.startswith("_") or (name in NON_API_METHODS) or not callable(attr):
+            return attr
+        return functools.partial(self._rate_limiter.call, self._client, name)
+
+
+def throttle_client(client, rate_limiter: T.Optional[RateLimiter] = None):
+    """
+    Wrap the client with the rate limiter, return the client as it is
+    if the rate limiter is None or the client is already wrapped by it.
+    """
+    if rate_limiter is None:
+        return client
+    if isinstance(client, ThrottledClient):
+        if client._rate_limiter is rate_limiter:
+            return client
+        client = client._client
+    return ThrottledClient(client, rate_limiter)
+
+
+#: the process-wide rate limiter
+default_rate_limiter = RateLimiter()
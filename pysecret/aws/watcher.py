@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+"""
+Watch AWS Parameter Store parameters and push the changes to callbacks.
+"""
+
+import typing as T
+import random
+import threading
+from datetime import datetime
+
+from ..helper import chunks
+from .chunking import is_chunk_name
+from .throttle import RateLimiter, throttle_client
+from .parameter_store import (
+    DESCRIBE_PARAMETERS_FILTER_VALUES_LIMIT,
+    Parameter,
+    _iter_describe_parameters,
+)
+
+
+class ParameterWatcher:
+    """
+    Poll the parameter metadata with the ``describe_parameters`` API, it
+    doesn't return the value, so there is no decryption cost. The
+    ``(Version, LastModifiedDate)`` of each parameter is compared with the
+    last seen state, and only the changed parameters are reloaded with the
+    batch ``get_parameters`` API (see :meth:`~pysecret.aws.parameter_store.Parameter.load_many`).
+    Then the registered callbacks are called.
+
+    Example::
+
+        >>> watcher = ParameterWatcher(boto3.client("ssm"), path="/myapp/prod")
+        >>> @watcher.subscribe
+        ... def on_change(name, old, new):
+        ...     print(f"{name} is changed")
+        >>> watcher.start()
+        >>> watcher.get("/myapp/prod/config").json_dict
+        >>> watcher.stop()
+
+    The first poll loads all watched parameters, the callbacks are called with
+    ``old = None``.
+
+    :param ssm_client: the boto3 ssm client.
+    :param path: watch all parameters under this hierarchy path.
+    :param names: watch these parameter names. At least one of ``path`` and
+        ``names`` has to be set.
+    :param recursive: also watch the parameters in the sub paths of ``path``?
+    :param with_decryption: decrypt SecureString when reloading.
+    :param interval: how often in seconds the background worker polls.
+    :param jitter: a random delay between 0 and ``jitter`` seconds is added to
+        each ``interval``, so a fleet of processes doesn't poll at the same time.
+    :param max_workers: max number of threads to reload parameters.
+    :param rate_limiter: the :class:`~pysecret.aws.throttle.RateLimiter`
+        to throttle and retry the API calls, if None, no rate limiting.
+    """
+
+    def __init__(
+        self,
+        ssm_client,
+        path: T.Optional[str] = None,
+        names: T.Optional[T.Iterable[str]] = None,
+        recursive: bool = True,
+        with_decryption: bool = True,
+        interval: float = 30,
+        jitter: float = 5,
+        max_workers: T.Optional[int] = None,
+        rate_limiter: T.Optional[RateLimiter] = None,
+    ):
+        if (path is None) and (names is None):
+            raise ValueError("you have to set at least one of `path` and `names`!")
+        self.ssm_client = throttle_client(ssm_client, rate_limiter)
+        self.path = path
+        self.names = None if names is None else list(dict.fromkeys(names))
+        self.recursive = recursive
+        self.with_decryption = with_decryption
+        self.interval = interval
+        self.jitter = jitter
+        self.max_workers = max_workers
+
+        self._parameters: T.Dict[str, Parameter] = dict()
+        self._state: T.Dict[str, T.Tuple[int, datetime]] = dict()
+        self._lock = threading.RLock()
+        self._poll_lock = threading.Lock()
+        self._callbacks: T.List[T.Callable] = list()
+        self._thread: T.Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.polls: int = 0
+        self.reloads: int = 0
+        self.poll_errors: int = 0
+
+    @property
+    def is_running(self) -> bool:
+        """
+        Is the background worker thread running?
+        """
+        return (self._thread is not None) and self._thread.is_alive()
+
+    @property
+    def parameters(self) -> T.Dict[str, Parameter]:
+        """
+        The latest value of all watched parameters.
+        """
+        with self._lock:
+            return dict(self._parameters)
+
+    def get(self, name: str) -> T.Optional[Parameter]:
+        """
+        Get the latest value of a watched parameter, None if the parameter
+        doesn't exist or hasn't been loaded yet.
+        """
+        return self._parameters.get(name)
+
+    def subscribe(
+        self,
+        callback: T.Callable[
+            [str, T.Optional[Parameter], T.Optional[Parameter]], T.Any
+        ],
+    ) -> T.Callable:
+        """
+        Register a "value changed" callback, it is called as
+        ``callback(name, old_value, new_value)`` when a parameter is changed.
+        ``old_value`` is None if it is the first time the parameter is loaded,
+        ``new_value`` is None if the parameter is deleted.
+
+        :return: the callback itself, so it can be used as a decorator.
+        """
+        with self._lock:
+            self._callbacks.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: T.Callable):
+        with self._lock:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def _notify(
+        self,
+        name: str,
+        old_value: T.Optional[Parameter],
+        new_value: T.Optional[Parameter],
+    ):
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
+            try:
+                callback(name, old_value, new_value)
+            except Exception:  # pragma: no cover
+                pass
+
+    def _describe(self) -> T.Dict[str, T.Tuple[int, datetime]]:
+        """
+        Get the ``(Version, LastModifiedDate)`` of all watched parameters.
+        """
+        filters_list: T.List[T.List[dict]] = list()
+        if self.path is not None:
+            filters_list.append(
+                [
+                    {
+                        "Key": "Path",
+                        "Option": "Recursive" if self.recursive else "OneLevel",
+                        "Values": [self.path],
+                    }
+                ]
+            )
+        if self.names is not None:
+            for chunk in chunks(self.names, DESCRIBE_PARAMETERS_FILTER_VALUES_LIMIT):
+                filters_list.append(
+                    [{"Key": "Name", "Option": "Equals", "Values": chunk}]
+                )
+        state = dict()
+        for parameter_filters in filters_list:
+            for dct in _iter_describe_parameters(self.ssm_client, parameter_filters):
+                if is_chunk_name(dct["Name"]):
+                    continue
+                state[dct["Name"]] = (dct.get("Version"), dct.get("LastModifiedDate"))
+        return state
+
+    def poll_once(self) -> T.List[str]:
+        """
+        Poll the parameter metadata once, reload the changed parameters
+        and call the callbacks. This is what the background worker does in
+        every ``interval``.
+
+        :return: the names of the changed (including new and deleted) parameters.
+        """
+        with self._poll_lock:
+            latest_state = self._describe()
+            with self._lock:
+                self.polls += 1
+                changed_names = [
+                    name
+                    for name, state in latest_state.items()
+                    if self._state.get(name) != state
+                ]
+                removed_names = [
+                    name for name in self._state if name not in latest_state
+                ]
+
+            parameters, _ = Parameter.load_many(
+                self.ssm_client,
+                changed_names,
+                with_decryption=self.with_decryption,
+                max_workers=self.max_workers,
+            )
+
+            changes: T.List[T.Tuple[str, T.Optional[Parameter], T.Optional[Parameter]]]
+            changes = list()
+            with self._lock:
+                self.reloads += len(parameters)
+                for parameter in parameters:
+                    name = parameter.Name
+                    # the parameter may be updated again after describe_parameters
+                    self._state[name] = (
+                        parameter.Version,
+                        parameter.LastModifiedDate,
+                    )
+                    changes.append((name, self._parameters.get(name), parameter))
+                    self._parameters[name] = parameter
+                for name in removed_names:
+                    self._state.pop(name, None)
+                    changes.append((name, self._parameters.pop(name, None), None))
+
+            for name, old_value, new_value in changes:
+                self._notify(name, old_value, new_value)
+            return [name for name, _, _ in changes]
+
+    def _run(self):
+        while 1:
+            interval = self.interval + random.uniform(0, self.jitter)
+            if self._stop_event.wait(interval):
+                break
+            try:
+                self.poll_once()
+            except Exception:
+                # keep the last value, retry in next round
+                with self._lock:
+                    self.poll_errors += 1
+
+    def start(self, initial_poll: bool = True):
+        """
+        Start the background worker thread. The thread is a daemon thread,
+        it won't block the interpreter from exiting.
+
+        :param initial_poll: if True, do the first poll in the current thread,
+            so the parameters are available when this method returns.
+        """
+        if self.is_running:
+            return
+        if initial_poll:
+            self.poll_once()
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="pysecret-parameter-watcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: T.Optional[float] = None):
+        """
+        Stop the background worker thread.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import typing as T
+from concurrent.futures import ThreadPoolExecutor
 
 
 def ensure_only_one_true(kv_list: T.List[T.Tuple[str, bool]]):
@@ -10,3 +11,35 @@ def ensure_only_one_true(kv_list: T.List[T.Tuple[str, bool]]):
                 ", ".join([f"{k!r}" for k, _ in kv_list])
             )
         )
+
+
+def chunks(items: T.List[T.Any], size: int) -> T.List[T.List[T.Any]]:
+    """
+    Split a list into consecutive sub lists with at most ``size`` items.
+
+    Example::
+
+        >>> chunks([1, 2, 3, 4, 5], 2)
+        [[1, 2], [3, 4], [5]]
+    """
+    if size < 1:
+        raise ValueError("size has to be a positive integer!")
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def concurrent_map(
+    func: T.Callable[[T.Any], T.Any],
+    items: T.Iterable[T.Any],
+    max_workers: T.Optional[int] = None,
+) -> T.List[T.Any]:
+    """
+    Like ``list(map(func, items))``, but run on a thread pool with at most
+    ``max_workers`` threads. If ``max_workers`` is 1 or there is at most one
+    item, no thread pool is created, it is useful when the caller is already
+    a worker of another thread pool.
+    """
+    items = list(items)
+    if (max_workers == 1) or (len(items) <= 1):
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, items))
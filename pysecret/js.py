@@ -9,8 +9,8 @@ from .js_helper import (
     set_value,
     get_value,
     del_key,
-    strip_comments,
 )
+from .json_codec import loads as json_loads
 from .singleton import CachedSpam
 
 DEFAULT_JSON_SECRET_FILE = Path.home().joinpath(".pysecret.json")
@@ -29,7 +29,7 @@ class JsonSecret(CachedSpam):
         self.secret_file: Path = secret_file
         create_json_if_not_exists(str(self.secret_file))
         with open(self.secret_file, "rb") as f:
-            self.data = json.loads(strip_comments(f.read().decode("utf-8")))
+            self.data = json_loads(f.read().decode("utf-8"))
 
     def set(self, json_path: str, value) -> dict:
         self.data = set_value(self.data, json_path, value)
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+"""
+Pluggable JSON decoder for the parameter / secret payload.
+
+pysecret allows ``#`` and ``//`` comments in JSON payload. Decoding used to
+always run :func:`~pysecret.js_helper.strip_comments` and then the standard
+library ``json.loads``, which is the dominant CPU cost for large payloads.
+This module:
+
+- skips the comment stripping if the payload has no ``#`` or ``//`` outside
+    of string literals, which is the common case.
+- decodes with the fastest installed JSON library:
+    `orjson <https://github.com/ijl/orjson>`_, then
+    `pysimdjson <https://github.com/TkTech/pysimdjson>`_, then the standard
+    library ``json``. Use :func:`set_default_codec` to pick one explicitly, or
+    :func:`register_codec` to add your own.
+
+Run ``examples/benchmark_json_codec.py`` to measure the speed-up on your
+machine.
+"""
+
+import typing as T
+import re
+import enum
+import json
+import threading
+
+from .js_helper import strip_comments
+
+try:
+    import orjson
+
+    has_orjson = True
+except ImportError:  # pragma: no cover
+    has_orjson = False
+
+try:
+    import simdjson
+
+    has_simdjson = True
+except ImportError:  # pragma: no cover
+    has_simdjson = False
+
+
+class CodecNameEnum(str, enum.Enum):
+    json = "json"
+    orjson = "orjson"
+    simdjson = "simdjson"
+
+
+_codecs: T.Dict[str, T.Callable[[str], T.Any]] = dict()
+_default_codec_name: T.Optional[str] = None
+_lock = threading.Lock()
+
+
+def register_codec(name: str, loads: T.Callable[[str], T.Any]):
+    """
+    Register a JSON codec.
+
+    :param name: the codec name.
+    :param loads: a function that takes a JSON string and returns the python
+        object.
+    """
+    with _lock:
+        _codecs[name] = loads
+
+
+def get_codec(name: T.Optional[str] = None) -> T.Callable[[str], T.Any]:
+    """
+    Get the ``loads`` function of a codec.
+
+    :param name: the codec name, if None, return the default codec.
+    """
+    if name is None:
+        name = get_default_codec_name()
+    try:
+        return _codecs[name]
+    except KeyError:
+        raise ValueError(
+            f"JSON codec {name!r} is not registered! "
+            f"available codecs are {list(_codecs)}"
+        )
+
+
+def get_default_codec_name() -> str:
+    return _default_codec_name
+
+
+def set_default_codec(name: str):
+    """
+    Set the default codec used by :func:`loads`.
+    """
+    global _default_codec_name
+    get_codec(name)
+    with _lock:
+        _default_codec_name = name
+
+
+register_codec(CodecNameEnum.json.value, json.loads)
+_default_codec_name = CodecNameEnum.json.value
+
+if has_simdjson:  # pragma: no cover
+    register_codec(CodecNameEnum.simdjson.value, simdjson.loads)
+    _default_codec_name = CodecNameEnum.simdjson.value
+
+if has_orjson:  # pragma: no cover
+    register_codec(CodecNameEnum.orjson.value, orjson.loads)
+    _default_codec_name = CodecNameEnum.orjson.value
+
+
+_json_string_pattern = re.compile(r'"(?:[^"\\]|\\.)*"', re.DOTALL)
+
+
+def has_comments(text: str) -> bool:
+    """
+    Check if the JSON text has ``#`` or ``//`` comments outside of the string
+    literals.
+    """
+    # fast path, no comment symbol at all
+    if ("#" not in text) and ("//" not in text):
+        return False
+    text = _json_string_pattern.sub('""', text)
+    return ("#" in text) or ("//" in text)
+
+
+def loads(
+    text: str,
+    codec: T.Optional[str] = None,
+) -> T.Any:
+    """
+    Decode JSON text that may contain ``#`` or ``//`` comments.
+
+    If the third party codec fails to decode the text, it falls back to the
+    standard library ``json``, because some of them are more strict, for
+    example ``orjson`` doesn't accept ``NaN`` and integers larger than 64 bits.
+
+    :param text: the JSON text.
+    :param codec: the codec name, if None, use the default codec.
+    """
+    if has_comments(text):
+        text = strip_comments(text)
+    func = get_codec(codec)
+    if func is json.loads:
+        return func(text)
+    try:
+        return func(text)
+    except ValueError:
+        return json.loads(text)
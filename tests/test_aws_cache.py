@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+
+import time
+import threading
+from datetime import datetime, timedelta, timezone
+
+from pysecret.aws.cache import get_rotation_aware_ttl, SecretCache
+from pysecret.tests import run_cov_test
+
+now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+kwargs = dict(ttl=300, rotation_ttl=86400, pending_ttl=30, rotation_delay=60)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Meta:
+    class ServiceModel:
+        service_name = "ssm"
+
+    service_model = ServiceModel()
+
+
+class FakeSsmClient:
+    """
+    A minimal ``ssm`` client that only supports ``get_parameter``.
+    """
+
+    meta = Meta()
+
+    def __init__(self, values: dict):
+        self.values = values
+        self.versions = {name: 1 for name in values}
+        self.n_calls = 0
+        self.before_get = None  # a hook to run in the middle of the API call
+
+    def set_value(self, name: str, value: str):
+        self.values[name] = value
+        self.versions[name] = self.versions.get(name, 0) + 1
+
+    def get_parameter(self, Name: str, **kwargs):
+        self.n_calls += 1
+        if self.before_get is not None:
+            self.before_get()
+        if Name not in self.values:
+            raise Exception(
+                "An error occurred (ParameterNotFound) when calling the "
+                "GetParameter operation: "
+            )
+        return {
+            "Parameter": {
+                "Name": Name,
+                "Type": "String",
+                "Value": self.values[Name],
+                "Version": self.versions[Name],
+                "LastModifiedDate": now,
+                "DataType": "text",
+                "ARN": f"arn:aws:ssm:us-east-1:111122223333:parameter/{Name}",
+            }
+        }
+
+
+def test_get_rotation_aware_ttl():
+    # rotation is not enabled
+    assert get_rotation_aware_ttl({}, now, **kwargs) == 300
+
+    # rotation is in progress
+    response = {
+        "RotationEnabled": True,
+        "VersionIdsToStages": {"v1": ["AWSCURRENT"], "v2": ["AWSPENDING"]},
+    }
+    assert get_rotation_aware_ttl(response, now, **kwargs) == 30
+
+    # refresh just after the next rotation
+    response = {
+        "RotationEnabled": True,
+        "NextRotationDate": now + timedelta(hours=1),
+    }
+    assert get_rotation_aware_ttl(response, now, **kwargs) == 3660
+
+    # cached for at most rotation_ttl
+    response["NextRotationDate"] = now + timedelta(days=30)
+    assert get_rotation_aware_ttl(response, now, **kwargs) == 86400
+
+    # rotation is overdue
+    response["NextRotationDate"] = now - timedelta(hours=1)
+    assert get_rotation_aware_ttl(response, now, **kwargs) == 30
+
+    # estimate the next rotation from the last rotation
+    response = {
+        "RotationEnabled": True,
+        "LastRotatedDate": now - timedelta(days=6, hours=23),
+        "RotationRules": {"AutomaticallyAfterDays": 7},
+    }
+    assert get_rotation_aware_ttl(response, now, **kwargs) == 3660
+
+    # unknown rotation schedule
+    response = {"RotationEnabled": True}
+    assert get_rotation_aware_ttl(response, now, **kwargs) == 300
+
+
+def test_ttl():
+    clock = FakeClock()
+    client = FakeSsmClient({"a": "1"})
+    cache = SecretCache(client, ttl=10, clock=clock)
+    assert cache.get("a").Value == "1"
+    assert cache.get("a").Value == "1"
+    assert (client.n_calls, cache.hits, cache.misses) == (1, 1, 1)
+
+    # expired
+    client.set_value("a", "2")
+    clock.now = 10
+    assert cache.get("a").Value == "2"
+    assert client.n_calls == 2
+
+    # the not found result is not cached
+    assert cache.get("b") is None
+    assert cache.get("b") is None
+    assert client.n_calls == 4
+    assert len(cache) == 1
+
+
+def test_lru_eviction():
+    clock = FakeClock()
+    client = FakeSsmClient({"a": "1", "b": "2", "c": "3"})
+    cache = SecretCache(client, max_entries=2, clock=clock)
+    cache.get("a")
+    cache.get("b")
+    cache.get("a")  # b is the least recently used now
+    cache.get("c")
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    cache.get("a")
+    assert client.n_calls == 3
+    cache.get("b")
+    assert client.n_calls == 4
+
+    # evict by total size
+    client = FakeSsmClient({"a": "x" * 10, "b": "x" * 10, "c": "x" * 10})
+    cache = SecretCache(client, max_bytes=25, clock=clock)
+    cache.get("a")
+    cache.get("b")
+    assert cache.total_bytes == 20
+    cache.get("c")
+    assert (len(cache), cache.total_bytes, cache.evictions) == (2, 20, 1)
+
+    cache.invalidate("b")
+    assert (len(cache), cache.total_bytes) == (1, 10)
+    cache.invalidate()
+    assert (len(cache), cache.total_bytes) == (0, 0)
+
+
+def test_single_flight():
+    client = FakeSsmClient({"a": "1"})
+    client.before_get = lambda: time.sleep(0.1)
+    cache = SecretCache(client)
+    threads = [threading.Thread(target=cache.get, args=("a",)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert client.n_calls == 1
+    assert (cache.hits, cache.misses) == (4, 1)
+
+
+def test_key_lock_outlives_entry():
+    client = FakeSsmClient({"a": "1"})
+    cache = SecretCache(client)
+    cache.get("a")
+    key = cache._make_key("a")
+    lock = cache._get_key_lock(key)
+    with lock:
+        cache.invalidate()
+        assert cache._get_key_lock(key) is lock
+
+
+def test_stale_while_revalidate():
+    clock = FakeClock()
+    client = FakeSsmClient({"a": "1", "b": "1"})
+    cache = SecretCache(
+        client,
+        ttl=10,
+        refresh_ahead=2,
+        jitter=0,
+        refresh_interval=3600,  # refresh manually with refresh_once
+        clock=clock,
+    )
+    changes = dict()
+    cache.subscribe(lambda name, old, new: changes.setdefault(name, (old, new)))
+    cache.start_refresh()
+    try:
+        cache.get("a")
+        cache.get("b")
+
+        # the expired entry is served until it is refreshed
+        clock.now = 15
+        client.set_value("a", "2")
+        assert cache.get("a").Value == "1"
+        assert cache.stale_hits == 1
+
+        # changed, deleted
+        del client.values["b"]
+        assert cache.refresh_once() == 2
+        assert [value.Value for value in changes["a"]] == ["1", "2"]
+        assert changes["b"][0].Value == "1" and changes["b"][1] is None
+        assert len(cache) == 1
+
+        # the entry is not read since the refresh, it is not refreshed again
+        clock.now = 40
+        assert cache.refresh_once() == 0
+
+        # the max_stale is exceeded
+        assert cache.get("a").Value == "2"
+        assert cache.misses == 3
+        assert client.n_calls == 5
+    finally:
+        cache.stop_refresh()
+    assert cache.is_refreshing is False
+
+
+def test_refresh_after_invalidate():
+    clock = FakeClock()
+    client = FakeSsmClient({"a": "1"})
+    cache = SecretCache(client, ttl=10, refresh_ahead=2, jitter=0, clock=clock)
+    changes = list()
+    cache.subscribe(lambda name, old, new: changes.append(name))
+    cache.get("a")
+
+    # the entry is invalidated while the refresh is in flight
+    client.set_value("a", "2")
+    client.before_get = lambda: cache.invalidate("a")
+    clock.now = 9
+    assert cache.refresh_once() == 1
+    assert len(cache) == 0
+    assert changes == []
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.cache", preview=False)
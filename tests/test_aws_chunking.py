@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+import io
+import random
+import shutil
+
+import pytest
+
+from pysecret.aws.chunking import (
+    CompressionEnum,
+    get_chunk_path,
+    get_chunk_name,
+    is_chunk_name,
+    ChunkManifest,
+    split_value,
+    join_value,
+    get_secret_chunk_name,
+    split_binary,
+    ChunkReader,
+    join_binary,
+)
+from pysecret.tests import run_cov_test
+
+
+def test_chunk_name():
+    assert get_chunk_path("/app/config") == "/app/config/__chunk__"
+    assert get_chunk_path("app-config") == "/app-config/__chunk__"
+    assert get_chunk_name("app-config", 3) == "/app-config/__chunk__/3"
+    assert is_chunk_name("/app-config/__chunk__/3") is True
+    assert is_chunk_name("/app-config/__chunk__") is False
+    assert is_chunk_name("/app-config/chunk/3") is False
+    assert is_chunk_name("app-config") is False
+    assert get_secret_chunk_name("app/cert", 3) == "app/cert/__chunk__/3"
+    assert is_chunk_name("app/cert/__chunk__/3") is True
+
+
+def test_manifest():
+    manifest = ChunkManifest(
+        compression=CompressionEnum.zlib.value,
+        size=3,
+        sha256="abc",
+        chunks=[1, 2],
+    )
+    assert manifest.n_chunks == 2
+    assert ChunkManifest.from_json(manifest.to_json()) == manifest
+    assert ChunkManifest.from_json('{"name": "alice"}') is None
+    assert ChunkManifest.from_json("hello") is None
+
+
+def test_split_and_join():
+    random.seed(1)
+    value = "".join(random.choice("abcdef") for _ in range(100000))
+    for compression in [CompressionEnum.none.value, CompressionEnum.zlib.value]:
+        manifest, chunk_values = split_value(value, 4096, compression)
+        assert len(chunk_values) >= 2
+        assert all(len(chunk_value) <= 4096 for chunk_value in chunk_values)
+        assert join_value(manifest, chunk_values) == value
+
+        with pytest.raises(ValueError):
+            join_value(manifest, chunk_values[:-1])
+
+    with pytest.raises(ValueError):
+        split_value(value, 4096, "unknown")
+
+
+def test_split_and_join_binary():
+    random.seed(1)
+    data = bytes(random.getrandbits(8) for _ in range(50000)) + b"a" * 100000
+    for compression in [CompressionEnum.none.value, CompressionEnum.zlib.value]:
+        manifest, chunk_values = split_binary(data, 4096, compression)
+        assert len(chunk_values) >= 2
+        assert all(len(chunk_value) <= 4096 for chunk_value in chunk_values)
+        assert join_binary(manifest, chunk_values) == data
+        assert io.BufferedReader(ChunkReader(manifest, chunk_values)).read() == data
+
+        with pytest.raises(ValueError):
+            join_binary(manifest, chunk_values[:-1])
+
+        tampered = list(chunk_values)
+        tampered[0] = bytes([tampered[0][0] ^ 1]) + bytes(tampered[0][1:])
+        with pytest.raises(ValueError):
+            join_binary(manifest, tampered)
+        with pytest.raises(ValueError):
+            ChunkReader(manifest, tampered).read()
+
+
+class BufferingDecompressor:
+    """
+    A decompressor that returns all data in ``flush()``.
+    """
+
+    def __init__(self):
+        self.buffer = list()
+
+    def decompress(self, data: bytes) -> bytes:
+        self.buffer.append(bytes(data))
+        return b""
+
+    def flush(self) -> bytes:
+        return b"".join(self.buffer)
+
+
+def test_chunk_reader_verify_flushed_data():
+    data = b"hello world" * 1000
+    manifest, chunk_values = split_binary(data, 4096, CompressionEnum.none.value)
+
+    reader = ChunkReader(manifest, chunk_values)
+    reader._decompressor = BufferingDecompressor()
+    assert reader.read() == data
+
+    tampered = list(chunk_values)
+    tampered[-1] = bytes(tampered[-1][:-1]) + b"X"
+    reader = ChunkReader(manifest, tampered)
+    reader._decompressor = BufferingDecompressor()
+    with pytest.raises(ValueError):
+        reader.read()
+
+    reader = ChunkReader(manifest, tampered)
+    reader._decompressor = BufferingDecompressor()
+    with pytest.raises(ValueError):
+        shutil.copyfileobj(reader, io.BytesIO())
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.chunking", preview=False)
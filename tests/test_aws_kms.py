@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import pytest
+
+from pysecret.aws.kms import (
+    has_cryptography,
+    ENVELOPE_MAGIC,
+    is_envelope,
+    _parse_envelope,
+    KmsEnvelopeCipher,
+    kms_symmetric_encrypt,
+    kms_symmetric_decrypt,
+)
+from pysecret.tests import run_cov_test
+
+pytestmark = pytest.mark.skipif(
+    has_cryptography is False,
+    reason="`cryptography` is not installed",
+)
+
+
+class FakeKmsClient:
+    """
+    A minimal ``kms`` client, the data key is "wrapped" by prefixing the
+    key id and reversing the bytes.
+    """
+
+    def __init__(self):
+        self.n_generate_data_key = 0
+        self.n_decrypt = 0
+
+    def _wrap(self, key_id: str, plaintext: bytes) -> bytes:
+        return key_id.encode("utf-8") + b":" + plaintext[::-1]
+
+    def encrypt(self, Plaintext: bytes, KeyId: str) -> dict:
+        return {"CiphertextBlob": self._wrap(KeyId, Plaintext)}
+
+    def decrypt(self, CiphertextBlob: bytes) -> dict:
+        self.n_decrypt += 1
+        key_id, wrapped = CiphertextBlob.split(b":", 1)
+        return {"Plaintext": wrapped[::-1], "KeyId": key_id.decode("utf-8")}
+
+    def generate_data_key(self, KeyId: str, KeySpec: str) -> dict:
+        self.n_generate_data_key += 1
+        data_key = os.urandom(32)
+        return {"Plaintext": data_key, "CiphertextBlob": self._wrap(KeyId, data_key)}
+
+
+def test_round_trip():
+    kms_client = FakeKmsClient()
+    cipher = KmsEnvelopeCipher(kms_client, kms_key_id="alias/my-key")
+    records = [b"", b"hello", os.urandom(10000)]
+    blobs = [cipher.encrypt(record) for record in records]
+    for blob in blobs:
+        assert is_envelope(blob)
+    assert kms_client.n_generate_data_key == 1
+
+    # decrypt with a different cipher, it doesn't know the data key
+    decipher = KmsEnvelopeCipher(kms_client)
+    assert [decipher.decrypt(blob) for blob in blobs] == records
+    assert kms_client.n_decrypt == 1
+    assert decipher.n_decrypt_data_key == 1
+
+    # the nonce is random
+    assert cipher.encrypt(b"hello") != cipher.encrypt(b"hello")
+
+
+def test_kms_symmetric_encrypt_decrypt():
+    kms_client = FakeKmsClient()
+    blob = kms_symmetric_encrypt(kms_client, b"hello", "alias/my-key", envelope=True)
+    assert is_envelope(blob)
+    assert kms_symmetric_decrypt(kms_client, blob) == b"hello"
+
+    blob = kms_symmetric_encrypt(kms_client, b"hello", "alias/my-key")
+    assert is_envelope(blob) is False
+    assert kms_symmetric_decrypt(kms_client, blob) == b"hello"
+
+
+def test_encrypt_without_key_id():
+    cipher = KmsEnvelopeCipher(FakeKmsClient())
+    with pytest.raises(ValueError):
+        cipher.encrypt(b"hello")
+
+
+def test_tampered_envelope():
+    kms_client = FakeKmsClient()
+    cipher = KmsEnvelopeCipher(kms_client, kms_key_id="alias/my-key")
+    blob = cipher.encrypt(b"hello world")
+    wrapped_key, header, nonce, ciphertext = _parse_envelope(blob)
+    assert wrapped_key.startswith(b"alias/my-key:")
+
+    # the header is bound as the associated data, a modified wrapped key
+    # byte that still unwraps to the same data key is detected
+    tampered = bytearray(blob)
+    tampered[7] = ord("b")  # "alias/my-key" -> "blias/my-key"
+    with pytest.raises(ValueError):
+        cipher.decrypt(bytes(tampered))
+
+    # modified nonce
+    tampered = bytearray(blob)
+    tampered[len(header)] ^= 1
+    with pytest.raises(ValueError):
+        cipher.decrypt(bytes(tampered))
+
+    # modified ciphertext and tag
+    for index in [len(header) + len(nonce), len(blob) - 1]:
+        tampered = bytearray(blob)
+        tampered[index] ^= 1
+        with pytest.raises(ValueError):
+            cipher.decrypt(bytes(tampered))
+
+    assert cipher.decrypt(blob) == b"hello world"
+
+
+def test_invalid_envelope():
+    kms_client = FakeKmsClient()
+    cipher = KmsEnvelopeCipher(kms_client, kms_key_id="alias/my-key")
+    blob = cipher.encrypt(b"hello world")
+    _, header, nonce, _ = _parse_envelope(blob)
+
+    # truncated
+    for size in [0, 3, 6, len(header) - 1, len(header) + len(nonce) - 1]:
+        with pytest.raises(ValueError):
+            cipher.decrypt(blob[:size])
+    # no room for the tag
+    with pytest.raises(ValueError):
+        cipher.decrypt(blob[: len(header) + len(nonce)])
+
+    # bad magic
+    with pytest.raises(ValueError):
+        cipher.decrypt(b"XXXX" + blob[4:])
+
+    # unknown format version
+    with pytest.raises(ValueError):
+        cipher.decrypt(ENVELOPE_MAGIC + bytes([99]) + blob[5:])
+
+    assert kms_client.n_decrypt <= 1
+
+
+def test_data_key_rotation():
+    kms_client = FakeKmsClient()
+    cipher = KmsEnvelopeCipher(kms_client, kms_key_id="alias/my-key", max_messages=3)
+    blobs = [cipher.encrypt(str(i).encode("utf-8")) for i in range(7)]
+    assert cipher.n_generate_data_key == 3
+    assert kms_client.n_generate_data_key == 3
+
+    wrapped_keys = [_parse_envelope(blob)[0] for blob in blobs]
+    assert len(set(wrapped_keys[0:3])) == 1
+    assert len(set(wrapped_keys[3:6])) == 1
+    assert len(set(wrapped_keys)) == 3
+
+    decipher = KmsEnvelopeCipher(kms_client)
+    for i, blob in enumerate(blobs):
+        assert decipher.decrypt(blob) == str(i).encode("utf-8")
+    assert decipher.n_decrypt_data_key == 3
+
+
+def test_data_key_cache():
+    kms_client = FakeKmsClient()
+    cipher = KmsEnvelopeCipher(kms_client, kms_key_id="alias/my-key", max_messages=1)
+    blob1, blob2, blob3 = [cipher.encrypt(b"hello") for _ in range(3)]
+    assert cipher.n_generate_data_key == 3
+
+    decipher = KmsEnvelopeCipher(kms_client, max_cached_keys=2)
+    decipher.decrypt(blob1)
+    decipher.decrypt(blob2)
+    decipher.decrypt(blob1)  # cache hit, blob1 becomes the most recent
+    assert decipher.n_decrypt_data_key == 2
+
+    decipher.decrypt(blob3)  # evict blob2
+    assert decipher.n_decrypt_data_key == 3
+    decipher.decrypt(blob1)
+    assert decipher.n_decrypt_data_key == 3
+    decipher.decrypt(blob2)
+    assert decipher.n_decrypt_data_key == 4
+    assert kms_client.n_decrypt == 4
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.kms", preview=False)
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+from pysecret.aws.parameter_index import ParameterMetadata, ParameterIndex
+from pysecret.tests import run_cov_test
+
+
+def make_index() -> ParameterIndex:
+    index = ParameterIndex()
+    for env in ["prod", "dev"]:
+        for team in ["payments", "search"]:
+            for i in range(3):
+                index._add(
+                    ParameterMetadata(
+                        Name=f"/{env}/{team}/param-{i}",
+                        Tags={"env": env, "team": team},
+                    )
+                )
+    index._add(ParameterMetadata(Name="plain", Tags={"team": "payments"}))
+    return index
+
+
+def test_find():
+    index = make_index()
+    assert len(index) == 13
+    assert "plain" in index
+    assert len(index.find()) == 13
+    assert index.find(prefix="/prod/payments/") == [
+        "/prod/payments/param-0",
+        "/prod/payments/param-1",
+        "/prod/payments/param-2",
+    ]
+    assert len(index.find(prefix="/prod/pay")) == 3
+    assert len(index.find(prefix="/pro")) == 6
+    assert len(index.find(prefix="/")) == 12
+    assert index.find(prefix="pl") == ["plain"]
+    assert index.find(prefix="/stage/") == []
+    assert index.find(prefix="/prod/payments/param-1") == ["/prod/payments/param-1"]
+
+    assert len(index.find(tags={"team": "payments"})) == 7
+    assert len(index.find(tags={"env": None})) == 12
+    assert index.find(tags={"team": "unknown"}) == []
+    assert index.find(prefix="/prod/", tags={"team": "payments"}) == [
+        "/prod/payments/param-0",
+        "/prod/payments/param-1",
+        "/prod/payments/param-2",
+    ]
+    assert len(index.find(tags={"env": "dev", "team": "search"})) == 3
+
+
+def test_remove():
+    index = make_index()
+    for name in index.names:
+        index._remove(name)
+    index._remove("not-exists")
+    assert len(index) == 0
+    assert index._trie.children == {}
+    assert index._tag_index == {}
+    assert index._tag_key_index == {}
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.parameter_index", preview=False)
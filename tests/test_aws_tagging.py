@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+from pysecret.aws.tagging import (
+    encode_tags,
+    decode_tags,
+    TagDiff,
+    diff_tags,
+    reconcile_tags,
+)
+from pysecret.tests import run_cov_test
+
+
+def test_encode_decode_tags():
+    tags = {"a": "1", "b": "2"}
+    assert decode_tags(encode_tags(tags)) == tags
+
+
+def test_diff_tags():
+    assert diff_tags({}, {}).is_empty
+    assert diff_tags({"a": "1"}, {"a": "1"}).is_empty
+    assert diff_tags({"a": "1", "b": "2"}, {"b": "3", "c": "4"}) == TagDiff(
+        to_remove=["a"],
+        to_add={"b": "3", "c": "4"},
+    )
+    assert diff_tags({"a": "1"}, {}) == TagDiff(to_remove=["a"], to_add={})
+
+    # merge
+    assert diff_tags({"a": "1"}, {}, replace=False).is_empty
+    assert diff_tags({"a": "1", "b": "2"}, {"b": "3"}, replace=False) == TagDiff(
+        to_remove=[],
+        to_add={"b": "3"},
+    )
+
+
+def test_reconcile_tags():
+    calls = list()
+
+    def remove_tags(tag_keys):
+        calls.append(("remove", tag_keys))
+
+    def add_tags(tags):
+        calls.append(("add", tags))
+
+    reconcile_tags({"a": "1"}, {"a": "1"}, remove_tags, add_tags)
+    assert calls == []
+
+    reconcile_tags({"a": "1", "b": "2"}, {"a": "1"}, remove_tags, add_tags)
+    assert calls == [("remove", ["b"])]
+
+    calls.clear()
+    reconcile_tags({"a": "1", "b": "2"}, {"b": "3"}, remove_tags, add_tags)
+    assert calls == [("remove", ["a"]), ("add", {"b": "3"})]
+
+    calls.clear()
+    reconcile_tags({"a": "1", "b": "2"}, {"b": "3"}, remove_tags, add_tags, False)
+    assert calls == [("add", {"b": "3"})]
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.tagging", preview=False)
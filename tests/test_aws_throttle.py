@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from pysecret.aws.throttle import (
+    ApiClassEnum,
+    get_api_class,
+    is_throttling_error,
+    TokenBucket,
+    RateLimiter,
+    ThrottledClient,
+    throttle_client,
+)
+from pysecret.tests import run_cov_test
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.now += seconds
+
+
+class Meta:
+    class ServiceModel:
+        service_name = "ssm"
+
+    service_model = ServiceModel()
+
+
+class FakeClient:
+    meta = Meta()
+
+    def __init__(self, n_throttles: int = 0):
+        self.n_throttles = n_throttles
+        self.n_calls = 0
+
+    def put_parameter(self, **kwargs):
+        self.n_calls += 1
+        if self.n_throttles:
+            self.n_throttles -= 1
+            raise Exception(
+                "An error occurred (ThrottlingException) when calling the "
+                "PutParameter operation (reached max retries: 4): Rate exceeded"
+            )
+        return kwargs
+
+
+def test_get_api_class():
+    assert get_api_class("get_parameter") == ApiClassEnum.read.value
+    assert get_api_class("batch_get_secret_value") == ApiClassEnum.read.value
+    assert get_api_class("describe_secret") == ApiClassEnum.read.value
+    assert get_api_class("put_parameter") == ApiClassEnum.write.value
+    assert get_api_class("delete_secret") == ApiClassEnum.write.value
+    assert get_api_class("add_tags_to_resource") == ApiClassEnum.tag.value
+    assert get_api_class("list_tags_for_resource") == ApiClassEnum.tag.value
+
+
+def test_is_throttling_error():
+    assert is_throttling_error(Exception("(ThrottlingException) Rate exceeded"))
+    assert is_throttling_error(Exception("ParameterNotFound")) is False
+
+
+def test_token_bucket():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, clock=clock, sleep=clock.sleep)
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == 0
+    assert bucket.acquire() == pytest.approx(0.5)
+    assert bucket.n_waits == 1
+    assert bucket.wait_seconds == pytest.approx(0.5)
+
+    # multiplicative decrease
+    bucket.on_throttle()
+    assert bucket.rate == 1
+    assert bucket.n_throttles == 1
+    for _ in range(10):
+        bucket.on_throttle()
+    assert bucket.rate == bucket.min_rate
+
+    # additive increase
+    for _ in range(100):
+        bucket.on_success()
+    assert bucket.rate == bucket.max_rate
+
+
+def test_rate_limiter():
+    clock = FakeClock()
+    rate_limiter = RateLimiter(clock=clock, sleep=clock.sleep, max_retries=3)
+
+    client = FakeClient(n_throttles=2)
+    assert rate_limiter.call(client, "put_parameter", Name="a") == {"Name": "a"}
+    assert client.n_calls == 3
+    assert rate_limiter.n_retries == 2
+    assert rate_limiter.n_throttles == 2
+    assert rate_limiter.stats()["ssm.write"]["n_throttles"] == 2
+
+    client = FakeClient(n_throttles=10)
+    with pytest.raises(Exception) as e:
+        rate_limiter.call(client, "put_parameter", Name="a")
+    assert "ThrottlingException" in str(e)
+    assert client.n_calls == 4
+
+    # wait for the token
+    for _ in range(10):
+        rate_limiter.call(FakeClient(), "put_parameter", Name="a")
+    assert rate_limiter.n_waits > 0
+    assert rate_limiter.wait_seconds > 0
+
+
+def test_throttle_client():
+    rate_limiter = RateLimiter()
+    client = FakeClient()
+    assert throttle_client(client) is client
+    wrapped = throttle_client(client, rate_limiter)
+    assert isinstance(wrapped, ThrottledClient)
+    assert throttle_client(wrapped, rate_limiter) is wrapped
+    assert throttle_client(wrapped, RateLimiter())._client is client
+    assert wrapped.meta is client.meta
+    assert wrapped.put_parameter(Name="a") == {"Name": "a"}
+    assert rate_limiter.stats()["ssm.write"]["n_acquires"] == 1
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.throttle", preview=False)
@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 
 import pytest
+import threading
 from pysecret.helper import (
     ensure_only_one_true,
+    chunks,
+    concurrent_map,
 )
 from pysecret.tests import run_cov_test
 
@@ -23,5 +26,29 @@ def test_ensure_only_one_true():
         )
 
 
+def test_chunks():
+    assert chunks([], 2) == []
+    assert chunks([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert chunks([1, 2], 10) == [[1, 2]]
+    with pytest.raises(ValueError):
+        chunks([1, 2], 0)
+
+
+def test_concurrent_map():
+    assert concurrent_map(lambda x: x * 2, []) == []
+    assert concurrent_map(lambda x: x * 2, range(10), max_workers=4) == list(
+        range(0, 20, 2)
+    )
+
+    threads = set()
+
+    def func(x):
+        threads.add(threading.get_ident())
+        return x
+
+    assert concurrent_map(func, range(10), max_workers=1) == list(range(10))
+    assert threads == {threading.get_ident()}
+
+
 if __name__ == "__main__":
     run_cov_test(__file__, "pysecret.helper", preview=False)
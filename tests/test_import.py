@@ -20,18 +20,50 @@ def test():
 
     _ = pysecret.BaseShellScriptSecret
 
+    _ = pysecret.DeployActionEnum
+    _ = pysecret.DeployResult
+    _ = pysecret.ParameterTypeCache
+    _ = pysecret.parameter_type_cache
     _ = pysecret.Parameter
+    _ = pysecret.iter_parameters_by_path
+    _ = pysecret.iter_parameter_history
+    _ = pysecret.ParameterHistory
     _ = pysecret.deploy_parameter
+    _ = pysecret.ParameterSpec
+    _ = pysecret.deploy_parameters
     _ = pysecret.delete_parameter
+    _ = pysecret.delete_parameters
     _ = pysecret.get_parameter_tags
     _ = pysecret.update_parameter_tags
     _ = pysecret.put_parameter_tags
     _ = pysecret.remove_parameter_tags
+    _ = pysecret.ParameterIndex
+    _ = pysecret.ParameterWatcher
+
+    _ = pysecret.get_secret_tags
+    _ = pysecret.update_secret_tags
+    _ = pysecret.put_secret_tags
+    _ = pysecret.remove_secret_tags
 
     _ = pysecret.Secret
+    _ = pysecret.LazySecret
+    _ = pysecret.iter_secrets
+    _ = pysecret.SecretVersion
+    _ = pysecret.iter_secret_versions
+    _ = pysecret.SecretVersionIndex
     _ = pysecret.deploy_secret
+    _ = pysecret.SecretSpec
+    _ = pysecret.deploy_secrets
     _ = pysecret.delete_secret
+    _ = pysecret.delete_secrets
+
+    _ = pysecret.RateLimiter
+    _ = pysecret.default_rate_limiter
+
+    _ = pysecret.SecretCache
+    _ = pysecret.Snapshot
 
+    _ = pysecret.KmsEnvelopeCipher
     _ = pysecret.kms_symmetric_encrypt
     _ = pysecret.kms_symmetric_decrypt
 
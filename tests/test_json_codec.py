@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+import pytest
+
+from pysecret.json_codec import (
+    CodecNameEnum,
+    register_codec,
+    get_codec,
+    get_default_codec_name,
+    set_default_codec,
+    has_comments,
+    loads,
+)
+from pysecret.tests import run_cov_test
+
+
+def test_has_comments():
+    assert has_comments('{"a": 1}') is False
+    assert has_comments('{"url": "https://example.com", "tag": "#1"}') is False
+    assert has_comments('{"a": "say \\"#hi\\""}') is False
+    assert has_comments('{"a": 1} # comment') is True
+    assert has_comments('{"a": 1} // comment') is True
+    assert has_comments('{"a": "//"} // comment') is True
+
+
+def test_loads():
+    assert loads('{"url": "https://example.com"}') == {"url": "https://example.com"}
+    text = "\n".join(
+        [
+            "{",
+            '    "a": 1, # comment',
+            '    "b": "#not a comment" // comment',
+            "}",
+        ]
+    )
+    assert loads(text) == {"a": 1, "b": "#not a comment"}
+    assert loads(text, codec=CodecNameEnum.json.value) == {
+        "a": 1,
+        "b": "#not a comment",
+    }
+    assert loads("[NaN]")[0] != loads("[NaN]")[0]
+
+
+def test_registry():
+    with pytest.raises(ValueError):
+        get_codec("not-exists")
+    with pytest.raises(ValueError):
+        set_default_codec("not-exists")
+
+    default_codec_name = get_default_codec_name()
+    register_codec("test", lambda text: json.loads(text) + ["test"])
+    set_default_codec("test")
+    try:
+        assert loads("[1]") == [1, "test"]
+    finally:
+        set_default_codec(default_codec_name)
+    assert loads("[1]") == [1]
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.json_codec", preview=False)
@@ -0,0 +1,138 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+
+from pysecret.tests import bsm, py_ver, run_cov_test
+from pysecret.aws.parameter_store import delete_parameter
+from pysecret.aws.secret_manager import delete_secret
+from pysecret import aio
+
+ssm_client = bsm.ssm_client
+sm_client = bsm.secretsmanager_client
+kms_client = bsm.kms_client
+TEST_KMS_KEY_ALIAS = "alias/pysecret_test"
+
+param_name = f"pysecret-{py_ver}-aio"
+secret_name = f"pysecret-{py_ver}-aio"
+
+
+def delete_all():
+    delete_parameter(ssm_client, param_name)
+    delete_secret(sm_client, secret_name, force_delete_without_recovery=True)
+
+
+def setup_module(module):
+    delete_all()
+
+
+def teardown_module(module):
+    delete_all()
+
+
+def test_is_async_client():
+    assert aio.is_async_client(ssm_client) is False
+
+
+def test_parameter():
+    async def main():
+        param = await aio.deploy_parameter(
+            ssm_client,
+            name=param_name,
+            data={"name": "Alice"},
+            type_is_secure_string=True,
+            tier_is_standard=True,
+            tags=dict(EnvName="dev"),
+        )
+        assert param.Version == 1
+
+        param = await aio.deploy_parameter(
+            ssm_client,
+            name=param_name,
+            data={"name": "Alice"},
+            type_is_secure_string=True,
+            tier_is_standard=True,
+            overwrite=True,
+        )
+        assert param is None
+
+        param = await aio.load_parameter(ssm_client, param_name, with_tags=True)
+        assert param.json_dict == {"name": "Alice"}
+        assert param.Tags == dict(EnvName="dev")
+
+        params = await aio.load_parameters(
+            ssm_client,
+            [param_name, "pysecret-never-exists"],
+        )
+        assert params[0].json_dict == {"name": "Alice"}
+        assert params[1] is None
+
+        param = await aio.deploy_parameter(
+            ssm_client,
+            name=param_name,
+            data={"name": "Bob"},
+            type_is_secure_string=True,
+            tier_is_standard=True,
+            overwrite=True,
+        )
+        assert param.Version == 2
+
+        params = await aio.load_parameters(ssm_client, [param_name], version=1)
+        assert params[0].json_dict == {"name": "Alice"}
+        params = await aio.load_parameters(ssm_client, [f"{param_name}:2"])
+        assert params[0].json_dict == {"name": "Bob"}
+
+    asyncio.run(main())
+
+
+def test_secret():
+    async def main():
+        secret = await aio.deploy_secret(
+            sm_client,
+            name_or_arn=secret_name,
+            data="hello",
+        )
+        assert secret.SecretString == "hello"
+
+        secret = await aio.deploy_secret(
+            sm_client,
+            name_or_arn=secret_name,
+            data="hello",
+        )
+        assert secret is None
+
+        secret = await aio.deploy_secret(
+            sm_client,
+            name_or_arn=secret_name,
+            data="world",
+            tags=dict(EnvName="dev"),
+        )
+        assert secret.SecretString == "world"
+        secret = await aio.deploy_secret(
+            sm_client,
+            name_or_arn=secret_name,
+            data="hello",
+            tags=dict(Owner="alice"),
+        )
+        tags = await aio.secret_manager.get_secret_tags(sm_client, secret_name)
+        assert tags == dict(EnvName="dev", Owner="alice")
+
+        secrets = await aio.load_secrets(
+            sm_client,
+            [secret_name, "pysecret-never-exists"],
+        )
+        assert secrets[0].SecretString == "hello"
+        assert secrets[1] is None
+
+    asyncio.run(main())
+
+
+def test_kms():
+    async def main():
+        blob = await aio.kms_symmetric_encrypt(kms_client, b"hello", TEST_KMS_KEY_ALIAS)
+        assert await aio.kms_symmetric_decrypt(kms_client, blob) == b"hello"
+
+    asyncio.run(main())
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aio", preview=False)
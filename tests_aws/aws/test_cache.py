@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from pysecret.tests import bsm, py_ver, run_cov_test
+from pysecret.aws.parameter_store import deploy_parameter, delete_parameter
+from pysecret.aws.secret_manager import deploy_secret, delete_secret
+from pysecret.aws.cache import SecretCache
+
+ssm_client = bsm.ssm_client
+sm_client = bsm.secretsmanager_client
+kms_client = bsm.kms_client
+
+param_name = f"pysecret-{py_ver}-cache"
+secret_name = f"pysecret-{py_ver}-cache"
+
+
+def delete_all():
+    delete_parameter(ssm_client, param_name)
+    delete_secret(sm_client, secret_name, force_delete_without_recovery=True)
+
+
+def setup_module(module):
+    delete_all()
+    deploy_parameter(
+        ssm_client,
+        name=param_name,
+        data="hello",
+        type_is_secure_string=True,
+        tier_is_standard=True,
+        overwrite=True,
+    )
+    deploy_secret(sm_client, name_or_arn=secret_name, data={"name": "Alice"})
+
+
+def teardown_module(module):
+    delete_all()
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_parameter_cache():
+    clock = Clock()
+    cache = SecretCache(ssm_client, ttl=10, max_entries=1, clock=clock)
+    assert cache.get(param_name).Value == "hello"
+    assert cache.get(param_name).Value == "hello"
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # expired
+    clock.now = 11
+    assert cache.get(param_name).Value == "hello"
+    assert (cache.hits, cache.misses) == (1, 2)
+
+    # version is part of the cache key, LRU eviction
+    assert cache.get(param_name, version=1).Value == "hello"
+    assert len(cache) == 1
+    assert cache.evictions == 1
+
+    cache.invalidate(param_name)
+    assert len(cache) == 0
+
+    assert cache.get("pysecret-never-exists") is None
+
+
+def test_secret_cache():
+    cache = SecretCache(sm_client, ttl=10)
+    assert cache.get(secret_name).json_dict == {"name": "Alice"}
+    assert cache.get(secret_name).json_dict == {"name": "Alice"}
+    assert cache.hit_rate == 0.5
+
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.total_bytes == 0
+
+
+def test_stale_while_revalidate():
+    clock = Clock()
+    cache = SecretCache(
+        ssm_client,
+        ttl=10,
+        refresh_ahead=2,
+        jitter=1,
+        clock=clock,
+    )
+    changes = list()
+    cache.subscribe(lambda name, old, new: changes.append((old.Value, new.Value)))
+
+    assert cache.get(param_name).Value == "hello"
+    deploy_parameter(
+        ssm_client,
+        name=param_name,
+        data="world",
+        type_is_secure_string=True,
+        tier_is_standard=True,
+        overwrite=True,
+    )
+
+    # expired entry is served until the background refresh is done
+    cache.start_refresh()
+    clock.now = 11
+    assert cache.get(param_name).Value == "hello"
+    assert cache.stale_hits == 1
+
+    assert cache.refresh_once() == 1
+    assert cache.get(param_name).Value == "world"
+    assert changes == [("hello", "world")]
+    cache.stop_refresh()
+    assert cache.is_refreshing is False
+
+    # without the background worker, expired entry is reloaded
+    clock.now = 100
+    assert cache.get(param_name).Value == "world"
+    assert cache.misses == 2
+
+
+def test_revalidate():
+    clock = Clock()
+    cache = SecretCache(sm_client, ttl=10, revalidate=True, clock=clock)
+    assert cache.get(secret_name).json_dict == {"name": "Alice"}
+
+    # version is not changed, revalidated by describe_secret
+    clock.now = 11
+    assert cache.get(secret_name).json_dict == {"name": "Alice"}
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert (cache.revalidations, cache.revalidation_hits) == (1, 1)
+
+    # version is changed, reload
+    deploy_secret(sm_client, name_or_arn=secret_name, data={"name": "Bob"})
+    clock.now = 22
+    assert cache.get(secret_name).json_dict == {"name": "Bob"}
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.revalidation_hit_rate == 0.5
+
+    with pytest.raises(ValueError):
+        SecretCache(ssm_client, revalidate=True)
+
+
+def test_rotation_aware():
+    clock = Clock()
+    cache = SecretCache(
+        sm_client,
+        ttl=10,
+        rotation_aware=True,
+        revalidate=True,
+        clock=clock,
+    )
+    assert cache.get(secret_name) is not None
+    # rotation is not enabled, use the default ttl
+    entry = list(cache._entries.values())[0]
+    assert entry.expire_at == 10
+
+    with pytest.raises(ValueError):
+        SecretCache(ssm_client, rotation_aware=True)
+
+
+def test_unsupported_client():
+    with pytest.raises(ValueError):
+        SecretCache(kms_client)
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.cache", preview=False)
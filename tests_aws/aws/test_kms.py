@@ -1,7 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import os
+import pytest
+
 from pysecret.tests import bsm, run_cov_test
 from pysecret.aws.kms import (
+    KmsEnvelopeCipher,
+    is_envelope,
     kms_symmetric_encrypt,
     kms_symmetric_decrypt,
 )
@@ -32,5 +37,26 @@ def test_encrypt_decrypt():
     assert decrypted_blob.decode("utf-8") == "hello"
 
 
+def test_envelope_encrypt_decrypt():
+    blob = os.urandom(100000)
+    encrypted_blob = kms_symmetric_encrypt(
+        kms_client, blob, TEST_KMS_KEY_ALIAS, envelope=True
+    )
+    assert is_envelope(encrypted_blob)
+    assert kms_symmetric_decrypt(kms_client, encrypted_blob) == blob
+
+    cipher = KmsEnvelopeCipher(kms_client, TEST_KMS_KEY_ALIAS)
+    records = [f"record-{i}".encode("utf-8") for i in range(10)]
+    encrypted_records = [cipher.encrypt(record) for record in records]
+    assert [cipher.decrypt(record) for record in encrypted_records] == records
+    assert cipher.n_generate_data_key == 1
+    assert cipher.n_decrypt_data_key == 1
+
+    tampered = bytearray(encrypted_records[0])
+    tampered[-1] ^= 1
+    with pytest.raises(ValueError):
+        cipher.decrypt(bytes(tampered))
+
+
 if __name__ == "__main__":
     run_cov_test(__file__, "pysecret.aws.kms", preview=False)
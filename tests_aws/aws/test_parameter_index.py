@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+from pysecret.tests import bsm, py_ver, run_cov_test
+from pysecret.aws.parameter_store import (
+    deploy_parameter,
+    delete_parameter,
+    update_parameter_tags,
+)
+from pysecret.aws.parameter_index import ParameterIndex
+
+ssm_client = bsm.ssm_client
+
+path = f"/pysecret-{py_ver}/index"
+param_names = [
+    f"{path}/payments/db",
+    f"{path}/payments/api-key",
+    f"{path}/search/db",
+]
+
+
+def delete_all():
+    for name in param_names:
+        delete_parameter(ssm_client, name)
+
+
+def setup_module(module):
+    delete_all()
+    for name in param_names:
+        deploy_parameter(
+            ssm_client,
+            name=name,
+            data="hello",
+            type_is_string=True,
+            tier_is_standard=True,
+            tags={"team": name.split("/")[-2]},
+        )
+
+
+def teardown_module(module):
+    delete_all()
+
+
+def test():
+    index = ParameterIndex.build(ssm_client, path=path)
+    assert index.names == sorted(param_names)
+    assert index.get(param_names[0]).Tags == {"team": "payments"}
+    assert index.find(prefix=f"{path}/payments/") == sorted(param_names[:2])
+    assert index.find(prefix=f"{path}/", tags={"team": "search"}) == [param_names[2]]
+
+    # nothing changed
+    assert index.refresh(ssm_client) == ([], [])
+
+    # tag only change is detected with refresh_tags
+    update_parameter_tags(ssm_client, param_names[2], {"team": "payments"})
+    index.refresh(ssm_client, refresh_tags=True)
+    assert index.find(tags={"team": "payments"}) == sorted(param_names)
+
+    # value change and deletion
+    deploy_parameter(
+        ssm_client,
+        name=param_names[0],
+        data="world",
+        type_is_string=True,
+        tier_is_standard=True,
+        overwrite=True,
+    )
+    delete_parameter(ssm_client, param_names[1])
+    changed, removed = index.refresh(ssm_client)
+    assert changed == [param_names[0]]
+    assert removed == [param_names[1]]
+    assert index.find(prefix=f"{path}/payments/") == [param_names[0]]
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.parameter_index", preview=False)
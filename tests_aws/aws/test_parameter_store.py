@@ -7,11 +7,19 @@ import dataclasses
 from pysecret.tests import bsm, py_ver, run_cov_test
 from pysecret.aws.parameter_store import (
     ParameterTypeEnum,
+    ParameterTypeCache,
     Parameter,
+    iter_parameters_by_path,
+    iter_parameter_history,
+    ParameterHistory,
     deploy_parameter,
+    ParameterSpec,
+    deploy_parameters,
     delete_parameter,
+    delete_parameters,
     update_parameter_tags,
 )
+from pysecret.aws.bulk import DeployActionEnum
 
 ssm_client = bsm.ssm_client
 
@@ -26,6 +34,12 @@ def delete_all():
         TestParameter.param_name_object,
         TestParameter.param_name_tags,
         TestParameter.param_name_labels,
+        TestParameter.param_name_path_1,
+        TestParameter.param_name_path_2,
+        TestParameter.param_name_bulk_1,
+        TestParameter.param_name_bulk_2,
+        TestParameter.param_name_history,
+        TestParameter.param_name_chunked,
     ]:
         delete_parameter(ssm_client, name)
 
@@ -66,6 +80,12 @@ class TestParameter:
     param_name_object = f"pysecret-{py_ver}-object"
     param_name_tags = f"pysecret-{py_ver}-tags"
     param_name_labels = f"pysecret-{py_ver}-labels"
+    param_name_path_1 = f"/pysecret-{py_ver}/path/param-1"
+    param_name_path_2 = f"/pysecret-{py_ver}/path/sub/param-2"
+    param_name_bulk_1 = f"pysecret-{py_ver}-bulk-1"
+    param_name_bulk_2 = f"pysecret-{py_ver}-bulk-2"
+    param_name_history = f"pysecret-{py_ver}-history"
+    param_name_chunked = f"/pysecret-{py_ver}/chunked"
 
     def test_string(self):
         flag = delete_parameter(ssm_client, self.param_name_string)
@@ -236,6 +256,34 @@ class TestParameter:
         )
         assert param.json_dict == {"name": "Alice"}
 
+        # the type cache remembers the parameter type after the first load
+        type_cache = ParameterTypeCache()
+        param = Parameter.load(
+            ssm_client,
+            self.param_name_secure_string,
+            type_cache=type_cache,
+        )
+        assert param.json_dict == {"name": "Alice"}
+        assert type_cache.n_double_fetch == 1
+        assert type_cache.get(self.param_name_secure_string) == "SecureString"
+
+        param = Parameter.load(
+            ssm_client,
+            self.param_name_secure_string,
+            type_cache=type_cache,
+        )
+        assert param.json_dict == {"name": "Alice"}
+        assert type_cache.n_double_fetch == 1
+
+        type_cache = ParameterTypeCache()
+        type_cache.fill_from_describe_parameters(
+            ssm_client,
+            parameter_filters=[
+                {"Key": "Name", "Values": [self.param_name_secure_string]},
+            ],
+        )
+        assert type_cache.get(self.param_name_secure_string) == "SecureString"
+
     def test_deploy_parameter_skip_duplicate(self):
         # first deployment
         param = deploy_parameter(
@@ -380,6 +428,254 @@ class TestParameter:
         param = Parameter.load(ssm_client, self.param_name_tags, with_tags=True)
         assert param.Tags == {}
 
+    def test_load_many(self):
+        deploy_parameter(
+            ssm_client,
+            name=self.param_name_json_dict,
+            data=DATA,
+            type_is_string=True,
+            tier_is_standard=True,
+            overwrite=True,
+        )
+        deploy_parameter(
+            ssm_client,
+            name=self.param_name_secure_string,
+            data=DATA,
+            type_is_secure_string=True,
+            tier_is_standard=True,
+            overwrite=True,
+        )
+        parameters, invalid_names = Parameter.load_many(
+            ssm_client,
+            [
+                self.param_name_json_dict,
+                self.param_name_secure_string,
+                "pysecret-never-exists",
+            ],
+            with_tags=True,
+        )
+        assert [param.Name for param in parameters] == [
+            self.param_name_json_dict,
+            self.param_name_secure_string,
+        ]
+        assert parameters[0].json_dict == DATA
+        assert parameters[1].json_dict == DATA
+        assert invalid_names == ["pysecret-never-exists"]
+
+        parameters, invalid_names = Parameter.load_many(
+            ssm_client,
+            [self.param_name_json_dict],
+            version=1,
+        )
+        assert parameters[0].Version == 1
+        assert parameters[0].Labels == []
+
+    def test_iter_parameters_by_path(self):
+        for name in [self.param_name_path_1, self.param_name_path_2]:
+            deploy_parameter(
+                ssm_client,
+                name=name,
+                data=STRING,
+                type_is_secure_string=True,
+                tier_is_standard=True,
+                overwrite=True,
+            )
+
+        for prefetch in [False, True]:
+            parameters = list(
+                iter_parameters_by_path(
+                    ssm_client,
+                    path=f"/pysecret-{py_ver}/path",
+                    page_size=1,
+                    prefetch=prefetch,
+                )
+            )
+            assert sorted([param.Name for param in parameters]) == [
+                self.param_name_path_1,
+                self.param_name_path_2,
+            ]
+            assert parameters[0].Value == STRING
+
+        parameters = list(
+            iter_parameters_by_path(
+                ssm_client,
+                path=f"/pysecret-{py_ver}/path",
+                recursive=False,
+            )
+        )
+        assert [param.Name for param in parameters] == [self.param_name_path_1]
+
+    def test_deploy_parameters(self):
+        delete_parameter(ssm_client, self.param_name_bulk_1)
+        delete_parameter(ssm_client, self.param_name_bulk_2)
+
+        specs = [
+            ParameterSpec(
+                name=self.param_name_bulk_1,
+                data=STRING,
+                type_is_string=True,
+                tier_is_standard=True,
+                tags=dict(EnvName="dev"),
+                overwrite=True,
+            ),
+            ParameterSpec(
+                name=self.param_name_bulk_2,
+                data=DATA,
+                type_is_secure_string=True,
+                tier_is_standard=True,
+                overwrite=True,
+            ),
+        ]
+        results = deploy_parameters(ssm_client, specs, dry_run=True)
+        assert [res.action for res in results] == [DeployActionEnum.create] * 2
+        assert Parameter.load(ssm_client, self.param_name_bulk_1) is None
+
+        results = deploy_parameters(ssm_client, specs)
+        assert [res.action for res in results] == [DeployActionEnum.create] * 2
+        assert all([res.is_succeeded for res in results])
+        param = Parameter.load(ssm_client, self.param_name_bulk_1, with_tags=True)
+        assert param.Value == STRING
+        assert param.Tags == dict(EnvName="dev")
+
+        specs[1].data = {"name": "Bob"}
+        results = deploy_parameters(ssm_client, specs)
+        assert [res.action for res in results] == [
+            DeployActionEnum.skip,
+            DeployActionEnum.update,
+        ]
+        assert results[0].resource is None
+        assert results[1].resource.Version == 2
+        param = Parameter.load(ssm_client, self.param_name_bulk_2)
+        assert param.json_dict == {"name": "Bob"}
+
+    def test_parameter_history(self):
+        delete_parameter(ssm_client, self.param_name_history)
+        for i in range(1, 1 + 3):
+            param = deploy_parameter(
+                ssm_client,
+                name=self.param_name_history,
+                data=f"v{i}",
+                type_is_secure_string=True,
+                tier_is_standard=True,
+                overwrite=True,
+            )
+            if i == 2:
+                param.put_label(ssm_client, ["prod"])
+
+        parameters = list(
+            iter_parameter_history(ssm_client, self.param_name_history, page_size=1)
+        )
+        assert [param.Value for param in parameters] == ["v1", "v2", "v3"]
+
+        history = ParameterHistory.load(ssm_client, self.param_name_history)
+        assert history.versions == [1, 2, 3]
+        assert history.labels == {"prod": 2}
+        assert history.latest.Value == "v3"
+        assert history.resolve(f"{self.param_name_history}:prod").Value == "v2"
+        assert history.resolve(f"{self.param_name_history}:1").Value == "v1"
+        assert history.resolve(self.param_name_history).Value == "v3"
+        assert history.resolve("dev") is None
+
+    def test_chunked(self):
+        delete_parameter(ssm_client, self.param_name_chunked, delete_chunks=True)
+        data1 = {f"key_{i}": f"value-{i}-{i * i}" for i in range(2000)}
+        param = deploy_parameter(
+            ssm_client,
+            name=self.param_name_chunked,
+            data=data1,
+            type_is_secure_string=True,
+            tier_is_standard=True,
+            chunked=True,
+        )
+        assert param.Manifest.n_chunks >= 2
+        assert param.json_dict == data1
+
+        param = Parameter.load(ssm_client, self.param_name_chunked)
+        assert param.json_dict == data1
+        assert param.Manifest.n_chunks >= 2
+
+        # skip if the data is the same
+        assert (
+            deploy_parameter(
+                ssm_client,
+                name=self.param_name_chunked,
+                data=data1,
+                type_is_secure_string=True,
+                tier_is_standard=True,
+                chunked=True,
+            )
+            is None
+        )
+
+        # old versions can still be reassembled
+        data2 = {"name": "Alice"}
+        deploy_parameter(
+            ssm_client,
+            name=self.param_name_chunked,
+            data=data2,
+            type_is_secure_string=True,
+            tier_is_standard=True,
+            overwrite=True,
+            chunked=True,
+        )
+        param = Parameter.load(ssm_client, self.param_name_chunked)
+        assert param.json_dict == data2
+        assert param.Manifest is None
+        param = Parameter.load(ssm_client, self.param_name_chunked, version=1)
+        assert param.json_dict == data1
+
+        params, _ = Parameter.load_many(ssm_client, [f"{self.param_name_chunked}:1"])
+        assert params[0].json_dict == data1
+
+        names = [
+            param.Name
+            for param in iter_parameters_by_path(ssm_client, f"/pysecret-{py_ver}")
+        ]
+        assert self.param_name_chunked in names
+        assert not any("__chunk__" in name for name in names)
+
+        assert (
+            delete_parameter(ssm_client, self.param_name_chunked, delete_chunks=True)
+            is True
+        )
+        assert (
+            len(
+                list(
+                    iter_parameters_by_path(
+                        ssm_client, f"{self.param_name_chunked}/__chunk__"
+                    )
+                )
+            )
+            == 0
+        )
+
+    def test_delete_parameters(self):
+        path = f"/pysecret-{py_ver}/delete"
+        names = [f"{path}/param-{i}" for i in range(12)] + [f"{path}/sub/param"]
+        for name in names:
+            deploy_parameter(
+                ssm_client,
+                name=name,
+                data="hello",
+                type_is_string=True,
+                tier_is_standard=True,
+                overwrite=True,
+            )
+
+        deleted, invalid = delete_parameters(
+            ssm_client,
+            [names[0], names[1], f"{path}/not-exists"],
+        )
+        assert deleted == {names[0], names[1]}
+        assert invalid == {f"{path}/not-exists"}
+
+        deleted, invalid = delete_parameters(ssm_client, path=path, recursive=False)
+        assert deleted == set(names[2:-1])
+        assert invalid == set()
+
+        deleted, invalid = delete_parameters(ssm_client, path=path)
+        assert deleted == {names[-1]}
+
     def test_invalid_args(self):
         with pytest.raises(ValueError):
             deploy_parameter(
@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import os
 import pytest
 import time
 
@@ -8,7 +9,17 @@ from pysecret.aws.secret_manager import (
     Secret,
     deploy_secret,
     delete_secret,
+    SecretSpec,
+    deploy_secrets,
+    delete_secrets,
+    get_secret_tags,
+    put_secret_tags,
+    CONTENT_HASH_TAG_KEY,
+    iter_secrets,
+    iter_secret_versions,
+    SecretVersionIndex,
 )
+from pysecret.aws.bulk import DeployActionEnum
 from rich import print as rprint
 
 sm_client = bsm.secretsmanager_client
@@ -19,8 +30,17 @@ def delete_all():
         TestSecret.secret_name_bytes,
         TestSecret.secret_name_string,
         TestSecret.secret_name_json_dict,
+        secret_name_chunked,
+        secret_name_bulk_1,
+        secret_name_bulk_2,
+        secret_name_versions,
     ]:
-        delete_secret(sm_client, name, force_delete_without_recovery=True)
+        delete_secret(
+            sm_client,
+            name,
+            force_delete_without_recovery=True,
+            delete_chunks=True,
+        )
 
 
 def setup_module(module):
@@ -31,6 +51,11 @@ def teardown_module(module):
     delete_all()
 
 
+secret_name_chunked = f"pysecret-{py_ver}-chunked"
+secret_name_bulk_1 = f"pysecret-{py_ver}-bulk-1"
+secret_name_bulk_2 = f"pysecret-{py_ver}-bulk-2"
+secret_name_versions = f"pysecret-{py_ver}-versions"
+
 BINARY = "f7e044fd1b4ca303d479daaf5759f841".encode("utf-8")
 STRING = "attach on 4 AM!"
 DATA = {"name": "Alice"}
@@ -148,6 +173,257 @@ class TestSecret:
         tags = {dct["Key"]: dct["Value"] for dct in response["Tags"]}
         assert tags == dict(EnvName="prod")
 
+        # the data is not changed, tags are not touched
+        secret = deploy_secret(
+            sm_client,
+            name_or_arn=self.secret_name_json_dict,
+            data=new_data,
+            tags=dict(ProjectName="pysecret"),
+        )
+        assert secret is None
+        assert get_secret_tags(sm_client, self.secret_name_json_dict) == dict(
+            EnvName="prod"
+        )
+
+        # tags are merged
+        deploy_secret(
+            sm_client,
+            name_or_arn=self.secret_name_json_dict,
+            data={"name": "Cathy"},
+            tags=dict(ProjectName="pysecret"),
+        )
+        assert get_secret_tags(sm_client, self.secret_name_json_dict) == dict(
+            EnvName="prod", ProjectName="pysecret"
+        )
+
+        # full replacement, even if the data is not changed
+        secret = deploy_secret(
+            sm_client,
+            name_or_arn=self.secret_name_json_dict,
+            data={"name": "Cathy"},
+            tags=dict(ProjectName="pysecret"),
+            replace_tags=True,
+        )
+        assert secret is None
+        assert get_secret_tags(sm_client, self.secret_name_json_dict) == dict(
+            ProjectName="pysecret"
+        )
+
+        # None means don't touch tags
+        deploy_secret(
+            sm_client,
+            name_or_arn=self.secret_name_json_dict,
+            data=DATA,
+        )
+        assert get_secret_tags(sm_client, self.secret_name_json_dict) == dict(
+            ProjectName="pysecret"
+        )
+
+        # empty dict means remove tag
+        put_secret_tags(sm_client, self.secret_name_json_dict, tags={})
+        assert get_secret_tags(sm_client, self.secret_name_json_dict) == {}
+
+
+def test_use_content_hash():
+    name = TestSecret.secret_name_string
+    secret = deploy_secret(
+        sm_client,
+        name_or_arn=name,
+        data="content hash",
+        tags={"ProjectName": "pysecret"},
+        use_content_hash=True,
+    )
+    tags = get_secret_tags(sm_client, name)
+    assert tags[CONTENT_HASH_TAG_KEY] == secret.content_hash
+    assert secret.fingerprint == bytes.fromhex(secret.content_hash)
+    assert tags["ProjectName"] == "pysecret"
+
+    # duplicated, compared by the content hash tag
+    assert (
+        deploy_secret(
+            sm_client,
+            name_or_arn=name,
+            data="content hash",
+            use_content_hash=True,
+        )
+        is None
+    )
+
+    # changed, the content hash tag is updated
+    secret = deploy_secret(
+        sm_client,
+        name_or_arn=name,
+        data="new content hash",
+        use_content_hash=True,
+    )
+    tags = get_secret_tags(sm_client, name)
+    assert tags[CONTENT_HASH_TAG_KEY] == secret.content_hash
+    assert Secret.load(sm_client, name).fingerprint == secret.fingerprint
+
+
+def test_load_many():
+    names = [
+        TestSecret.secret_name_string,
+        TestSecret.secret_name_json_dict,
+        "pysecret-never-exists",
+    ]
+    for name in names[:2]:
+        deploy_secret(sm_client, name_or_arn=name, data=STRING)
+    secrets, errors = Secret.load_many(sm_client, names)
+    assert [secret.Name for secret in secrets] == names[:2]
+    assert secrets[0].string == STRING
+    assert list(errors) == ["pysecret-never-exists"]
+
+    secrets, errors = Secret.load_by_filter(
+        sm_client,
+        filters=[{"Key": "name", "Values": [f"pysecret-{py_ver}-"]}],
+    )
+    assert set(names[:2]).issubset({secret.Name for secret in secrets})
+    assert errors == {}
+
+
+def test_iter_secrets():
+    name = TestSecret.secret_name_string
+    deploy_secret(sm_client, name_or_arn=name, data=STRING)
+    filters = [{"Key": "name", "Values": [name]}]
+
+    lazy_secrets = list(iter_secrets(sm_client, filters=filters))
+    assert [lazy_secret.name for lazy_secret in lazy_secrets] == [name]
+    lazy_secret = lazy_secrets[0]
+    assert lazy_secret.is_loaded is False
+    assert "AWSCURRENT" in lazy_secret.version_stages
+    assert lazy_secret.is_loaded is False
+    assert lazy_secret.secret.string == STRING  # load on first access
+    assert lazy_secret.is_loaded is True
+    assert lazy_secret.load() is lazy_secret.secret
+
+    lazy_secrets = list(iter_secrets(sm_client, filters=filters, include_values=True))
+    assert lazy_secrets[0].is_loaded is True
+    assert lazy_secrets[0].secret.string == STRING
+
+
+def test_chunked():
+    data = os.urandom(100000) + b"-----BEGIN CERTIFICATE-----" * 10000
+    secret = deploy_secret(
+        sm_client,
+        name_or_arn=secret_name_chunked,
+        data=data,
+        chunked=True,
+    )
+    assert secret.is_chunked is True
+    assert secret.Manifest.n_chunks >= 2
+
+    secret = Secret.load(sm_client, secret_name_chunked)
+    assert secret.is_chunked is True
+    assert secret.view == data
+    assert secret.binary == data
+    assert secret.open().read() == data
+
+    # duplicated
+    assert (
+        deploy_secret(
+            sm_client,
+            name_or_arn=secret_name_chunked,
+            data=data,
+            chunked=True,
+        )
+        is None
+    )
+
+    # chunks are not listed
+    secrets, _ = Secret.load_by_filter(
+        sm_client,
+        filters=[{"Key": "name", "Values": [secret_name_chunked]}],
+    )
+    assert [secret.Name for secret in secrets] == [secret_name_chunked]
+    secrets, _ = Secret.load_many(sm_client, [secret_name_chunked])
+    assert secrets[0].binary == data
+
+    # chunks are deleted too
+    assert delete_secret(
+        sm_client,
+        secret_name_chunked,
+        force_delete_without_recovery=True,
+        delete_chunks=True,
+    )
+    secrets, _ = Secret.load_by_filter(
+        sm_client,
+        filters=[{"Key": "name", "Values": [secret_name_chunked]}],
+    )
+    assert len(secrets) == 0
+
+
+def test_deploy_secrets():
+    specs = [
+        SecretSpec(
+            name=secret_name_bulk_1,
+            data="hello",
+            tags=dict(EnvName="dev"),
+        ),
+        SecretSpec(
+            name=secret_name_bulk_2,
+            data={"name": "Alice"},
+            use_content_hash=True,
+        ),
+    ]
+    results = deploy_secrets(sm_client, specs, dry_run=True)
+    assert [res.action for res in results] == [DeployActionEnum.create] * 2
+    assert Secret.load(sm_client, secret_name_bulk_1) is None
+
+    results = deploy_secrets(sm_client, specs)
+    assert [res.action for res in results] == [DeployActionEnum.create] * 2
+    assert all([res.is_succeeded for res in results])
+    assert Secret.load(sm_client, secret_name_bulk_1).string == "hello"
+    assert get_secret_tags(sm_client, secret_name_bulk_1) == dict(EnvName="dev")
+    assert CONTENT_HASH_TAG_KEY in get_secret_tags(sm_client, secret_name_bulk_2)
+
+    specs[0].tags = dict(EnvName="prod")
+    specs[0].replace_tags = True
+    specs[1].data = {"name": "Bob"}
+    results = deploy_secrets(sm_client, specs)
+    assert [res.action for res in results] == [
+        DeployActionEnum.skip,
+        DeployActionEnum.update,
+    ]
+    assert results[0].resource is None
+    assert get_secret_tags(sm_client, secret_name_bulk_1) == dict(EnvName="prod")
+    assert Secret.load(sm_client, secret_name_bulk_2).json_dict == {"name": "Bob"}
+
+    deleted, not_found = delete_secrets(
+        sm_client,
+        [secret_name_bulk_1, secret_name_bulk_2, "pysecret-never-exists"],
+        force_delete_without_recovery=True,
+    )
+    assert deleted == {secret_name_bulk_1, secret_name_bulk_2}
+    assert not_found == {"pysecret-never-exists"}
+
+
+def test_secret_versions():
+    for i in range(1, 1 + 3):
+        deploy_secret(sm_client, name_or_arn=secret_name_versions, data=f"v{i}")
+
+    secret = Secret.load(
+        sm_client,
+        secret_name_versions,
+        version_stage="AWSPREVIOUS",
+    )
+    assert secret.string == "v2"
+
+    versions = list(iter_secret_versions(sm_client, secret_name_versions, page_size=1))
+    assert len(versions) == 2
+    assert {stage for version in versions for stage in version.VersionStages} == {
+        "AWSCURRENT",
+        "AWSPREVIOUS",
+    }
+
+    index = SecretVersionIndex.load(sm_client, secret_name_versions)
+    assert index.name == secret_name_versions
+    assert index.current.load(sm_client).string == "v3"
+    assert index.load_secret(sm_client, "AWSPREVIOUS").string == "v2"
+    assert index.load_secret(sm_client, index.previous.VersionId).string == "v2"
+    assert index.load_secret(sm_client, "not-a-stage") is None
+    assert index.pending is None
+
 
 def test_delete_secret():
     assert delete_secret(sm_client, name_or_arn="pysecret-never-exists") is False
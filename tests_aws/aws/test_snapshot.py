@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+
+from pysecret.tests import bsm, py_ver, dir_tests, run_cov_test
+from pysecret.aws.parameter_store import deploy_parameter, delete_parameter
+from pysecret.aws.secret_manager import deploy_secret, delete_secret
+from pysecret.aws.snapshot import Snapshot
+
+ssm_client = bsm.ssm_client
+sm_client = bsm.secretsmanager_client
+kms_client = bsm.kms_client
+TEST_KMS_KEY_ALIAS = "alias/pysecret_test"
+
+param_name = f"pysecret-{py_ver}-snapshot"
+secret_name = f"pysecret-{py_ver}-snapshot"
+path_snapshot = dir_tests.joinpath("pysecret-snapshot.bin")
+
+
+def delete_all():
+    delete_parameter(ssm_client, param_name)
+    delete_secret(sm_client, secret_name, force_delete_without_recovery=True)
+
+
+def setup_module(module):
+    delete_all()
+    deploy_parameter(
+        ssm_client,
+        name=param_name,
+        data="v1",
+        type_is_secure_string=True,
+        tier_is_standard=True,
+    )
+    deploy_secret(sm_client, name_or_arn=secret_name, data=b"v1")
+
+
+def teardown_module(module):
+    delete_all()
+
+
+def test_snapshot():
+    snapshot = Snapshot(path_snapshot, kms_client, TEST_KMS_KEY_ALIAS, ttl=3600)
+    snapshot.clear()
+    assert snapshot.read() is False
+
+    assert snapshot.get_parameter(ssm_client, param_name).Value == "v1"
+    assert snapshot.get_secret(sm_client, secret_name).SecretBinary == b"v1"
+    snapshot.write()
+
+    # warm start from the snapshot file
+    snapshot = Snapshot(path_snapshot, kms_client, TEST_KMS_KEY_ALIAS, ttl=3600)
+    assert snapshot.read() is True
+    assert len(snapshot.entries) == 2
+    assert snapshot.get_parameter(ssm_client, param_name).Value == "v1"
+
+    # revalidate
+    deploy_parameter(
+        ssm_client,
+        name=param_name,
+        data="v2",
+        type_is_secure_string=True,
+        tier_is_standard=True,
+        overwrite=True,
+    )
+    deploy_secret(sm_client, name_or_arn=secret_name, data=b"v2")
+    thread = snapshot.start_revalidate(ssm_client=ssm_client, sm_client=sm_client)
+    thread.join()
+    assert snapshot.get_parameter(ssm_client, param_name).Value == "v2"
+    assert snapshot.get_secret(sm_client, secret_name).SecretBinary == b"v2"
+
+    # expired
+    snapshot = Snapshot(path_snapshot, kms_client, TEST_KMS_KEY_ALIAS, ttl=0)
+    assert snapshot.read() is True
+    assert len(snapshot.entries) == 0
+
+    snapshot.clear()
+    assert path_snapshot.exists() is False
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.snapshot", preview=False)
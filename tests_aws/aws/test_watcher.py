@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+from pysecret.tests import bsm, py_ver, run_cov_test
+from pysecret.aws.parameter_store import deploy_parameter, delete_parameters
+from pysecret.aws.watcher import ParameterWatcher
+
+ssm_client = bsm.ssm_client
+
+path = f"/pysecret-{py_ver}/watcher"
+param_names = [f"{path}/param-{i}" for i in range(3)]
+
+
+def delete_all():
+    delete_parameters(ssm_client, path=path)
+
+
+def setup_module(module):
+    delete_all()
+    for name in param_names:
+        deploy_parameter(
+            ssm_client,
+            name=name,
+            data="v1",
+            type_is_secure_string=True,
+            tier_is_standard=True,
+        )
+
+
+def teardown_module(module):
+    delete_all()
+
+
+def test():
+    events = list()
+    watcher = ParameterWatcher(ssm_client, path=path)
+    watcher.subscribe(lambda name, old, new: events.append((name, old, new)))
+
+    # first poll loads everything
+    assert sorted(watcher.poll_once()) == param_names
+    assert [old for _, old, _ in events] == [None, None, None]
+    assert watcher.get(param_names[0]).Value == "v1"
+
+    # nothing changed
+    events.clear()
+    assert watcher.poll_once() == []
+    assert events == []
+
+    # update and delete
+    deploy_parameter(
+        ssm_client,
+        name=param_names[0],
+        data="v2",
+        type_is_secure_string=True,
+        tier_is_standard=True,
+        overwrite=True,
+    )
+    delete_parameters(ssm_client, [param_names[1]])
+    assert sorted(watcher.poll_once()) == param_names[:2]
+    assert watcher.get(param_names[0]).Value == "v2"
+    assert watcher.get(param_names[1]) is None
+    assert sorted(name for name, _, _ in events) == param_names[:2]
+    assert watcher.reloads == 4
+
+
+if __name__ == "__main__":
+    run_cov_test(__file__, "pysecret.aws.watcher", preview=False)